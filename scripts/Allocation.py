@@ -0,0 +1,218 @@
+from datetime import date, timedelta
+from Roomstate import RoomState
+from Roomtype import HotelRoomType
+
+class Party:
+    """Python class to implement one party of a group booking.
+
+    Syntax
+    ------
+    obj = Party(guest_name, room_type, max_price)
+
+    Parameters
+    ----------
+    [in] guest_name : str
+        The name the room is booked under.
+    [in] room_type : HotelRoomType
+        The type of room the party needs.
+    [in] max_price : float
+        Highest accepted price per night. No limit if omitted.
+
+    Returns
+    -------
+    obj : Party
+        Python object output parameter that represents an instance of the class Party.
+
+    Attributes
+    ----------
+    guest_name : str
+        The name the room is booked under.
+    room_type : HotelRoomType
+        The type of room the party needs.
+    max_price : float
+        Highest accepted price per night, None for no limit.
+    """
+
+    __slots__ = ("guest_name", "room_type", "max_price")
+
+    def __init__(self, guest_name: str, room_type: HotelRoomType, max_price: float = None):
+        self.guest_name = guest_name
+        self.room_type = HotelRoomType(room_type)
+        self.max_price = max_price
+
+def _cap(party: Party) -> float:
+    return float("inf") if party.max_price is None else party.max_price
+
+def _match(parties: list, rooms: list):
+    """Pair parties with rooms, cheapest room to the tightest budget.
+
+    Both lists must be sorted, parties by max_price and rooms by price. If the i-th cheapest
+    room is above the i-th smallest budget, those i parties have fewer than i rooms within
+    budget, so no assignment exists; otherwise this is the cheapest one.
+    """
+    for party, room in zip(parties, rooms):
+        if room.room_price > _cap(party):
+            return None
+    return list(zip(parties, rooms))
+
+def _by_cost(parties: list, candidates: list):
+    parties = sorted(parties, key=_cap)
+    rooms = sorted(candidates, key=lambda room: room.room_price)[:len(parties)]
+    return _match(parties, rooms)
+
+def _by_adjacency(parties: list, candidates: list):
+    """Pick the run of free rooms with the narrowest number span, then the lowest cost."""
+    count = len(parties)
+    rooms = sorted(candidates, key=lambda room: room.room_number)
+    prices = [0.0]
+    for room in rooms:
+        prices.append(prices[-1] + room.room_price)
+    windows = sorted(range(len(rooms) - count + 1),
+                     key=lambda i: (rooms[i + count - 1].room_number - rooms[i].room_number, prices[i + count] - prices[i]))
+    parties = sorted(parties, key=_cap)
+    for i in windows:
+        matched = _match(parties, sorted(rooms[i:i + count], key=lambda room: room.room_price))
+        if matched is not None:
+            return matched
+    return None
+
+def allocate_group(hotel, parties: list, arrival: date = None, departure: date = None, prefer: str = "cost") -> list:
+    """Assign rooms to every party of a group in one pass, all or nothing.
+
+    Parties are grouped by room type and each group is matched against the rooms of its
+    type that are free for the whole stay. With prefer="cost" the cheapest rooms are taken;
+    with prefer="adjacent" the rooms come from the run of free rooms with the narrowest span
+    of room numbers. Budgets are honoured either way.
+
+    Every assignment is booked before anyone is checked in, all in one transaction. If any
+    booking fails, e.g. a concurrent check-in took a room, the transaction is rolled back:
+    nothing is booked or checked in and listeners see no event.
+
+    Parameters
+    ----------
+    hotel : Hotel
+        The hotel to allocate rooms in.
+    parties : list
+        The Party instances of the group.
+    arrival : date, optional
+        First night of the stay. If omitted, the group is checked in today.
+    departure : date, optional
+        Day the group leaves. Defaults to the day after arrival.
+    prefer : str, optional
+        "cost" or "adjacent". Defaults to "cost".
+
+    Returns
+    -------
+    list
+        The Reservation of every party, in the order of parties.
+
+    Raises
+    ------
+    ValueError
+        If the rooms free in that period cannot satisfy every party.
+    """
+    if prefer not in ("cost", "adjacent"):
+        raise ValueError(f"Unknown allocation preference: {prefer}")
+    check_in = arrival is None
+    arrival = arrival or date.today()
+    departure = departure or arrival + timedelta(days=1)
+    solve = _by_cost if prefer == "cost" else _by_adjacency
+
+    groups = {}
+    for party in parties:
+        groups.setdefault(party.room_type, []).append(party)
+    assigned = {}
+    for room_type, group in groups.items():
+        candidates = hotel.free_rooms(room_type, arrival, departure)
+        if check_in:
+            candidates = [room for room in candidates if room.room_state.can_transition(RoomState.OCUPADA)]
+        matched = solve(group, candidates) if len(candidates) >= len(group) else None
+        if matched is None:
+            raise ValueError(f"Not enough {room_type.value} rooms for {len(group)} parties within budget.")
+        for party, room in matched:
+            assigned[id(party)] = room.room_number
+
+    reservations = []
+    with hotel.transaction():
+        for party in parties:
+            reservation = hotel.reserve(assigned[id(party)], party.guest_name, arrival, departure)
+            if reservation is None:
+                raise ValueError(f"Room {assigned[id(party)]} was taken during the allocation.")
+            reservations.append(reservation)
+        if check_in:
+            for reservation in reservations:
+                hotel.check_in(reservation.room_number, reservation.guest_name, departure, arrival)
+    return reservations
+
+
+def main():
+    # TESTING
+    from time import perf_counter
+    from Hotel import Hotel
+    from Room import Room
+
+    monday = date(2030, 1, 7)
+    hotel = Hotel("Grand Hotel")
+    for number, price in ((101, 120), (102, 80), (103, 100), (110, 60), (111, 70), (201, 300)):
+        hotel.add_room(Room(HotelRoomType.DOBLE if number < 200 else HotelRoomType.SUITE, number, "Desocupada", price))
+
+    print("=================================================================")
+    print("Test Case 1: Cheapest Allocation within Budgets.")
+    print("=================================================================")
+    parties = [Party("Alice", HotelRoomType.DOBLE), Party("Bob", HotelRoomType.DOBLE, 65),
+               Party("Carol", HotelRoomType.SUITE, 400)]
+    reservations = allocate_group(hotel, parties, monday, monday + timedelta(days=2))
+
+    if ([reservation.room_number for reservation in reservations] == [111, 110, 201]
+            and all(reservation.status == "Confirmada" for reservation in reservations)):
+        print("Test PASS. Every party gets the cheapest room within its budget.")
+    else:
+        print("Test FAIL. Check the function allocate_group() with prefer='cost'.")
+
+    print("=================================================================")
+    print("Test Case 2: Adjacent Allocation and Check-In.")
+    print("=================================================================")
+    reservations = allocate_group(hotel, [Party("Dave", HotelRoomType.DOBLE), Party("Erin", HotelRoomType.DOBLE)],
+                                  prefer="adjacent")
+
+    if (sorted(reservation.room_number for reservation in reservations) == [110, 111]
+            and hotel.find_room(110).is_occupied() and hotel.find_room(111).is_occupied()):
+        print("Test PASS. The group is checked in to neighbouring rooms.")
+    else:
+        print("Test FAIL. Check the function allocate_group() with prefer='adjacent'.")
+
+    print("=================================================================")
+    print("Test Case 3: All or Nothing.")
+    print("=================================================================")
+    booked = len(hotel.bookings)
+    try:
+        allocate_group(hotel, [Party("Frank", HotelRoomType.DOBLE), Party("Grace", HotelRoomType.SUITE)],
+                       monday, monday + timedelta(days=1))
+        print("Test FAIL. Check the function allocate_group() when a type runs out.")
+    except ValueError:
+        if len(hotel.bookings) == booked:
+            print("Test PASS. Nothing is booked when a party cannot be served.")
+        else:
+            print("Test FAIL. Check the function allocate_group() for partial bookings.")
+
+    print("=================================================================")
+    print("Test Case 4: Allocate a 2,000-Guest Block.")
+    print("=================================================================")
+    hotel = Hotel("Conference Hotel")
+    hotel.add_rooms(Room(HotelRoomType("Individual" if number % 2 else "Doble"), number, "Desocupada",
+                         50.0 + number % 97) for number in range(10000))
+    parties = [Party(f"Guest {guest}", HotelRoomType("Individual" if guest % 2 else "Doble"), 60 + guest % 90)
+               for guest in range(2000)]
+    start = perf_counter()
+    reservations = allocate_group(hotel, parties, monday, monday + timedelta(days=3))
+    elapsed = perf_counter() - start
+
+    if (len({reservation.room_number for reservation in reservations}) == 2000
+            and all(hotel.find_room(reservation.room_number).room_price <= party.max_price
+                    for party, reservation in zip(parties, reservations))):
+        print(f"Test PASS. Allocated 2,000 guests in {elapsed * 1000:.1f} ms.")
+    else:
+        print("Test FAIL. Check the function allocate_group() at scale.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+from array import array
+from datetime import date, timedelta
+from itertools import accumulate, compress
+from Inventory import RoomColumns, ROOM_TYPES, TYPE_CODES, OCCUPIED
+from Reservation import ReservationBook
+from Roomtype import HotelRoomType
+
+def occupancy_rate(columns: RoomColumns) -> float:
+    """Get the fraction of rooms currently occupied.
+
+    Parameters
+    ----------
+    columns : RoomColumns
+        Snapshot of the room inventory.
+
+    Returns
+    -------
+    float
+        Occupied rooms divided by total rooms, 0.0 for an empty inventory.
+    """
+    if not len(columns):
+        return 0.0
+    return columns.room_state.count(OCCUPIED) / len(columns)
+
+def revenue_by_type(columns: RoomColumns) -> dict:
+    """Get tonight's room revenue per room type.
+
+    Parameters
+    ----------
+    columns : RoomColumns
+        Snapshot of the room inventory.
+
+    Returns
+    -------
+    dict
+        Dictionary mapping every HotelRoomType to the summed price of its occupied rooms.
+    """
+    totals = [0.0] * len(ROOM_TYPES)
+    occupied = [state == OCCUPIED for state in columns.room_state]
+    for code, price in zip(compress(columns.room_type, occupied), compress(columns.room_price, occupied)):
+        totals[code] += price
+    return dict(zip(ROOM_TYPES, totals))
+
+def average_daily_rate(columns: RoomColumns) -> float:
+    """Get the ADR, the average price of the occupied rooms.
+
+    Parameters
+    ----------
+    columns : RoomColumns
+        Snapshot of the room inventory.
+
+    Returns
+    -------
+    float
+        Room revenue divided by rooms sold, 0.0 if no room is sold.
+    """
+    sold = columns.room_state.count(OCCUPIED)
+    if not sold:
+        return 0.0
+    return sum(compress(columns.room_price, [state == OCCUPIED for state in columns.room_state])) / sold
+
+def revpar(columns: RoomColumns) -> float:
+    """Get the RevPAR, the room revenue per available room.
+
+    Parameters
+    ----------
+    columns : RoomColumns
+        Snapshot of the room inventory.
+
+    Returns
+    -------
+    float
+        Room revenue divided by total rooms, 0.0 for an empty inventory.
+    """
+    return average_daily_rate(columns) * occupancy_rate(columns)
+
+def price_histogram(columns: RoomColumns, bins: int = 10, room_type: HotelRoomType = None) -> tuple:
+    """Count the room prices in equal-width bins.
+
+    Parameters
+    ----------
+    columns : RoomColumns
+        Snapshot of the room inventory.
+    bins : int, optional
+        Number of bins. Defaults to 10.
+    room_type : HotelRoomType, optional
+        Restrict the histogram to one room type. All types are counted if omitted.
+
+    Returns
+    -------
+    tuple
+        (counts, edges), where counts has bins items and edges has bins + 1 items.
+    """
+    prices = columns.room_price
+    if room_type is not None:
+        code = TYPE_CODES[HotelRoomType(room_type)]
+        prices = array("d", compress(prices, [item == code for item in columns.room_type]))
+    if not prices:
+        return [0] * bins, [0.0] * (bins + 1)
+    low, high = min(prices), max(prices)
+    width = (high - low) / bins or 1.0
+    edges = [low + width * index for index in range(bins)] + [high]
+    counts = [0] * bins
+    last = bins - 1
+    for price in prices:
+        index = int((price - low) / width)
+        counts[index if index < last else last] += 1
+    return counts, edges
+
+def nightly_report(columns: RoomColumns, bookings: ReservationBook, start: date, end: date) -> dict:
+    """Compute occupancy, ADR and RevPAR for every night of a period.
+
+    Each stay adds to a difference array at its first and past-the-last night, and a
+    running sum turns those into per-night totals. The cost depends on the number of
+    stays and nights, not on the number of room-nights they cover.
+
+    Parameters
+    ----------
+    columns : RoomColumns
+        Snapshot of the room inventory, used for capacity and prices.
+    bookings : ReservationBook
+        Reservation engine holding the stays.
+    start : date
+        First night of the period.
+    end : date
+        Day after the last night of the period.
+
+    Returns
+    -------
+    dict
+        Columns "night", "rooms_sold", "revenue", "occupancy", "adr" and "revpar",
+        one item per night.
+    """
+    nights = max((end - start).days, 0)
+    capacity = len(columns)
+    prices = dict(zip(columns.room_number, columns.room_price))
+    sold = [0] * (nights + 1)
+    revenue = [0.0] * (nights + 1)
+    for stay in bookings:
+        price = prices.get(stay.room_number)
+        if price is None or stay.status == "Cancelada":
+            continue
+        first = max((stay.arrival - start).days, 0)
+        last = min((stay.departure - start).days, nights)
+        if first < last:
+            sold[first] += 1
+            sold[last] -= 1
+            revenue[first] += price
+            revenue[last] -= price
+    sold = array("q", accumulate(sold[:nights]))
+    revenue = array("d", accumulate(revenue[:nights]))
+    return {
+        "night": [start + timedelta(days=index) for index in range(nights)],
+        "rooms_sold": sold,
+        "revenue": revenue,
+        "occupancy": array("d", [count / capacity if capacity else 0.0 for count in sold]),
+        "adr": array("d", [total / count if count else 0.0 for total, count in zip(revenue, sold)]),
+        "revpar": array("d", [total / capacity if capacity else 0.0 for total in revenue]),
+    }
+
+
+def main():
+    # TESTING
+    from Room import Room
+    from time import perf_counter
+
+    print("=================================================================")
+    print("Test Case 1: Occupancy, ADR and RevPAR.")
+    print("=================================================================")
+    rooms = [Room(HotelRoomType.INDIVIDUAL, 101, "Ocupada", 80),
+             Room(HotelRoomType.DOBLE, 102, "Desocupada", 150),
+             Room(HotelRoomType.SUITE, 103, "Ocupada", 300),
+             Room(HotelRoomType.SUITE, 104, "Desocupada", 320)]
+    columns = RoomColumns.from_rooms(rooms)
+
+    if occupancy_rate(columns) == 0.5 and average_daily_rate(columns) == 190 and revpar(columns) == 95:
+        print("Test PASS. Occupancy, ADR and RevPAR are correct.")
+    else:
+        print("Test FAIL. Check the functions occupancy_rate(), average_daily_rate() and revpar().")
+
+    print("=================================================================")
+    print("Test Case 2: Revenue by Room Type and Price Histogram.")
+    print("=================================================================")
+    revenue = revenue_by_type(columns)
+    counts, edges = price_histogram(columns, bins=4)
+    suite_counts, _ = price_histogram(columns, bins=2, room_type=HotelRoomType.SUITE)
+
+    if (revenue == {HotelRoomType.INDIVIDUAL: 80, HotelRoomType.DOBLE: 0, HotelRoomType.SUITE: 300}
+            and counts == [1, 1, 0, 2] and edges[0] == 80 and edges[-1] == 320 and suite_counts == [1, 1]):
+        print("Test PASS. Revenue by type and histogram are correct.")
+    else:
+        print("Test FAIL. Check the functions revenue_by_type() and price_histogram().")
+
+    print("=================================================================")
+    print("Test Case 3: Nightly Report from Reservations.")
+    print("=================================================================")
+    today = date.today()
+    day = timedelta(days=1)
+    bookings = ReservationBook()
+    bookings.book(101, "Alice", today, today + 2 * day)
+    bookings.book(103, "Bob", today + day, today + 3 * day)
+    bookings.cancel(bookings.book(104, "Carol", today, today + 3 * day).reservation_id)
+    report = nightly_report(columns, bookings, today, today + 3 * day)
+
+    if (list(report["rooms_sold"]) == [1, 2, 1] and list(report["revenue"]) == [80, 380, 300]
+            and list(report["occupancy"]) == [0.25, 0.5, 0.25] and list(report["adr"]) == [80, 190, 300]):
+        print("Test PASS. The nightly report is correct.")
+    else:
+        print("Test FAIL. Check the function nightly_report().")
+
+    print("=================================================================")
+    print("Test Case 4: Report over a Million Rooms.")
+    print("=================================================================")
+    columns = RoomColumns()
+    columns.room_number = array("q", range(1000000))
+    columns.room_type = array("b", [index % 3 for index in range(1000000)])
+    columns.room_state = array("b", [index % 2 for index in range(1000000)])
+    columns.room_price = array("d", [50.0 + index % 500 for index in range(1000000)])
+    start = perf_counter()
+    occupancy_rate(columns)
+    revenue_by_type(columns)
+    price_histogram(columns)
+    elapsed = perf_counter() - start
+
+    if elapsed < 1.0:
+        print(f"Test PASS. Reports over 1,000,000 rooms took {elapsed:.3f} s.")
+    else:
+        print(f"Test FAIL. Reports over 1,000,000 rooms took {elapsed:.3f} s.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+import json
+import shlex
+from time import perf_counter
+from Commands import execute
+
+def parse_line(line: str):
+    """Parse one line of a batch into a command.
+
+    A line is either a JSON object, as accepted by Commands.execute(), or a script
+    command: the operation followed by key=value arguments, quoted like a shell command.
+    Blank lines and lines starting with # are skipped.
+
+    Parameters
+    ----------
+    line : str
+        The line to parse, e.g. 'check_in room_number=101 guest_name="Alice Smith"'.
+
+    Returns
+    -------
+    dict or None
+        The command, None for blank and comment lines.
+
+    Raises
+    ------
+    ValueError
+        If the line is not valid JSON or an argument has no value.
+    """
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+    if line.startswith("{"):
+        command = json.loads(line)
+        if not isinstance(command, dict):
+            raise ValueError("A command must be a JSON object.")
+        return command
+    words = shlex.split(line)
+    command = {"op": words[0]}
+    for word in words[1:]:
+        key, separator, value = word.partition("=")
+        if not separator:
+            raise ValueError(f"Argument without value: {word}")
+        command[key] = value
+    return command
+
+def run_batch(hotel, lines, output=None, stop_on_error: bool = False) -> dict:
+    """Run a stream of commands against a hotel.
+
+    Parameters
+    ----------
+    hotel : Hotel
+        The hotel the commands are applied to.
+    lines : iterable
+        Lines of JSON objects or script commands, e.g. an open file.
+    output : file, optional
+        Where to write one JSON result per command, with its line number. Nothing is
+        written if omitted.
+    stop_on_error : bool, optional
+        Stop at the first command that fails. Defaults to False.
+
+    Returns
+    -------
+    dict
+        Summary with the number of commands run and failed, and the elapsed seconds.
+    """
+    dumps = json.dumps
+    write = output.write if output is not None else None
+    executed = failed = 0
+    start = perf_counter()
+    for number, line in enumerate(lines, 1):
+        try:
+            command = parse_line(line)
+        except ValueError as error:
+            response = {"ok": False, "error": str(error)}
+        else:
+            if command is None:
+                continue
+            response = execute(hotel, command)
+        executed += 1
+        if not response["ok"]:
+            failed += 1
+        if write is not None:
+            response["line"] = number
+            write(dumps(response) + "\n")
+        if stop_on_error and not response["ok"]:
+            break
+    elapsed = perf_counter() - start
+    return {"executed": executed, "failed": failed, "seconds": elapsed,
+            "per_second": executed / elapsed if elapsed else 0.0}
+
+
+def main():
+    # TESTING
+    import io
+    from Hotel import Hotel
+
+    print("=================================================================")
+    print("Test Case 1: Run a Mixed Script.")
+    print("=================================================================")
+    script = io.StringIO("\n".join([
+        "# Morning shift",
+        'add_room room_type=Suite room_number=101 room_price=300',
+        '{"op": "add_employee", "emp_id": 1, "name": "John Doe", "position": "Receptionist", "salary": 30000}',
+        'check_in room_number=101 guest_name="Alice Smith"',
+        "update_employee emp_id=1 salary=35000",
+        "check_out room_number=7",
+        "check_in room_number",
+        "",
+        "check_out room_number=101",
+    ]))
+    hotel = Hotel("Grand Hotel")
+    output = io.StringIO()
+    summary = run_batch(hotel, script, output)
+    results = [json.loads(line) for line in output.getvalue().splitlines()]
+
+    if (summary["executed"] == 7 and summary["failed"] == 2
+            and results[2] == {"ok": True, "result": "Check-in successful for Alice Smith in room 101.", "line": 4}
+            and results[4] == {"ok": False, "error": "No guest found in the specified room.", "line": 6}
+            and results[5]["line"] == 7 and not results[5]["ok"]
+            and hotel.find_employee(1).get_salary() == 35000 and not hotel.find_room(101).is_occupied()):
+        print("Test PASS. Script and JSON commands have been run in order.")
+    else:
+        print("Test FAIL. Check the functions parse_line() and run_batch().")
+
+    print("=================================================================")
+    print("Test Case 2: Replay a Day of Traffic.")
+    print("=================================================================")
+    lines = [f'{{"op": "add_room", "room_type": "Doble", "room_number": {number}, "room_price": 100}}'
+             for number in range(10000)]
+    for turn in range(10):
+        lines += [f'{{"op": "check_in", "room_number": {number}, "guest_name": "Guest {turn}"}}' for number in range(10000)]
+        lines += [f'{{"op": "find_room", "room_number": {number}}}' for number in range(10000)]
+        lines += [f'{{"op": "check_out", "room_number": {number}}}' for number in range(10000)]
+    summary = run_batch(Hotel("Load Hotel"), lines)
+
+    if summary["executed"] == 310000 and summary["failed"] == 0:
+        print(f"Test PASS. Replayed {summary['executed']:,} commands at {summary['per_second']:,.0f} commands/s.")
+    else:
+        print("Test FAIL. Check the function run_batch() at scale.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,388 @@
+import csv
+import json
+import os
+from datetime import date
+from Employee import Employee
+from Reservation import Reservation
+from Room import Room
+from Roomstate import RoomState
+from Roomtype import HotelRoomType
+
+ROOM_FIELDS = ["room_number", "room_type", "room_state", "room_price"]
+EMPLOYEE_FIELDS = ["emp_id", "name", "position", "salary"]
+RESERVATION_FIELDS = ["reservation_id", "room_number", "guest_name", "arrival", "departure", "status"]
+
+class LoadReport:
+    """Python class to implement the outcome of a bulk load.
+
+    Syntax
+    ------
+    obj = LoadReport(max_errors)
+
+    Parameters
+    ----------
+    [in] max_errors : int
+        Number of row errors kept in errors. Later errors are only counted.
+
+    Returns
+    -------
+    obj : LoadReport
+        Python object output parameter that represents an instance of the class LoadReport.
+
+    Attributes
+    ----------
+    loaded : int
+        Number of rows applied to the hotel.
+    failed : int
+        Number of rows rejected.
+    skipped : int
+        Number of valid rows intentionally not applied, such as past reservations.
+    errors : list
+        (line number, message) pairs for the first max_errors rejected rows.
+    """
+
+    def __init__(self, max_errors: int = 1000):
+        self.loaded = 0
+        self.failed = 0
+        self.skipped = 0
+        self.errors = []
+        self._max_errors = max_errors
+
+    def add_error(self, line: int, message: str):
+        """Record a rejected row.
+
+        Parameters
+        ----------
+        line : int
+            Line number of the row in the source, counting the CSV header as line 1.
+        message : str
+            Reason the row was rejected.
+        """
+        self.failed += 1
+        if len(self.errors) < self._max_errors:
+            self.errors.append((line, message))
+
+
+def _format(path: str, fmt: str) -> str:
+    fmt = fmt or os.path.splitext(path)[1].lstrip(".").lower()
+    if fmt not in ("csv", "jsonl"):
+        raise ValueError(f"Unsupported format: {fmt!r}. Use 'csv' or 'jsonl'.")
+    return fmt
+
+def _read_rows(path: str, fmt: str):
+    """Yield (line number, dict) for every row of a CSV or JSONL file, one row at a time."""
+    with open(path, newline="", encoding="utf-8") as file:
+        if fmt == "csv":
+            reader = csv.reader(file)
+            header = next(reader, [])
+            for row in reader:
+                if row:
+                    yield reader.line_num, dict(zip(header, row))
+        else:
+            for line_number, line in enumerate(file, 1):
+                if line.strip():
+                    try:
+                        row = json.loads(line)
+                    except ValueError:
+                        row = None
+                    yield line_number, row if isinstance(row, dict) else "Invalid JSON object."
+
+def _write_rows(path: str, fmt: str, fields: list, rows):
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        if fmt == "csv":
+            writer = csv.writer(file)
+            writer.writerow(fields)
+            writer.writerows(rows)
+        else:
+            dumps = json.dumps
+            file.writelines(dumps(dict(zip(fields, row))) + "\n" for row in rows)
+
+def _load(path: str, fmt: str, parse, apply, batch_size: int, max_errors: int) -> LoadReport:
+    report = LoadReport(max_errors)
+    batch = []
+    for line, row in _read_rows(path, _format(path, fmt)):
+        if isinstance(row, str):
+            report.add_error(line, row)
+            continue
+        try:
+            batch.append((line, parse(row)))
+        except KeyError as error:
+            report.add_error(line, f"Missing field: {error.args[0]}")
+        except (TypeError, ValueError) as error:
+            report.add_error(line, str(error))
+        if len(batch) >= batch_size:
+            apply(batch, report)
+            batch = []
+    if batch:
+        apply(batch, report)
+    return report
+
+def _parse_room(row: dict) -> Room:
+    room_price = float(row["room_price"])
+    if room_price < 0:
+        raise ValueError(f"Invalid room_price: {room_price}")
+    return Room(HotelRoomType(row["room_type"]), int(row["room_number"]),
+                RoomState(row.get("room_state") or RoomState.DESOCUPADA), room_price)
+
+def _parse_employee(row: dict) -> Employee:
+    return Employee(int(row["emp_id"]), row["name"], row["position"], float(row["salary"]))
+
+def _parse_reservation(row: dict) -> Reservation:
+    status = row.get("status") or "Confirmada"
+    if status not in ("Confirmada", "En curso", "Desplazada"):
+        return None
+    reservation_id = row.get("reservation_id")
+    return Reservation(int(reservation_id) if reservation_id not in (None, "") else None, int(row["room_number"]),
+                       row["guest_name"], date.fromisoformat(row["arrival"]), date.fromisoformat(row["departure"]),
+                       status)
+
+def _load_reservation(hotel, reservation: Reservation):
+    room_number = reservation.room_number
+    if reservation.reservation_id is None:
+        if hotel.reserve(room_number, reservation.guest_name, reservation.arrival, reservation.departure) is None:
+            return f"Room {room_number} not found or not free in that period."
+        return None
+    if hotel.find_room(room_number) is None:
+        return f"Room {room_number} not found."
+    if hotel.bookings.get(reservation.reservation_id) is not None:
+        return f"Reservation {reservation.reservation_id} already loaded."
+    if reservation.departure <= reservation.arrival or (reservation.status == "En curso"
+                                                        and hotel.current_stay(room_number) is not None):
+        return f"Room {room_number} not free in that period."
+    try:
+        hotel.restore_reservation(reservation)
+    except ValueError as error:
+        return str(error)
+    return None
+
+def load_rooms(hotel, path: str, fmt: str = None, batch_size: int = 10000, max_errors: int = 1000) -> LoadReport:
+    """Stream rooms from a CSV or JSONL file into a hotel.
+
+    Rows are validated one at a time and inserted in batches with Hotel.add_rooms(),
+    so memory use is bounded by batch_size whatever the file size. Invalid rows, and rows
+    that would replace a room with stays, are reported and skipped.
+
+    Parameters
+    ----------
+    hotel : Hotel
+        The hotel the rooms are added to.
+    path : str
+        Path of the file, with fields room_number, room_type, room_price and optionally room_state.
+    fmt : str, optional
+        "csv" or "jsonl". Taken from the file extension if omitted.
+    batch_size : int, optional
+        Number of rooms inserted at once. Defaults to 10000.
+    max_errors : int, optional
+        Number of row errors kept in the report. Defaults to 1000.
+
+    Returns
+    -------
+    LoadReport
+        Counts of loaded and rejected rows, with the first errors.
+    """
+    def apply(batch, report):
+        rooms = []
+        for line, room in batch:
+            if hotel.bookings.has_stays(room.room_number) and hotel.find_room(room.room_number) is not None:
+                report.add_error(line, f"Room {room.room_number} has stays and cannot be replaced.")
+            else:
+                rooms.append(room)
+        report.loaded += hotel.add_rooms(rooms)
+    return _load(path, fmt, _parse_room, apply, batch_size, max_errors)
+
+def load_employees(hotel, path: str, fmt: str = None, batch_size: int = 10000, max_errors: int = 1000) -> LoadReport:
+    """Stream employees from a CSV or JSONL file into a hotel.
+
+    Parameters
+    ----------
+    hotel : Hotel
+        The hotel the employees are added to.
+    path : str
+        Path of the file, with fields emp_id, name, position and salary.
+    fmt : str, optional
+        "csv" or "jsonl". Taken from the file extension if omitted.
+    batch_size : int, optional
+        Number of employees inserted at once. Defaults to 10000.
+    max_errors : int, optional
+        Number of row errors kept in the report. Defaults to 1000.
+
+    Returns
+    -------
+    LoadReport
+        Counts of loaded and rejected rows, with the first errors.
+    """
+    def apply(batch, report):
+        for _, employee in batch:
+            hotel.add_employee(employee)
+        report.loaded += len(batch)
+    return _load(path, fmt, _parse_employee, apply, batch_size, max_errors)
+
+def load_reservations(hotel, path: str, fmt: str = None, batch_size: int = 10000,
+                      max_errors: int = 1000) -> LoadReport:
+    """Stream reservations from a CSV or JSONL file into a hotel.
+
+    Rows with a reservation_id, as written by export_reservations(), are loaded with
+    Hotel.restore_reservation(), keeping their ID and status, so a stay "En curso" is
+    the current stay of its room again; like SQLiteStorage.load(), this does not notify
+    listeners. Rows without one are booked with Hotel.reserve(). Rows whose room does not
+    exist, whose ID is taken or whose room is already booked in that period are reported
+    and skipped. Rows with a status other than "Confirmada", "En curso" or "Desplazada",
+    i.e. past stays, are counted as skipped.
+
+    Parameters
+    ----------
+    hotel : Hotel
+        The hotel the reservations are booked in.
+    path : str
+        Path of the file, with fields room_number, guest_name, arrival and departure (ISO dates).
+    fmt : str, optional
+        "csv" or "jsonl". Taken from the file extension if omitted.
+    batch_size : int, optional
+        Number of reservations booked at once. Defaults to 10000.
+    max_errors : int, optional
+        Number of row errors kept in the report. Defaults to 1000.
+
+    Returns
+    -------
+    LoadReport
+        Counts of loaded and rejected rows, with the first errors.
+    """
+    def apply(batch, report):
+        for line, parsed in batch:
+            if parsed is None:
+                report.skipped += 1
+                continue
+            error = _load_reservation(hotel, parsed)
+            if error is not None:
+                report.add_error(line, error)
+            else:
+                report.loaded += 1
+    return _load(path, fmt, _parse_reservation, apply, batch_size, max_errors)
+
+def export_rooms(hotel, path: str, fmt: str = None):
+    """Write the rooms of a hotel to a CSV or JSONL file.
+
+    Parameters
+    ----------
+    hotel : Hotel
+        The hotel to export.
+    path : str
+        Path of the file to write.
+    fmt : str, optional
+        "csv" or "jsonl". Taken from the file extension if omitted.
+    """
+    _write_rows(path, _format(path, fmt), ROOM_FIELDS,
+                ((room.room_number, HotelRoomType(room.room_type).value, room.room_state.value, room.room_price)
+                 for room in hotel.rooms))
+
+def export_employees(hotel, path: str, fmt: str = None):
+    """Write the employees of a hotel to a CSV or JSONL file.
+
+    Parameters
+    ----------
+    hotel : Hotel
+        The hotel to export.
+    path : str
+        Path of the file to write.
+    fmt : str, optional
+        "csv" or "jsonl". Taken from the file extension if omitted.
+    """
+    _write_rows(path, _format(path, fmt), EMPLOYEE_FIELDS,
+                ((employee.get_emp_id(), employee.get_name(), employee.get_position(), employee.get_salary())
+                 for employee in hotel.employees))
+
+def export_reservations(hotel, path: str, fmt: str = None):
+    """Write the reservations of a hotel to a CSV or JSONL file.
+
+    Parameters
+    ----------
+    hotel : Hotel
+        The hotel to export.
+    path : str
+        Path of the file to write.
+    fmt : str, optional
+        "csv" or "jsonl". Taken from the file extension if omitted.
+    """
+    _write_rows(path, _format(path, fmt), RESERVATION_FIELDS,
+                ((reservation.reservation_id, reservation.room_number, reservation.guest_name,
+                  reservation.arrival.isoformat(), reservation.departure.isoformat(), reservation.status)
+                 for reservation in hotel.bookings))
+
+
+def main():
+    # TESTING
+    import tempfile
+    from time import perf_counter
+    from Hotel import Hotel
+
+    directory = tempfile.mkdtemp()
+
+    print("=================================================================")
+    print("Test Case 1: Load Rooms with Invalid Rows.")
+    print("=================================================================")
+    path = os.path.join(directory, "rooms.csv")
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("room_number,room_type,room_price\n101,Suite,300\n102,Penthouse,900\n103,Doble,abc\n104,Doble,150\n")
+    hotel = Hotel("Grand Hotel")
+    report = load_rooms(hotel, path)
+
+    if (report.loaded == 2 and report.failed == 2 and [line for line, _ in report.errors] == [3, 4]
+            and hotel.find_room(101).room_type == HotelRoomType.SUITE and hotel.find_room(102) is None):
+        print("Test PASS. Valid rows are loaded and invalid rows are reported.")
+    else:
+        print("Test FAIL. Check the function load_rooms().")
+
+    print("=================================================================")
+    print("Test Case 2: Round Trip through JSONL and CSV.")
+    print("=================================================================")
+    hotel.add_employee(Employee(1, "John Doe", "Receptionist", 30000))
+    hotel.reserve(101, "Alice", date(2030, 1, 1), date(2030, 1, 4))
+    hotel.cancel_reservation(hotel.reserve(104, "Bob", date(2030, 1, 1), date(2030, 1, 4)).reservation_id)
+    hotel.check_in(104, "Carol")
+    for name in ("rooms", "employees", "reservations"):
+        for fmt in ("csv", "jsonl"):
+            globals()["export_" + name](hotel, os.path.join(directory, f"{name}.{fmt}"))
+    copies = []
+    for fmt in ("csv", "jsonl"):
+        copy = Hotel("Copy")
+        reports = [load_rooms(copy, os.path.join(directory, f"rooms.{fmt}")),
+                   load_employees(copy, os.path.join(directory, f"employees.{fmt}")),
+                   load_reservations(copy, os.path.join(directory, f"reservations.{fmt}"))]
+        copies.append((copy, reports))
+
+    if all(sorted(room.room_number for room in copy.rooms) == [101, 104]
+           and copy.find_employee(1).get_salary() == 30000
+           and copy.bookings.find(101, date(2030, 1, 2)).guest_name == "Alice"
+           and copy.bookings.is_free(104, date(2030, 1, 1), date(2030, 1, 4)) and reports[2].skipped == 1
+           and copy.bookings.get(3).guest_name == "Carol" and copy.find_room(104).is_occupied()
+           and copy.check_out(104) == "Check-out successful for Carol from room 104."
+           and all(report.failed == 0 for report in reports) for copy, reports in copies):
+        print("Test PASS. Exported data loads back into an identical hotel.")
+    else:
+        print("Test FAIL. Check the export_*() and load_*() functions.")
+
+    conflict = load_reservations(copies[0][0], os.path.join(directory, "reservations.csv"))
+    if conflict.loaded == 0 and conflict.failed == 2 and [line for line, _ in conflict.errors] == [2, 4]:
+        print("Test PASS. Conflicting reservations are reported per row.")
+    else:
+        print("Test FAIL. Check the function load_reservations().")
+
+    print("=================================================================")
+    print("Test Case 3: Load 200,000 Rooms.")
+    print("=================================================================")
+    path = os.path.join(directory, "many.csv")
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("room_number,room_type,room_state,room_price\n")
+        file.writelines(f"{number},Doble,Desocupada,{100 + number % 50}\n" for number in range(200000))
+    hotel = Hotel("Big Hotel")
+    start = perf_counter()
+    report = load_rooms(hotel, path)
+    elapsed = perf_counter() - start
+
+    if report.loaded == 200000 and len(hotel.available_rooms()) == 200000:
+        print(f"Test PASS. Loaded 200,000 rooms in {elapsed:.2f} s.")
+    else:
+        print("Test FAIL. Check the function load_rooms() at scale.")
+
+if __name__ == "__main__":
+    main()
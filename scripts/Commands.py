@@ -0,0 +1,239 @@
+from datetime import date
+from Employee import Employee
+from Room import Room
+from Roomtype import HotelRoomType
+
+def room_to_dict(room: Room) -> dict:
+    """Convert a room to a JSON-serializable dictionary.
+
+    Parameters
+    ----------
+    room : Room
+        The Room instance to convert.
+
+    Returns
+    -------
+    dict
+        The room attributes, with enums replaced by their values.
+    """
+    return {"room_number": room.room_number, "room_type": HotelRoomType(room.room_type).value,
+            "room_state": room.room_state.value, "room_price": room.room_price}
+
+def employee_to_dict(employee: Employee) -> dict:
+    """Convert an employee to a JSON-serializable dictionary.
+
+    Parameters
+    ----------
+    employee : Employee
+        The Employee instance to convert.
+
+    Returns
+    -------
+    dict
+        The employee attributes.
+    """
+    return {"emp_id": employee.get_emp_id(), "name": employee.get_name(),
+            "position": employee.get_position(), "salary": employee.get_salary()}
+
+def reservation_to_dict(reservation) -> dict:
+    """Convert a reservation to a JSON-serializable dictionary.
+
+    Parameters
+    ----------
+    reservation : Reservation
+        The Reservation instance to convert.
+
+    Returns
+    -------
+    dict
+        The reservation attributes, with dates in ISO format.
+    """
+    return {"reservation_id": reservation.reservation_id, "room_number": reservation.room_number,
+            "guest_name": reservation.guest_name, "arrival": reservation.arrival.isoformat(),
+            "departure": reservation.departure.isoformat(), "status": reservation.status}
+
+def _refused(result: str, success: str) -> str:
+    # The hotel reports a refusal as a message; the command fails with it.
+    if result is None or success not in result:
+        raise ValueError(result)
+    return result
+
+def _date(args: dict, name: str):
+    value = args.get(name)
+    return date.fromisoformat(value) if value else None
+
+def _add_room(hotel, args):
+    return _refused(hotel.add_room(Room(HotelRoomType(args["room_type"]), int(args["room_number"]),
+                                        args.get("room_state", "Desocupada"), float(args["room_price"]))),
+                    "added successfully")
+
+def _remove_room(hotel, args):
+    if hotel.find_room(int(args["room_number"])) is None:
+        raise ValueError("Room not found.")
+    hotel.remove_room(int(args["room_number"]))
+    return "Room removed successfully."
+
+def _add_employee(hotel, args):
+    hotel.add_employee(Employee(int(args["emp_id"]), args["name"], args["position"], float(args["salary"])))
+    return "Employee added successfully."
+
+def _remove_employee(hotel, args):
+    if hotel.find_employee(int(args["emp_id"])) is None:
+        raise ValueError("Employee not found.")
+    hotel.remove_employee(int(args["emp_id"]))
+    return "Employee removed successfully."
+
+def _update_employee(hotel, args):
+    salary = args.get("salary")
+    return _refused(hotel.update_employee(int(args["emp_id"]), args.get("position"),
+                                          float(salary) if salary is not None else None), "successfully")
+
+def _find_room(hotel, args):
+    room = hotel.find_room(int(args["room_number"]))
+    return room_to_dict(room) if room is not None else None
+
+def _find_employee(hotel, args):
+    employee = hotel.find_employee(int(args["emp_id"]))
+    return employee_to_dict(employee) if employee is not None else None
+
+def _list_rooms(hotel, args):
+    return [room_to_dict(room) for room in hotel.rooms]
+
+def _list_employees(hotel, args):
+    return [employee_to_dict(employee) for employee in hotel.employees]
+
+def _available_rooms(hotel, args):
+    return [room_to_dict(room) for room in hotel.available_rooms(args.get("room_type"))]
+
+def _free_rooms(hotel, args):
+    rooms = hotel.free_rooms(args["room_type"], _date(args, "arrival"), _date(args, "departure"))
+    return [room_to_dict(room) for room in rooms]
+
+def _rooms_in_state(hotel, args):
+    floor = args.get("floor")
+    rooms = hotel.rooms_in_state(args["room_state"], int(floor) if floor is not None else None, args.get("room_type"))
+    return [room_to_dict(room) for room in rooms]
+
+def _set_room_state(hotel, args):
+    return _refused(hotel.set_room_state(int(args["room_number"]), args["room_state"]), " is now ")
+
+def _check_in(hotel, args):
+    return _refused(hotel.check_in(int(args["room_number"]), args["guest_name"], _date(args, "departure"),
+                                   _date(args, "on")), "successful")
+
+def _check_out(hotel, args):
+    return _refused(hotel.check_out(int(args["room_number"]), _date(args, "on")), "successful")
+
+def _move_guest(hotel, args):
+    return _refused(hotel.move_guest(int(args["from_room"]), int(args["to_room"]), args.get("room_state"),
+                                     _date(args, "on")), " moved from room ")
+
+def _reserve(hotel, args):
+    reservation = hotel.reserve(int(args["room_number"]), args["guest_name"],
+                                _date(args, "arrival"), _date(args, "departure"))
+    if reservation is None:
+        raise ValueError("Room not found or not free in that period.")
+    return reservation_to_dict(reservation)
+
+def _cancel_reservation(hotel, args):
+    return _refused(hotel.cancel_reservation(int(args["reservation_id"])), " cancelled for ")
+
+def _allocate_group(hotel, args):
+    from Allocation import Party, allocate_group
+    parties = [Party(party["guest_name"], party["room_type"], party.get("max_price")) for party in args["parties"]]
+    reservations = allocate_group(hotel, parties, _date(args, "arrival"), _date(args, "departure"),
+                                  args.get("prefer", "cost"))
+    return [reservation_to_dict(reservation) for reservation in reservations]
+
+COMMANDS = {
+    "add_room": _add_room,
+    "remove_room": _remove_room,
+    "add_employee": _add_employee,
+    "remove_employee": _remove_employee,
+    "update_employee": _update_employee,
+    "find_room": _find_room,
+    "find_employee": _find_employee,
+    "list_rooms": _list_rooms,
+    "list_employees": _list_employees,
+    "available_rooms": _available_rooms,
+    "free_rooms": _free_rooms,
+    "rooms_in_state": _rooms_in_state,
+    "set_room_state": _set_room_state,
+    "check_in": _check_in,
+    "check_out": _check_out,
+    "move_guest": _move_guest,
+    "reserve": _reserve,
+    "cancel_reservation": _cancel_reservation,
+    "allocate_group": _allocate_group,
+}
+
+def execute(hotel, command: dict) -> dict:
+    """Run one command against a hotel.
+
+    Parameters
+    ----------
+    hotel : Hotel
+        The hotel the command is applied to.
+    command : dict
+        The operation name under "op" and its arguments, e.g.
+        {"op": "check_in", "room_number": 101, "guest_name": "Alice"}. Dates are ISO strings.
+
+    Returns
+    -------
+    dict
+        {"ok": True, "result": ...} with the value returned by the operation, or
+        {"ok": False, "error": ...} if the command is unknown, its arguments are invalid or
+        the hotel refuses it, e.g. "Room not found.".
+    """
+    handler = COMMANDS.get(command.get("op"))
+    if handler is None:
+        return {"ok": False, "error": f"Unknown operation: {command.get('op')}"}
+    try:
+        return {"ok": True, "result": handler(hotel, command)}
+    except KeyError as error:
+        return {"ok": False, "error": f"Missing argument: {error.args[0]}"}
+    except (TypeError, ValueError) as error:
+        return {"ok": False, "error": str(error)}
+
+
+def main():
+    # TESTING
+    from Hotel import Hotel
+
+    print("=================================================================")
+    print("Test Case 1: Execute Commands.")
+    print("=================================================================")
+    hotel = Hotel("Grand Hotel")
+    execute(hotel, {"op": "add_room", "room_type": "Suite", "room_number": 101, "room_price": 300})
+    execute(hotel, {"op": "add_employee", "emp_id": 1, "name": "John Doe", "position": "Receptionist", "salary": 30000})
+    check_in = execute(hotel, {"op": "check_in", "room_number": 101, "guest_name": "Alice"})
+    room = execute(hotel, {"op": "find_room", "room_number": 101})
+    execute(hotel, {"op": "update_employee", "emp_id": 1, "salary": 35000})
+    execute(hotel, {"op": "add_room", "room_type": "Suite", "room_number": 102, "room_price": 300})
+    moved = execute(hotel, {"op": "move_guest", "from_room": 101, "to_room": 102, "room_state": "Fuera de servicio"})
+
+    if (check_in == {"ok": True, "result": "Check-in successful for Alice in room 101."}
+            and room["result"]["room_state"] == "Ocupada" and hotel.find_employee(1).get_salary() == 35000
+            and moved["result"] == "Alice moved from room 101 to room 102."
+            and hotel.find_room(101).room_state == "Fuera de servicio"):
+        print("Test PASS. Commands have been applied to the hotel.")
+    else:
+        print("Test FAIL. Check the function execute().")
+
+    print("=================================================================")
+    print("Test Case 2: Report Invalid Commands.")
+    print("=================================================================")
+    unknown = execute(hotel, {"op": "fly"})
+    missing = execute(hotel, {"op": "check_out"})
+    invalid = execute(hotel, {"op": "add_room", "room_type": "Penthouse", "room_number": 1, "room_price": 1})
+    state = execute(hotel, {"op": "set_room_state", "room_number": 101, "room_state": "Limpia"})
+
+    if (unknown == {"ok": False, "error": "Unknown operation: fly"}
+            and missing == {"ok": False, "error": "Missing argument: room_number"} and not invalid["ok"]
+            and not state["ok"]):
+        print("Test PASS. Invalid commands are reported without raising.")
+    else:
+        print("Test FAIL. Check the error handling of execute().")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,359 @@
+import threading
+from datetime import date
+from Hotel import Hotel
+from Room import Room
+from Roomtype import HotelRoomType
+
+class ConcurrentHotel(Hotel):
+    """Python class to implement a thread-safe hotel with striped per-room locks.
+
+    Every operation on a room runs under the lock of its stripe, room_number modulo the
+    number of stripes, so the read-then-write sequence of check_in() can never double-book
+    a room while operations on rooms of other stripes proceed without waiting. Adding and
+    removing rooms also takes a structure lock, and listeners are notified one at a time,
+    so a backend such as SQLiteStorage sees the events in order.
+
+    A transaction() holds every lock while it is open, so other threads never see half of
+    a batch, and so does a check_in() while an admission policy is set, since admitting a
+    walk-in may move reservations to other rooms, or when the guest's reservation has been
+    displaced, since they may take any room of the type. Reservations are only displaced
+    under every lock, so a room's stripe is enough to tell. Locks are reentrant, so a listener may call back into the hotel for the same room.
+    A listener must not wait on other threads that operate on the hotel.
+
+    The type, state and floor indexes are shared by every stripe, so they have a lock of
+    their own, taken last. Queries by type or state run under it; free_rooms() copies the
+    numbers of the type under it and then checks the stays of each room under its stripe.
+
+    Syntax
+    ------
+    obj = ConcurrentHotel(name, stripes)
+
+    Parameters
+    ----------
+    [in] name : str
+        The name of the hotel.
+    [in] stripes : int
+        Number of room locks. Defaults to 64.
+
+    Returns
+    -------
+    obj : ConcurrentHotel
+        An instance of the ConcurrentHotel class.
+
+    Attributes
+    ----------
+    Same as Hotel.
+    """
+
+    def __init__(self, name: str, stripes: int = 64):
+        super().__init__(name)
+        self._stripes = [threading.RLock() for _ in range(stripes)]
+        self._structure_lock = threading.RLock()
+        self._listener_lock = threading.RLock()
+        self._index_lock = threading.RLock()
+
+    def room_lock(self, room_number: int):
+        """Get the lock guarding a room.
+
+        Parameters
+        ----------
+        room_number : int
+            The number of the room.
+
+        Returns
+        -------
+        RLock
+            The lock of the room's stripe.
+        """
+        return self._stripes[hash(room_number) % len(self._stripes)]
+
+    def _lock_all(self):
+        # Taken in order, so two threads holding several stripes never deadlock.
+        for lock in self._stripes:
+            lock.acquire()
+        self._structure_lock.acquire()
+        self._listener_lock.acquire()
+
+    def _unlock_all(self):
+        self._listener_lock.release()
+        self._structure_lock.release()
+        for lock in reversed(self._stripes):
+            lock.release()
+
+    def _begin(self, transaction):
+        # A batch may touch any room, so it holds every stripe until its events are delivered.
+        self._lock_all()
+        try:
+            super()._begin(transaction)
+        except BaseException:
+            self._unlock_all()
+            raise
+
+    def _end(self, transaction, events: list):
+        try:
+            super()._end(transaction, events)
+        finally:
+            self._unlock_all()
+
+    def _notify(self, event: str, obj):
+        with self._listener_lock:
+            super()._notify(event, obj)
+
+    def _index_room(self, room: Room):
+        with self._index_lock:
+            super()._index_room(room)
+
+    def _unindex_room(self, room: Room):
+        with self._index_lock:
+            super()._unindex_room(room)
+
+    def _set_room_state(self, room: Room, room_state):
+        with self._index_lock:
+            super()._set_room_state(room, room_state)
+
+    def add_room(self, room: Room) -> str:
+        with self.room_lock(room.room_number), self._structure_lock:
+            return super().add_room(room)
+
+    def add_rooms(self, rooms) -> int:
+        count = 0
+        for room in rooms:
+            if self.add_room(room) == "Room added successfully.":
+                count += 1
+        return count
+
+    def remove_room(self, room_number: int):
+        with self.room_lock(room_number), self._structure_lock:
+            super().remove_room(room_number)
+
+    def set_room_state(self, room_number: int, room_state) -> str:
+        with self.room_lock(room_number):
+            return super().set_room_state(room_number, room_state)
+
+    def reserve(self, room_number: int, guest_name: str, arrival: date, departure: date):
+        with self.room_lock(room_number):
+            return super().reserve(room_number, guest_name, arrival, departure)
+
+    def cancel_reservation(self, reservation_id: int):
+        reservation = self.bookings.get(reservation_id)
+        if reservation is None:
+            return super().cancel_reservation(reservation_id)
+        with self.room_lock(reservation.room_number):
+            return super().cancel_reservation(reservation_id)
+
+    def displace_reservation(self, reservation_id: int):
+        self._lock_all()
+        try:
+            return super().displace_reservation(reservation_id)
+        finally:
+            self._unlock_all()
+
+    def check_in(self, room_number: int, guest_name: str, departure: date = None, on: date = None):
+        if self.admission is None:
+            with self.room_lock(room_number):
+                if self.bookings.displaced(room_number, guest_name, on or date.today()) is None:
+                    return super().check_in(room_number, guest_name, departure, on)
+        # An admission, or the arrival of a displaced guest, may book any room of the type.
+        self._lock_all()
+        try:
+            return super().check_in(room_number, guest_name, departure, on)
+        finally:
+            self._unlock_all()
+
+    def check_out(self, room_number: int, on: date = None):
+        with self.room_lock(room_number):
+            return super().check_out(room_number, on)
+
+    def rooms_by_type(self, room_type: HotelRoomType) -> list:
+        with self._index_lock:
+            return super().rooms_by_type(room_type)
+
+    def rooms_by_state(self, room_state) -> list:
+        with self._index_lock:
+            return super().rooms_by_state(room_state)
+
+    def rooms_in_state(self, room_state, floor: int = None, room_type: HotelRoomType = None) -> list:
+        with self._index_lock:
+            return super().rooms_in_state(room_state, floor, room_type)
+
+    def available_rooms(self, room_type: HotelRoomType = None) -> list:
+        with self._index_lock:
+            return super().available_rooms(room_type)
+
+    def free_rooms(self, room_type: HotelRoomType, arrival: date, departure: date) -> list:
+        with self._index_lock:
+            numbers = list(self._rooms_by_type.get(HotelRoomType(room_type), ()))
+        # The stripes are taken after the index lock is released, never inside it.
+        free = []
+        for number in numbers:
+            with self.room_lock(number):
+                room = self._rooms.get(number)
+                if room is not None and self.bookings.is_free(number, arrival, departure):
+                    free.append(room)
+        return free
+
+
+def main():
+    # TESTING
+    from datetime import timedelta
+    from Forecast import OverbookingPolicy
+    from Roomtype import HotelRoomType
+
+    print("=================================================================")
+    print("Test Case 1: Concurrent Check-ins Never Double-Book a Room.")
+    print("=================================================================")
+    hotel = ConcurrentHotel("Grand Hotel", stripes=8)
+    for number in range(100):
+        hotel.add_room(Room(HotelRoomType.DOBLE, number, "Desocupada", 100))
+    events = []
+    hotel.subscribe(lambda event, obj: events.append(event))
+    successes = []
+
+    def front_desk(worker: int):
+        for number in range(100):
+            if hotel.check_in(number, f"Guest {worker}").startswith("Check-in successful"):
+                successes.append(number)
+
+    threads = [threading.Thread(target=front_desk, args=(worker,)) for worker in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if (sorted(successes) == list(range(100)) and len(hotel.reservations) == 100
+            and len(hotel.bookings) == 100 and events.count("check_in") == 100):
+        print("Test PASS. Every room has been checked in exactly once.")
+    else:
+        print("Test FAIL. Check the method check_in() for races.")
+
+    print("=================================================================")
+    print("Test Case 2: Concurrent Check-outs and Re-check-ins.")
+    print("=================================================================")
+
+    def turnover(first: int):
+        for number in range(first, 100, 4):
+            hotel.check_out(number)
+            hotel.check_in(number, "Next Guest")
+
+    threads = [threading.Thread(target=turnover, args=(first,)) for first in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if (set(hotel.reservations.values()) == {"Next Guest"} and len(hotel.rooms_by_state("Ocupada")) == 100
+            and len({reservation.reservation_id for reservation in hotel.bookings}) == 200):
+        print("Test PASS. Indexes and reservation IDs are consistent.")
+    else:
+        print("Test FAIL. Check the methods check_out() and check_in() for races.")
+
+    print("=================================================================")
+    print("Test Case 3: Concurrent Room Moves.")
+    print("=================================================================")
+    for number in range(100, 110):
+        hotel.add_room(Room(HotelRoomType.DOBLE, number, "Desocupada", 100))
+    moves = []
+
+    def relocate(first: int):
+        for number in range(first, 100, 4):
+            # Every thread competes for the same ten spare rooms.
+            for target in range(100, 110):
+                if hotel.move_guest(number, target).endswith(f"to room {target}."):
+                    moves.append(number)
+                    hotel.move_guest(target, number)
+                    break
+
+    threads = [threading.Thread(target=relocate, args=(first,)) for first in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if (len(moves) == 100 and len(hotel.reservations) == 100
+            and all(hotel.find_room(number).is_occupied() for number in range(100))
+            and not any(hotel.find_room(number).is_occupied() for number in range(100, 110))):
+        print("Test PASS. Guests moved under transactions are never lost or doubled.")
+    else:
+        print("Test FAIL. Check the locks of transaction().")
+
+    print("=================================================================")
+    print("Test Case 4: Crossing Walk-In Admissions.")
+    print("=================================================================")
+    today = date(2030, 1, 1)
+    day = timedelta(days=1)
+    hotel = ConcurrentHotel("Grand Hotel", stripes=8)
+    hotel.admission = OverbookingPolicy({HotelRoomType.SUITE: 0})
+    pairs = [(number, number + 1) for number in range(500, 700, 2)]
+    for first, second in pairs:
+        hotel.add_room(Room(HotelRoomType.SUITE, first, "Desocupada", 300))
+        hotel.add_room(Room(HotelRoomType.SUITE, second, "Desocupada", 300))
+        hotel.reserve(first, f"Booked {first}", today, today + day)
+        hotel.reserve(second, f"Booked {second}", today + day, today + 2 * day)
+    admitted = []
+
+    def walk_in(index: int, on: date):
+        # Each admission moves a reservation into the room the other thread admits in.
+        for pair in pairs:
+            if hotel.check_in(pair[index], "Walk-in", on=on).startswith("Check-in successful"):
+                admitted.append(pair[index])
+
+    threads = [threading.Thread(target=walk_in, args=(0, today), daemon=True),
+               threading.Thread(target=walk_in, args=(1, today + day), daemon=True)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+
+    if (not any(thread.is_alive() for thread in threads) and len(admitted) == 200
+            and sorted(reservation.guest_name for reservation in hotel.bookings if reservation.status == "Confirmada")
+            == sorted(f"Booked {number}" for pair in pairs for number in pair)):
+        print("Test PASS. Admissions moving reservations across rooms never deadlock.")
+    else:
+        print("Test FAIL. Check the locks of check_in() with an admission policy.")
+
+    print("=================================================================")
+    print("Test Case 5: Queries While Rooms and Stays Change.")
+    print("=================================================================")
+    hotel = ConcurrentHotel("Grand Hotel", stripes=8)
+    for number in range(200):
+        hotel.add_room(Room(HotelRoomType.DOBLE, number, "Desocupada", 100))
+    errors = []
+    done = threading.Event()
+
+    def query():
+        while not done.is_set():
+            try:
+                hotel.free_rooms(HotelRoomType.DOBLE, today, today + day)
+                hotel.available_rooms(HotelRoomType.DOBLE)
+                hotel.rooms_by_type(HotelRoomType.DOBLE)
+                hotel.rooms_by_state("Ocupada")
+                hotel.rooms_in_state("Desocupada", floor=1)
+            except Exception as error:
+                errors.append(error)
+
+    def change(first: int):
+        for number in range(first, 2000, 4):
+            hotel.add_room(Room(HotelRoomType.DOBLE, 1000 + number, "Desocupada", 100))
+            hotel.reserve(1000 + number, "Booked", today + number % 5 * day, today + (number % 5 + 1) * day)
+            hotel.check_in(number % 200, "Walk-in", on=today)
+            hotel.check_out(number % 200, today)
+            if number >= 4:
+                hotel.remove_room(1000 + number - 4)
+
+    readers = [threading.Thread(target=query) for _ in range(4)]
+    writers = [threading.Thread(target=change, args=(first,)) for first in range(4)]
+    for thread in readers + writers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    done.set()
+    for thread in readers:
+        thread.join()
+
+    if not errors and len(hotel.free_rooms(HotelRoomType.DOBLE, today, today + day)) == len(hotel.rooms):
+        print("Test PASS. Queries never see the indexes or stays halfway through a change.")
+    else:
+        print(f"Test FAIL. {len(errors)} queries failed. Check the read methods for races.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+from Roomstate import RoomState
+from Roomtype import HotelRoomType
+
+class Dashboard:
+    """Python class to implement the materialized dashboards of a hotel.
+
+    The dashboard listens to the hotel and keeps its totals up to date as events arrive,
+    instead of going over every room and employee when they are read: rooms by type and
+    state, occupied rooms by type, the revenue of tonight (the price of every occupied
+    room), and headcount and payroll by position. Each event only takes back the last
+    values recorded for its room or employee and adds the new ones, so both the updates and
+    the reads take constant time whatever the size of the hotel. Rooms and employees must
+    be changed through the Hotel for the dashboard to see it.
+
+    Syntax
+    ------
+    obj = Dashboard(hotel)
+
+    Parameters
+    ----------
+    [in] hotel : Hotel
+        The hotel to follow. Its current rooms and employees are counted once.
+
+    Returns
+    -------
+    obj : Dashboard
+        Python object output parameter that represents an instance of the class Dashboard.
+
+    Attributes
+    ----------
+    """
+
+    def __init__(self, hotel):
+        self._hotel = hotel
+        self._rooms = {}
+        self._employees = {}
+        self._by_type_state = {}
+        self._by_type = {}
+        self._occupied = {}
+        self._revenue = 0.0
+        self._headcount = {}
+        self._payroll = {}
+        self._total_payroll = 0.0
+        for room in hotel.rooms:
+            self._set_room(room)
+        for employee in hotel.employees:
+            self._set_employee(employee)
+        hotel.subscribe(self)
+
+    def close(self):
+        """Stop following the hotel."""
+        self._hotel.unsubscribe(self)
+
+    def __call__(self, event: str, obj):
+        if event in ("add_room", "room_state"):
+            self._set_room(obj)
+        elif event == "remove_room":
+            self._unset_room(obj.room_number)
+        elif event in ("check_in", "check_out"):
+            room = self._hotel.find_room(obj.room_number)
+            if room is not None:
+                self._set_room(room)
+        elif event in ("add_employee", "update_employee"):
+            self._set_employee(obj)
+        elif event == "remove_employee":
+            self._unset_employee(obj.get_emp_id())
+
+    def _set_room(self, room):
+        self._unset_room(room.room_number)
+        record = (HotelRoomType(room.room_type), RoomState(room.room_state), room.room_price)
+        self._rooms[room.room_number] = record
+        self._count_room(record, 1)
+
+    def _unset_room(self, room_number: int):
+        record = self._rooms.pop(room_number, None)
+        if record is not None:
+            self._count_room(record, -1)
+
+    def _count_room(self, record: tuple, sign: int):
+        room_type, room_state, room_price = record
+        key = (room_type, room_state)
+        self._by_type_state[key] = self._by_type_state.get(key, 0) + sign
+        self._by_type[room_type] = self._by_type.get(room_type, 0) + sign
+        if room_state is RoomState.OCUPADA:
+            self._occupied[room_type] = self._occupied.get(room_type, 0) + sign
+            self._revenue += sign * room_price
+
+    def _set_employee(self, employee):
+        self._unset_employee(employee.get_emp_id())
+        record = (employee.get_position(), employee.get_salary())
+        self._employees[employee.get_emp_id()] = record
+        self._count_employee(record, 1)
+
+    def _unset_employee(self, emp_id: int):
+        record = self._employees.pop(emp_id, None)
+        if record is not None:
+            self._count_employee(record, -1)
+
+    def _count_employee(self, record: tuple, sign: int):
+        position, salary = record
+        self._headcount[position] = self._headcount.get(position, 0) + sign
+        self._payroll[position] = self._payroll.get(position, 0.0) + sign * salary
+        self._total_payroll += sign * salary
+
+    def rooms(self, room_type: HotelRoomType = None, room_state: RoomState = None) -> int:
+        """Count the rooms of a type and state.
+
+        Parameters
+        ----------
+        room_type : HotelRoomType, optional
+            The type of the rooms. All types if omitted.
+        room_state : RoomState, optional
+            The state of the rooms. All states if omitted.
+
+        Returns
+        -------
+        int
+            Number of rooms.
+        """
+        if room_state is None:
+            return len(self._rooms) if room_type is None else self._by_type.get(HotelRoomType(room_type), 0)
+        room_state = RoomState(room_state)
+        if room_type is None:
+            return sum(self._by_type_state.get((each, room_state), 0) for each in HotelRoomType)
+        return self._by_type_state.get((HotelRoomType(room_type), room_state), 0)
+
+    def occupied(self, room_type: HotelRoomType = None) -> int:
+        """Count the occupied rooms.
+
+        Parameters
+        ----------
+        room_type : HotelRoomType, optional
+            The type of the rooms. All types if omitted.
+
+        Returns
+        -------
+        int
+            Number of occupied rooms.
+        """
+        if room_type is None:
+            return sum(self._occupied.values())
+        return self._occupied.get(HotelRoomType(room_type), 0)
+
+    def occupied_by_type(self) -> dict:
+        """Get the number of occupied rooms by HotelRoomType."""
+        return {room_type: self._occupied.get(room_type, 0) for room_type in HotelRoomType}
+
+    def revenue_tonight(self) -> float:
+        """Get the revenue of tonight, the sum of the prices of the occupied rooms."""
+        return self._revenue
+
+    def headcount(self, position: str = None) -> int:
+        """Count the employees.
+
+        Parameters
+        ----------
+        position : str, optional
+            The position of the employees. All positions if omitted.
+
+        Returns
+        -------
+        int
+            Number of employees.
+        """
+        if position is None:
+            return len(self._employees)
+        return self._headcount.get(position, 0)
+
+    def payroll(self, position: str = None) -> float:
+        """Get the sum of the salaries.
+
+        Parameters
+        ----------
+        position : str, optional
+            The position of the employees. All positions if omitted.
+
+        Returns
+        -------
+        float
+            Sum of the salaries.
+        """
+        if position is None:
+            return self._total_payroll
+        return self._payroll.get(position, 0.0)
+
+    def by_position(self) -> dict:
+        """Get the headcount and payroll of every position with employees.
+
+        Returns
+        -------
+        dict
+            (headcount, payroll) by position.
+        """
+        return {position: (count, self._payroll[position]) for position, count in self._headcount.items() if count}
+
+
+def main():
+    # TESTING
+    from time import perf_counter
+    from Employee import Employee
+    from Hotel import Hotel
+    from Room import Room
+
+    hotel = Hotel("Grand Hotel")
+    hotel.add_room(Room(HotelRoomType.DOBLE, 101, "Desocupada", 100))
+    hotel.add_employee(Employee(1, "John Doe", "Receptionist", 30000))
+    dashboard = Dashboard(hotel)
+
+    print("=================================================================")
+    print("Test Case 1: Occupancy and Revenue.")
+    print("=================================================================")
+    hotel.add_room(Room(HotelRoomType.DOBLE, 102, "Desocupada", 120))
+    hotel.add_room(Room(HotelRoomType.SUITE, 201, "Desocupada", 400))
+    hotel.check_in(101, "Alice")
+    hotel.check_in(201, "Bob")
+    hotel.check_in(102, "Carol")
+    hotel.check_out(102)
+    hotel.set_room_state(102, "Sucia")
+    hotel.set_room_state(102, "Limpiando")
+    occupied = dashboard.occupied_by_type()
+    revenue = dashboard.revenue_tonight()
+    hotel.remove_room(201)
+
+    if (occupied == {HotelRoomType.INDIVIDUAL: 0, HotelRoomType.DOBLE: 1, HotelRoomType.SUITE: 1} and revenue == 500
+            and dashboard.revenue_tonight() == 100 and dashboard.occupied() == 1 and dashboard.rooms() == 2
+            and dashboard.rooms(HotelRoomType.DOBLE, RoomState.LIMPIANDO) == 1):
+        print("Test PASS. Occupied rooms and tonight's revenue follow check-ins, check-outs and removals.")
+    else:
+        print("Test FAIL. Check the room events of the Dashboard.")
+
+    print("=================================================================")
+    print("Test Case 2: Headcount and Payroll.")
+    print("=================================================================")
+    hotel.add_employee(Employee(2, "Jane Roe", "Housekeeper", 25000))
+    hotel.add_employee(Employee(3, "Max Poe", "Housekeeper", 24000))
+    hotel.update_employee(3, salary=26000)
+    hotel.update_employee(1, position="Manager", salary=50000)
+    hotel.remove_employee(2)
+
+    if (dashboard.by_position() == {"Housekeeper": (1, 26000), "Manager": (1, 50000)}
+            and dashboard.headcount("Receptionist") == 0 and dashboard.headcount() == 2
+            and dashboard.payroll() == 76000):
+        print("Test PASS. Headcount and payroll by position follow hires, updates and departures.")
+    else:
+        print("Test FAIL. Check the employee events of the Dashboard.")
+    dashboard.close()
+
+    print("=================================================================")
+    print("Test Case 3: Constant-Time Reads.")
+    print("=================================================================")
+    hotel = Hotel("Big Hotel")
+    hotel.add_rooms(Room(HotelRoomType("Individual" if number % 2 else "Doble"), number, "Desocupada", 100.0)
+                    for number in range(200000))
+    dashboard = Dashboard(hotel)
+    for number in range(0, 200000, 4):
+        hotel.check_in(number, "Guest")
+    start = perf_counter()
+    for _ in range(1000):
+        occupied = dashboard.occupied(HotelRoomType.DOBLE)
+        revenue = dashboard.revenue_tonight()
+    read = (perf_counter() - start) / 1000
+    start = perf_counter()
+    scanned = sum(room.room_price for room in hotel.rooms if room.is_occupied())
+    scan = perf_counter() - start
+
+    if occupied == 50000 and revenue == scanned == 5000000 and read * 100 < scan:
+        print(f"Test PASS. {read * 1e6:.2f} us per dashboard read, {scan * 1000:.1f} ms to scan 200,000 rooms.")
+    else:
+        print(f"Test FAIL. {read * 1e6:.2f} us per read, {scan * 1000:.1f} ms per scan.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,462 @@
+import os
+import struct
+from datetime import date
+from Employee import Employee
+from Inventory import ROOM_STATES, ROOM_TYPES, STATE_CODES, TYPE_CODES
+from Reservation import Reservation
+from Room import Room
+from Roomtype import HotelRoomType
+
+HEADER = struct.Struct("<BI")
+ROOM = struct.Struct("<qBBd")
+NUMBER = struct.Struct("<q")
+EMPLOYEE = struct.Struct("<qd")
+STAY = struct.Struct("<qqii")
+ROOM_STATE = struct.Struct("<qB")
+TEXT_LENGTH = struct.Struct("<H")
+SNAPSHOT_HEADER = struct.Struct("<8sQIIIq")
+SNAPSHOT_RESERVATION = struct.Struct("<qqiiB")
+SNAPSHOT_MAGIC = b"HOTELSN2"
+# Snapshots written before the next reservation ID was kept; their header ends at the counts.
+OLD_SNAPSHOT_HEADER = struct.Struct("<8sQIII")
+OLD_SNAPSHOT_MAGIC = b"HOTELSNP"
+STATUSES = ["Confirmada", "En curso", "Finalizada", "Cancelada", "Desplazada"]
+STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+EVENTS = ["add_room", "remove_room", "add_employee", "remove_employee",
+          "reserve", "cancel_reservation", "check_in", "check_out", "room_state", "update_employee",
+          "displace_reservation"]
+EVENT_CODES = {event: code for code, event in enumerate(EVENTS)}
+
+def _pack_text(text: str) -> bytes:
+    data = text.encode("utf-8")
+    return TEXT_LENGTH.pack(len(data)) + data
+
+def _unpack_text(data, offset: int) -> tuple:
+    length, = TEXT_LENGTH.unpack_from(data, offset)
+    offset += 2
+    return str(data[offset:offset + length], "utf-8"), offset + length
+
+class EventLog:
+    """Python class to implement an append-only binary event log for a hotel.
+
+    Once attached, every mutation of the hotel is appended to the log as a small binary
+    record: a header with the event code and payload length, then fixed-width fields and
+    length-prefixed UTF-8 strings. Every snapshot_every events the full state is written
+    to a compact snapshot file together with the log offset it covers and the next
+    reservation ID, so a restart loads the snapshot and replays only the records after
+    that offset, handing out the same reservation IDs as the original hotel.
+
+    Syntax
+    ------
+    obj = EventLog(path, snapshot_every)
+
+    Parameters
+    ----------
+    [in] path : str
+        Path of the log file. The snapshot is kept next to it, at path + ".snapshot".
+    [in] snapshot_every : int
+        Number of appended events between automatic snapshots. 0 disables them.
+
+    Returns
+    -------
+    obj : EventLog
+        Python object output parameter that represents an instance of the class EventLog.
+
+    Attributes
+    ----------
+    path : str
+        Path of the log file.
+    snapshot_path : str
+        Path of the snapshot file.
+    snapshot_every : int
+        Number of appended events between automatic snapshots.
+    """
+
+    def __init__(self, path: str, snapshot_every: int = 100000):
+        self.path = path
+        self.snapshot_path = path + ".snapshot"
+        self.snapshot_every = snapshot_every
+        self._file = None
+        self._hotel = None
+        self._pending = 0
+        self._encoders = {
+            "add_room": self._encode_room,
+            "remove_room": lambda room: NUMBER.pack(room.room_number),
+            "add_employee": self._encode_employee,
+            "remove_employee": lambda employee: NUMBER.pack(employee.get_emp_id()),
+            "reserve": self._encode_stay,
+            "cancel_reservation": lambda reservation: NUMBER.pack(reservation.reservation_id),
+            "check_in": self._encode_stay,
+            "check_out": self._encode_stay,
+            "room_state": lambda room: ROOM_STATE.pack(room.room_number, STATE_CODES[room.room_state]),
+            "update_employee": self._encode_employee,
+            "displace_reservation": lambda reservation: NUMBER.pack(reservation.reservation_id),
+        }
+
+    def attach(self, hotel):
+        """Restore a hotel from the snapshot and log, then log its later mutations.
+
+        Parameters
+        ----------
+        hotel : Hotel
+            The hotel to be restored. It is expected to be empty.
+        """
+        end = self.restore(hotel)
+        self._file = open(self.path, "ab")
+        if self._file.tell() != end:
+            # Drop a record cut short by a crash so new records start on a boundary.
+            self._file.truncate(end)
+        self._hotel = hotel
+        hotel.subscribe(self)
+
+    def close(self):
+        """Stop logging the attached hotel and close the log file."""
+        if self._hotel is not None:
+            self._hotel.unsubscribe(self)
+            self._hotel = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __call__(self, event: str, obj):
+        payload = self._encoders[event](obj)
+        self._file.write(HEADER.pack(EVENT_CODES[event], len(payload)) + payload)
+        self._file.flush()
+        self._pending += 1
+        if self.snapshot_every and self._pending >= self.snapshot_every:
+            self.snapshot()
+
+    def snapshot(self):
+        """Write the full state of the attached hotel to the snapshot file.
+
+        The file is written aside and renamed, so a crash never leaves a partial snapshot.
+        """
+        self._file.flush()
+        offset = self._file.tell()
+        hotel = self._hotel
+        rooms = hotel.rooms
+        employees = hotel.employees
+        reservations = list(hotel.bookings)
+        parts = [SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, offset, len(rooms), len(employees), len(reservations),
+                                      hotel.bookings.next_id())]
+        parts.extend(self._encode_room(room) for room in rooms)
+        parts.extend(self._encode_employee(employee) for employee in employees)
+        for reservation in reservations:
+            parts.append(SNAPSHOT_RESERVATION.pack(
+                reservation.reservation_id, reservation.room_number, reservation.arrival.toordinal(),
+                reservation.departure.toordinal(), STATUS_CODES[reservation.status]))
+            parts.append(_pack_text(reservation.guest_name))
+        temporary = self.snapshot_path + ".tmp"
+        with open(temporary, "wb") as file:
+            file.write(b"".join(parts))
+        os.replace(temporary, self.snapshot_path)
+        self._pending = 0
+
+    def restore(self, hotel) -> int:
+        """Load the latest snapshot into a hotel and replay the log records after it.
+
+        Parameters
+        ----------
+        hotel : Hotel
+            The hotel to be restored.
+
+        Returns
+        -------
+        int
+            Offset of the end of the last complete record of the log.
+        """
+        offset = self._load_snapshot(hotel)
+        if not os.path.exists(self.path):
+            return 0
+        with open(self.path, "rb") as file:
+            file.seek(offset)
+            data = file.read()
+        return offset + self.replay(hotel, data)
+
+    def replay(self, hotel, data) -> int:
+        """Apply a block of log records to a hotel.
+
+        Parameters
+        ----------
+        hotel : Hotel
+            The hotel the records are applied to.
+        data : bytes
+            Consecutive log records. A truncated record at the end is ignored.
+
+        Returns
+        -------
+        int
+            Number of bytes consumed, up to the end of the last complete record.
+        """
+        fromordinal = date.fromordinal
+        header = HEADER.unpack_from
+        room_record = ROOM.unpack_from
+        number_record = NUMBER.unpack_from
+        employee_record = EMPLOYEE.unpack_from
+        stay_record = STAY.unpack_from
+        state_record = ROOM_STATE.unpack_from
+        add_room, remove_room = hotel.add_room, hotel.remove_room
+        add_employee, remove_employee = hotel.add_employee, hotel.remove_employee
+        reserve, cancel_reservation = hotel.reserve, hotel.cancel_reservation
+        check_in, check_out = hotel.check_in, hotel.check_out
+        set_room_state, update_employee = hotel.set_room_state, hotel.update_employee
+        displace_reservation = hotel.displace_reservation
+        size = len(data)
+        position = 0
+        while position + 5 <= size:
+            code, length = header(data, position)
+            start = position + 5
+            end = start + length
+            if end > size:
+                break
+            if code == 6:
+                _, room_number, arrival, departure = stay_record(data, start)
+                guest_name, _ = _unpack_text(data, start + 24)
+                check_in(room_number, guest_name, fromordinal(departure), fromordinal(arrival))
+            elif code == 7:
+                _, room_number, _, departure = stay_record(data, start)
+                check_out(room_number, fromordinal(departure))
+            elif code == 0:
+                room_number, type_code, state_code, price = room_record(data, start)
+                add_room(Room(ROOM_TYPES[type_code], room_number, ROOM_STATES[state_code], price))
+            elif code == 1:
+                remove_room(number_record(data, start)[0])
+            elif code == 2:
+                emp_id, salary = employee_record(data, start)
+                name, offset = _unpack_text(data, start + 16)
+                position_name, _ = _unpack_text(data, offset)
+                add_employee(Employee(emp_id, name, position_name, salary))
+            elif code == 3:
+                remove_employee(number_record(data, start)[0])
+            elif code == 4:
+                _, room_number, arrival, departure = stay_record(data, start)
+                guest_name, _ = _unpack_text(data, start + 24)
+                reserve(room_number, guest_name, fromordinal(arrival), fromordinal(departure))
+            elif code == 5:
+                cancel_reservation(number_record(data, start)[0])
+            elif code == 8:
+                room_number, state_code = state_record(data, start)
+                set_room_state(room_number, ROOM_STATES[state_code])
+            elif code == 9:
+                emp_id, salary = employee_record(data, start)
+                _, offset = _unpack_text(data, start + 16)
+                update_employee(emp_id, _unpack_text(data, offset)[0], salary)
+            elif code == 10:
+                displace_reservation(number_record(data, start)[0])
+            position = end
+        return position
+
+    def _load_snapshot(self, hotel) -> int:
+        if not os.path.exists(self.snapshot_path):
+            return 0
+        with open(self.snapshot_path, "rb") as file:
+            data = file.read()
+        magic = data[:8]
+        if magic == SNAPSHOT_MAGIC:
+            _, offset, room_count, employee_count, reservation_count, next_id = SNAPSHOT_HEADER.unpack_from(data, 0)
+            position = SNAPSHOT_HEADER.size
+        elif magic == OLD_SNAPSHOT_MAGIC:
+            _, offset, room_count, employee_count, reservation_count = OLD_SNAPSHOT_HEADER.unpack_from(data, 0)
+            next_id = None
+            position = OLD_SNAPSHOT_HEADER.size
+        else:
+            raise ValueError(f"{self.snapshot_path} is not a hotel snapshot.")
+        end = position + room_count * ROOM.size
+        for room_number, type_code, state_code, price in ROOM.iter_unpack(data[position:end]):
+            hotel.add_room(Room(ROOM_TYPES[type_code], room_number, ROOM_STATES[state_code], price))
+        position = end
+        for _ in range(employee_count):
+            emp_id, salary = EMPLOYEE.unpack_from(data, position)
+            name, position = _unpack_text(data, position + EMPLOYEE.size)
+            position_name, position = _unpack_text(data, position)
+            hotel.add_employee(Employee(emp_id, name, position_name, salary))
+        fromordinal = date.fromordinal
+        for _ in range(reservation_count):
+            reservation_id, room_number, arrival, departure, status = SNAPSHOT_RESERVATION.unpack_from(data, position)
+            guest_name, position = _unpack_text(data, position + SNAPSHOT_RESERVATION.size)
+            hotel.restore_reservation(Reservation(reservation_id, room_number, guest_name, fromordinal(arrival),
+                                                  fromordinal(departure), STATUSES[status]))
+        if next_id is not None:
+            # Stays dropped with their room are not in the snapshot, but their IDs stay used.
+            hotel.bookings.rewind(next_id)
+        return offset
+
+    @staticmethod
+    def _encode_room(room: Room) -> bytes:
+        return ROOM.pack(room.room_number, TYPE_CODES[HotelRoomType(room.room_type)],
+                         STATE_CODES[room.room_state], room.room_price)
+
+    @staticmethod
+    def _encode_employee(employee: Employee) -> bytes:
+        return (EMPLOYEE.pack(employee.get_emp_id(), employee.get_salary())
+                + _pack_text(employee.get_name()) + _pack_text(employee.get_position()))
+
+    @staticmethod
+    def _encode_stay(reservation: Reservation) -> bytes:
+        return STAY.pack(reservation.reservation_id, reservation.room_number, reservation.arrival.toordinal(),
+                         reservation.departure.toordinal()) + _pack_text(reservation.guest_name)
+
+
+def main():
+    # TESTING
+    import tempfile
+    from datetime import timedelta
+    from time import perf_counter
+    from Hotel import Hotel
+
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "hotel.log")
+    today = date.today()
+    day = timedelta(days=1)
+
+    def state(hotel):
+        return (sorted((room.room_number, room.room_state.value, room.room_price) for room in hotel.rooms),
+                sorted((employee.get_emp_id(), employee.get_position(), employee.get_salary())
+                       for employee in hotel.employees),
+                sorted((reservation.reservation_id, reservation.room_number, reservation.guest_name,
+                        reservation.arrival, reservation.departure, reservation.status)
+                       for reservation in hotel.bookings),
+                hotel.reservations)
+
+    print("=================================================================")
+    print("Test Case 1: Replay the Log into a New Hotel.")
+    print("=================================================================")
+    hotel = Hotel("Grand Hotel")
+    log = EventLog(path, snapshot_every=0)
+    log.attach(hotel)
+    for number in range(101, 106):
+        hotel.add_room(Room(HotelRoomType.DOBLE, number, "Desocupada", number))
+    hotel.add_employee(Employee(1, "John Doe", "Receptionist", 30000))
+    hotel.add_employee(Employee(2, "Jane Roe", "Housekeeper", 25000))
+    hotel.update_employee(2, "Supervisor", 28000)
+    hotel.remove_employee(1)
+    hotel.check_in(101, "Alice")
+    hotel.check_in(102, "Bob", today + 3 * day)
+    hotel.check_out(102, today + day)
+    hotel.set_room_state(102, "Sucia")
+    hotel.set_room_state(102, "Limpiando")
+    hotel.reserve(103, "Carol", today + 2 * day, today + 4 * day)
+    hotel.cancel_reservation(hotel.reserve(104, "Dave", today, today + day).reservation_id)
+    hotel.remove_room(105)
+    log.close()
+
+    replayed = Hotel("Grand Hotel")
+    log = EventLog(path, snapshot_every=0)
+    log.attach(replayed)
+
+    if state(replayed) == state(hotel):
+        print("Test PASS. The replayed hotel matches the original one.")
+    else:
+        print("Test FAIL. Check the methods __call__() and replay().")
+
+    print("=================================================================")
+    print("Test Case 2: Restore from a Snapshot and the Log Tail.")
+    print("=================================================================")
+    log.snapshot()
+    replayed.check_in(103, "Carol", on=today + 2 * day)
+    replayed.add_room(Room(HotelRoomType.SUITE, 106, "Desocupada", 300))
+    log.close()
+    with open(path, "ab") as file:
+        file.write(HEADER.pack(0, ROOM.size) + b"\x00\x01")
+
+    restored = Hotel("Grand Hotel")
+    log = EventLog(path, snapshot_every=0)
+    log.attach(restored)
+    restored.check_out(103, today + 3 * day)
+    replayed.check_out(103, today + 3 * day)
+    log.close()
+
+    final = Hotel("Grand Hotel")
+    log = EventLog(path, snapshot_every=0)
+    log.attach(final)
+    log.close()
+    if state(restored) == state(replayed) and state(final) == state(replayed):
+        print("Test PASS. Snapshot plus tail replay restores the hotel, ignoring a torn record.")
+    else:
+        print("Test FAIL. Check the methods snapshot() and restore().")
+
+    print("=================================================================")
+    print("Test Case 3: Keep Reservation IDs across a Snapshot.")
+    print("=================================================================")
+    path = os.path.join(directory, "ids.log")
+    hotel = Hotel("Grand Hotel")
+    log = EventLog(path, snapshot_every=0)
+    log.attach(hotel)
+    hotel.add_room(Room(HotelRoomType.DOBLE, 101, "Desocupada", 100))
+    hotel.add_room(Room(HotelRoomType.DOBLE, 102, "Desocupada", 100))
+    hotel.check_in(101, "Alice")
+    hotel.remove_room(101)
+    log.snapshot()
+    hotel.reserve(102, "Bob", today + day, today + 2 * day)
+    hotel.cancel_reservation(hotel.reserve(102, "Carol", today + 3 * day, today + 4 * day).reservation_id)
+    log.close()
+
+    restored = Hotel("Grand Hotel")
+    log = EventLog(path, snapshot_every=0)
+    log.attach(restored)
+    log.close()
+
+    if (state(restored) == state(hotel) and restored.bookings.get(3).status == "Cancelada"
+            and restored.reserve(102, "Dave", today, today + day).reservation_id == 4):
+        print("Test PASS. The tail replays with the reservation IDs of the original hotel.")
+    else:
+        print("Test FAIL. Check the next reservation ID in snapshot() and restore().")
+
+    print("=================================================================")
+    print("Test Case 4: Replay the Events of a Transaction.")
+    print("=================================================================")
+    path = os.path.join(directory, "transaction.log")
+    hotel = Hotel("Grand Hotel")
+    log = EventLog(path, snapshot_every=0)
+    log.attach(hotel)
+    for number in (101, 102, 103):
+        hotel.add_room(Room(HotelRoomType.DOBLE, number, "Desocupada", 100))
+    hotel.check_in(103, "Alice")
+    with hotel.transaction():
+        hotel.set_room_state(101, "Sucia")
+        hotel.set_room_state(101, "Limpiando")
+        hotel.check_in(102, "Bob", today + 3 * day)
+        hotel.check_out(102, today)
+    hotel.move_guest(103, 102, "Fuera de servicio")
+    log.close()
+
+    replayed = Hotel("Grand Hotel")
+    log = EventLog(path, snapshot_every=0)
+    log.attach(replayed)
+    log.close()
+
+    if state(replayed) == state(hotel) and replayed.find_room(101).room_state == "Limpiando":
+        print("Test PASS. Each event is logged as it happened, not as the transaction left it.")
+    else:
+        print("Test FAIL. Check the events held back by Hotel.transaction().")
+
+    print("=================================================================")
+    print("Test Case 5: Replay Throughput.")
+    print("=================================================================")
+    source = Hotel("Big Hotel")
+    for number in range(1000):
+        source.add_room(Room(HotelRoomType.DOBLE, number, "Desocupada", 100))
+    records = [EventLog._encode_room(room) for room in source.rooms]
+    data = b"".join(HEADER.pack(0, len(record)) + record for record in records)
+    for number in range(1000):
+        source.check_in(number, "Guest")
+        stay = source.current_stay(number)
+        record = EventLog._encode_stay(stay)
+        data += HEADER.pack(6, len(record)) + record
+        source.check_out(number)
+        record = EventLog._encode_stay(stay)
+        data += HEADER.pack(7, len(record)) + record
+    data = data * 100
+    events = 3000 * 100
+    target = Hotel("Big Hotel")
+    start = perf_counter()
+    EventLog(path).replay(target, data)
+    elapsed = perf_counter() - start
+    print(f"Test INFO. Replayed {events} events at {events / elapsed:,.0f} events/s.")
+    if len(target.rooms) == 1000 and len(target.bookings) == 1000 * 100:
+        print("Test PASS. All the events have been replayed.")
+    else:
+        print("Test FAIL. Check the method replay().")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,406 @@
+from bisect import bisect_left
+from datetime import date
+from math import exp, lgamma, log
+from random import Random
+from Roomstate import RoomState
+from Roomtype import HotelRoomType
+
+class DemandForecast:
+    """Python class to implement a no-show and cancellation forecast for overbooking.
+
+    The forecast learns, per room type, from the reservations whose arrival day has
+    passed: the share of them cancelled, the share of the rest never checked in (no-shows)
+    and the mean number of arrivals per night. From those rates it simulates the nights of
+    a type and recommends the number of extra bookings that maximizes the expected revenue,
+    as long as the chance of turning a guest away stays below a limit.
+
+    A simulated night takes the booking requests of the learnt demand, up to the capacity,
+    plus the extra bookings: overbooked walk-ins, who are at the hotel when admitted. Every
+    scenario draws the number of booked guests who show up. The scenarios share one sorted
+    set of uniform draws: the number of scenarios in which at most s guests show up is a
+    binary search of the CDF value of s in the draws, so all the scenarios of a booking
+    level are evaluated at once and every level is compared on the same draws.
+
+    Syntax
+    ------
+    obj = DemandForecast(hotel, today)
+
+    Parameters
+    ----------
+    [in] hotel : Hotel
+        The hotel whose reservation history is learnt.
+    [in] today : date
+        The day the history ends. Defaults to today.
+
+    Returns
+    -------
+    obj : DemandForecast
+        Python object output parameter that represents an instance of the class DemandForecast.
+
+    Attributes
+    ----------
+    rates : dict
+        By HotelRoomType, a dictionary with the observed "bookings", "cancellation_rate",
+        "no_show_rate", "show_rate" and "arrivals_per_night".
+    """
+
+    def __init__(self, hotel, today: date = None):
+        self._hotel = hotel
+        self.rates = {}
+        self.learn(today)
+
+    def learn(self, today: date = None) -> dict:
+        """Learn the rates again from the current reservation history.
+
+        Parameters
+        ----------
+        today : date, optional
+            The day the history ends. Defaults to today.
+
+        Returns
+        -------
+        dict
+            The rates by HotelRoomType.
+        """
+        today = today or date.today()
+        hotel = self._hotel
+        counts = {}
+        for reservation in hotel.bookings:
+            room = hotel.find_room(reservation.room_number)
+            if room is None or reservation.arrival >= today:
+                continue
+            room_type = HotelRoomType(room.room_type)
+            count = counts.get(room_type)
+            if count is None:
+                count = counts[room_type] = {"bookings": 0, "cancelled": 0, "no_shows": 0, "nights": set()}
+            count["bookings"] += 1
+            if reservation.status == "Cancelada":
+                count["cancelled"] += 1
+            else:
+                count["nights"].add(reservation.arrival)
+                if reservation.status in ("Confirmada", "Desplazada"):
+                    count["no_shows"] += 1
+        self.rates = {}
+        for room_type, count in counts.items():
+            kept = count["bookings"] - count["cancelled"]
+            cancellation_rate = count["cancelled"] / count["bookings"]
+            no_show_rate = count["no_shows"] / kept if kept else 0.0
+            self.rates[room_type] = {
+                "bookings": count["bookings"], "cancellation_rate": cancellation_rate, "no_show_rate": no_show_rate,
+                "show_rate": (1 - cancellation_rate) * (1 - no_show_rate),
+                "arrivals_per_night": kept / len(count["nights"]) if count["nights"] else 0.0}
+        return self.rates
+
+    @staticmethod
+    def simulate(capacity: int, bookings: int, show_rate: float, draws: list, room_rate: float = 100.0,
+                 walk_cost: float = 300.0, walk_ins: int = 0, demand: float = None) -> dict:
+        """Simulate the nights of a room type with a number of bookings.
+
+        Parameters
+        ----------
+        capacity : int
+            Rooms of the type.
+        bookings : int
+            Bookings accepted for the night, or the most accepted if demand is given.
+        show_rate : float
+            Chance that a booking ends up in a stay.
+        draws : list
+            Sorted uniform draws, one per scenario.
+        room_rate : float, optional
+            Revenue of an occupied room. Defaults to 100.
+        walk_cost : float, optional
+            Cost of a guest turned away for lack of rooms. Defaults to 300.
+        walk_ins : int, optional
+            Guests admitted at the hotel on top of the bookings, who always stay. Defaults to 0.
+        demand : float, optional
+            Mean number of booking requests per night, Poisson distributed. By default
+            every booking is taken.
+
+        Returns
+        -------
+        dict
+            Expected "revenue", "occupied" rooms and "walked" guests, and the chance of
+            walking at least one guest, "walk_probability".
+        """
+        scenarios = len(draws)
+        revenue = occupied = walked = walked_scenarios = 0.0
+        cumulative = 0.0
+        below = 0
+        for shows, probability in enumerate(DemandForecast._shows(bookings, show_rate, demand)):
+            cumulative += probability
+            # Scenarios whose draw falls in this step of the CDF see exactly this many guests.
+            reached = bisect_left(draws, cumulative) if shows < bookings else scenarios
+            hits = reached - below
+            below = reached
+            if hits:
+                guests = shows + walk_ins
+                rooms = min(guests, capacity)
+                extra = guests - rooms
+                occupied += hits * rooms
+                walked += hits * extra
+                revenue += hits * (rooms * room_rate - extra * walk_cost)
+                if extra:
+                    walked_scenarios += hits
+        return {"revenue": revenue / scenarios, "occupied": occupied / scenarios, "walked": walked / scenarios,
+                "walk_probability": walked_scenarios / scenarios}
+
+    @staticmethod
+    def _shows(bookings: int, show_rate: float, demand: float = None) -> list:
+        # Chance of each number of guests showing up, a binomial of the bookings taken,
+        # mixed over the Poisson requests if a demand is given. Logarithms keep large
+        # counts from underflowing.
+        if demand is None:
+            taken = [(bookings, 1.0)]
+        else:
+            taken = []
+            tail = 1.0
+            for count in range(bookings):
+                weight = exp(count * log(demand) - demand - lgamma(count + 1)) if demand > 0 else float(count == 0)
+                tail -= weight
+                taken.append((count, weight))
+            # Requests beyond the most accepted are refused.
+            taken.append((bookings, max(tail, 0.0)))
+        chances = [0.0] * (bookings + 1)
+        for count, weight in taken:
+            if weight < 1e-15:
+                continue
+            if show_rate >= 1 or show_rate <= 0:
+                chances[count if show_rate >= 1 else 0] += weight
+                continue
+            base = log(weight) + lgamma(count + 1) + count * log(1 - show_rate)
+            ratio = log(show_rate) - log(1 - show_rate)
+            for shows in range(count + 1):
+                chances[shows] += exp(base + shows * ratio - lgamma(shows + 1) - lgamma(count - shows + 1))
+        return chances
+
+    def recommend(self, scenarios: int = 100000, max_walk_probability: float = 0.05, room_rates: dict = None,
+                  walk_cost: float = 300.0, max_extra: int = None, seed: int = None) -> dict:
+        """Recommend how many bookings beyond capacity to accept per room type.
+
+        The capacity of a type is its rooms not out of service. Each night is booked up to
+        the capacity by the learnt demand, the arrivals per night before cancellations,
+        and the extra bookings are walk-ins admitted on top. Levels from no extra bookings
+        up are simulated until adding one no longer raises the expected revenue or the
+        chance of walking a guest goes over the limit.
+
+        Parameters
+        ----------
+        scenarios : int, optional
+            Scenarios simulated per booking level. Defaults to 100000.
+        max_walk_probability : float, optional
+            Highest accepted chance of turning a guest away on a night. Defaults to 0.05.
+        room_rates : dict, optional
+            Revenue of an occupied room by HotelRoomType. Defaults to the mean price of the type.
+        walk_cost : float, optional
+            Cost of a guest turned away. Defaults to 300.
+        max_extra : int, optional
+            Most extra bookings considered per type. Defaults to the capacity.
+        seed : int, optional
+            Seed of the draws, for repeatable recommendations.
+
+        Returns
+        -------
+        dict
+            Extra bookings to accept by HotelRoomType.
+        """
+        generator = Random(seed)
+        draws = sorted(generator.random() for _ in range(scenarios))
+        hotel = self._hotel
+        limits = {}
+        for room_type, rates in self.rates.items():
+            rooms = [room for room in hotel.rooms_by_type(room_type) if room.room_state is not RoomState.FUERA_DE_SERVICIO]
+            capacity = len(rooms)
+            if not capacity:
+                continue
+            if room_rates and room_type in room_rates:
+                room_rate = room_rates[room_type]
+            else:
+                room_rate = sum(room.room_price for room in rooms) / capacity
+            kept = 1 - rates["cancellation_rate"]
+            demand = rates["arrivals_per_night"] / kept if kept else 0.0
+            best = self.simulate(capacity, capacity, rates["show_rate"], draws, room_rate, walk_cost, demand=demand)
+            extra = 0
+            for level in range(1, (capacity if max_extra is None else max_extra) + 1):
+                result = self.simulate(capacity, capacity, rates["show_rate"], draws, room_rate, walk_cost,
+                                       walk_ins=level, demand=demand)
+                if result["walk_probability"] > max_walk_probability or result["revenue"] <= best["revenue"]:
+                    break
+                best = result
+                extra = level
+            limits[room_type] = extra
+        return limits
+
+
+class OverbookingPolicy:
+    """Python class to implement the admission of overbooked walk-ins for Hotel.check_in().
+
+    Set as hotel.admission, it lets walk-ins take rooms held by pending reservations that
+    cannot be moved elsewhere, up to the extra bookings allowed for the room type on each
+    night, e.g. those recommended by DemandForecast.recommend(). Each displaced reservation
+    counts on every night it covers, and an admission is refused unless all of them fit.
+
+    Syntax
+    ------
+    obj = OverbookingPolicy(limits)
+
+    Parameters
+    ----------
+    [in] limits : dict
+        Extra bookings allowed per night by HotelRoomType.
+
+    Returns
+    -------
+    obj : OverbookingPolicy
+        Python object output parameter that represents an instance of the class OverbookingPolicy.
+
+    Attributes
+    ----------
+    limits : dict
+        Extra bookings allowed per night by HotelRoomType.
+    used : dict
+        Extra bookings admitted by (HotelRoomType, night).
+    """
+
+    def __init__(self, limits: dict):
+        self.limits = {HotelRoomType(room_type): extra for room_type, extra in limits.items()}
+        self.used = {}
+
+    def __call__(self, room_type: HotelRoomType, nights: dict) -> bool:
+        room_type = HotelRoomType(room_type)
+        limit = self.limits.get(room_type, 0)
+        # Every night must fit before any is charged, so a refusal uses nothing.
+        if any(self.used.get((room_type, night), 0) + count > limit for night, count in nights.items()):
+            return False
+        for night, count in nights.items():
+            self.used[(room_type, night)] = self.used.get((room_type, night), 0) + count
+        return True
+
+
+def main():
+    # TESTING
+    from datetime import timedelta
+    from time import perf_counter
+    from Hotel import Hotel
+    from Room import Room
+
+    today = date(2030, 3, 1)
+    day = timedelta(days=1)
+    hotel = Hotel("Grand Hotel")
+    for number in range(1, 21):
+        hotel.add_room(Room(HotelRoomType.DOBLE, number, "Desocupada", 100))
+    hotel.add_room(Room(HotelRoomType.SUITE, 100, "Desocupada", 400))
+    generator = Random(3)
+    for offset in range(60, 0, -1):
+        night = today - offset * day
+        for number in range(1, 21):
+            reservation = hotel.reserve(number, f"Guest {offset}-{number}", night, night + day)
+            draw = generator.random()
+            if draw < 0.1:
+                hotel.cancel_reservation(reservation.reservation_id)
+            elif draw < 0.25:
+                continue
+            else:
+                hotel.check_in(number, reservation.guest_name, on=night)
+                hotel.check_out(number, night + day)
+
+    print("=================================================================")
+    print("Test Case 1: Learn Rates from the History.")
+    print("=================================================================")
+    forecast = DemandForecast(hotel, today)
+    rates = forecast.rates[HotelRoomType.DOBLE]
+
+    if (rates["bookings"] == 1200 and 0.07 < rates["cancellation_rate"] < 0.13
+            and 0.13 < rates["no_show_rate"] < 0.2 and 17 < rates["arrivals_per_night"] < 19
+            and HotelRoomType.SUITE not in forecast.rates):
+        print("Test PASS. Cancellation and no-show rates have been learnt per room type.")
+    else:
+        print("Test FAIL. Check the method learn().")
+
+    print("=================================================================")
+    print("Test Case 2: Simulate and Recommend.")
+    print("=================================================================")
+    generator = Random(1)
+    draws = sorted(generator.random() for _ in range(100000))
+    exact = DemandForecast.simulate(20, 20, 1.0, draws)
+    start = perf_counter()
+    limits = forecast.recommend(seed=1)
+    elapsed = perf_counter() - start
+    safe = forecast.recommend(seed=1, max_walk_probability=0.0)
+
+    if (exact["revenue"] == 2000 and exact["walk_probability"] == 0 and 0 < limits[HotelRoomType.DOBLE] <= 5
+            and safe[HotelRoomType.DOBLE] == 0):
+        print(f"Test PASS. Accept {limits[HotelRoomType.DOBLE]} extra Doble bookings per night, "
+              f"found over 100,000 scenarios per level in {elapsed * 1000:.0f} ms.")
+    else:
+        print("Test FAIL. Check the methods simulate() and recommend().")
+
+    print("=================================================================")
+    print("Test Case 3: Admission of Overbooked Walk-Ins.")
+    print("=================================================================")
+    for number in range(1, 21):
+        hotel.reserve(number, f"Booked {number}", today, today + 2 * day)
+    refused = hotel.check_in(1, "Walk-in 0", on=today)
+    hotel.admission = OverbookingPolicy({HotelRoomType.DOBLE: 1})
+    admitted = hotel.check_in(1, "Walk-in 1", on=today)
+    over = hotel.check_in(2, "Walk-in 2", on=today)
+    hotel.cancel_reservation(hotel.bookings.find(4, today).reservation_id)
+    moved = hotel.check_in(5, "Walk-in 3", on=today)
+    booked = hotel.bookings.find(4, today)
+    displaced = [reservation.guest_name for reservation in hotel.bookings if reservation.status == "Desplazada"]
+    # The displaced guest arrives and takes the room of a guest who has not arrived yet.
+    arrived = hotel.check_in(1, "Booked 1", on=today)
+
+    if (refused == "Room not available or already occupied." and admitted == "Check-in successful for Walk-in 1 in room 1."
+            and over == "Room not available or already occupied." and moved == "Check-in successful for Walk-in 3 in room 5."
+            and booked.guest_name == "Booked 5" and displaced == ["Booked 1"]
+            and arrived.startswith("Check-in successful for Booked 1")
+            and len([reservation for reservation in hotel.bookings if reservation.status == "Desplazada"]) == 1
+            and hotel.admission.used == {(HotelRoomType.DOBLE, today): 1, (HotelRoomType.DOBLE, today + day): 1}):
+        print("Test PASS. Walk-ins move pending reservations and overbook within the recommended limit.")
+    else:
+        print("Test FAIL. Check the admission in Hotel.check_in().")
+
+    print("=================================================================")
+    print("Test Case 4: Walk Rate of the Recommended Limit.")
+    print("=================================================================")
+    from math import exp
+    hotel = Hotel("Grand Hotel")
+    for number in range(1, 21):
+        hotel.add_room(Room(HotelRoomType.DOBLE, number, "Desocupada", 100))
+    extra = limits[HotelRoomType.DOBLE]
+    hotel.admission = OverbookingPolicy(limits)
+    current = {}
+    # Moved reservations get a new ID, so the latest booking of each guest is followed.
+    hotel.subscribe(lambda event, obj: current.__setitem__(obj.guest_name, obj) if event == "reserve" else None)
+    demand = rates["arrivals_per_night"] / (1 - rates["cancellation_rate"])
+    generator = Random(7)
+    nights = 1000
+    walked = 0
+    for offset in range(nights):
+        night = today + (10 + offset) * day
+        requests, product = 0, generator.random()
+        while product > exp(-demand):
+            requests += 1
+            product *= generator.random()
+        booked = [hotel.reserve(number, f"Booked {offset}-{number}", night, night + day)
+                  for number in range(1, min(requests, 20) + 1)]
+        for reservation in booked:
+            if generator.random() < rates["cancellation_rate"]:
+                hotel.cancel_reservation(reservation.reservation_id)
+        guests = [reservation.guest_name for reservation in booked
+                  if reservation.status != "Cancelada" and generator.random() >= rates["no_show_rate"]]
+        # The overbooked walk-ins come first, and the booked guests are walked only if no room is left.
+        for number in range(1, extra + 1):
+            hotel.check_in(number, f"Walk-in {offset}-{number}", on=night)
+        results = [hotel.check_in(current[guest].room_number, guest, on=night) for guest in guests]
+        walked += any(result.startswith("No room available") for result in results)
+        for number in range(1, 21):
+            hotel.check_out(number, night + day)
+
+    if walked and walked / nights <= 0.05:
+        print(f"Test PASS. Guests walked on {walked / nights:.1%} of {nights} nights with {extra} extra bookings.")
+    else:
+        print(f"Test FAIL. Guests walked on {walked / nights:.1%} of the nights. Check the method recommend().")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+import asyncio
+import json
+from Commands import execute
+
+class FrontDeskServer:
+    """Python class to implement an asyncio front-desk service for a hotel.
+
+    The service speaks JSON lines over TCP: every request is one JSON object per line,
+    as accepted by Commands.execute(), and every response is one JSON object per line,
+    in request order. Clients may pipeline, sending many requests before reading the
+    responses. The server reads whatever has arrived, runs every complete request in the
+    buffer, and writes all their responses in a single write before waiting for more input.
+
+    Hotel operations are short and CPU-bound, so they run directly in the event loop.
+    A single loop serves every connection and no locking is needed.
+
+    Syntax
+    ------
+    obj = FrontDeskServer(hotel, host, port)
+
+    Parameters
+    ----------
+    [in] hotel : Hotel
+        The hotel the requests are applied to.
+    [in] host : str
+        Address to listen on. Defaults to "127.0.0.1".
+    [in] port : int
+        Port to listen on. 0 picks a free port. Defaults to 8765.
+
+    Returns
+    -------
+    obj : FrontDeskServer
+        Python object output parameter that represents an instance of the class FrontDeskServer.
+
+    Attributes
+    ----------
+    hotel : Hotel
+        The hotel the requests are applied to.
+    host : str
+        Address to listen on.
+    port : int
+        Port to listen on, updated with the actual port once started.
+    """
+
+    MAX_LINE = 1 << 20
+
+    def __init__(self, hotel, host: str = "127.0.0.1", port: int = 8765):
+        self.hotel = hotel
+        self.host = host
+        self.port = port
+        self._server = None
+
+    async def start(self):
+        """Start listening for connections."""
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        """Start listening, if needed, and serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        """Stop listening and wait for the server to close."""
+        self._server.close()
+        await self._server.wait_closed()
+
+    def handle_line(self, line: bytes) -> bytes:
+        """Run one request line and build its response line.
+
+        Parameters
+        ----------
+        line : bytes
+            A JSON object encoded in UTF-8, without the trailing newline.
+
+        Returns
+        -------
+        bytes
+            The JSON response followed by a newline.
+        """
+        try:
+            command = json.loads(line)
+        except ValueError:
+            response = {"ok": False, "error": "Invalid JSON."}
+        else:
+            if isinstance(command, dict):
+                response = execute(self.hotel, command)
+            else:
+                response = {"ok": False, "error": "A request must be a JSON object."}
+        return json.dumps(response).encode("utf-8") + b"\n"
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        pending = b""
+        try:
+            while True:
+                data = await reader.read(65536)
+                if not data:
+                    break
+                lines = (pending + data).split(b"\n")
+                pending = lines.pop()
+                if len(pending) > self.MAX_LINE:
+                    writer.write(b'{"ok": false, "error": "Request too long."}\n')
+                    break
+                writer.write(b"".join([self.handle_line(line) for line in lines if line.strip()]))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+def serve(hotel, host: str = "127.0.0.1", port: int = 8765):
+    """Run a FrontDeskServer for a hotel until interrupted.
+
+    Parameters
+    ----------
+    hotel : Hotel
+        The hotel the requests are applied to.
+    host : str, optional
+        Address to listen on. Defaults to "127.0.0.1".
+    port : int, optional
+        Port to listen on. Defaults to 8765.
+    """
+    try:
+        asyncio.run(FrontDeskServer(hotel, host, port).serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+def main():
+    # TESTING
+    from time import perf_counter
+    from Hotel import Hotel
+
+    async def client(port: int, requests: list) -> list:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"".join(json.dumps(request).encode("utf-8") + b"\n" for request in requests))
+        await writer.drain()
+        responses = [json.loads(await reader.readline()) for _ in requests]
+        writer.close()
+        await writer.wait_closed()
+        return responses
+
+    async def scenario():
+        hotel = Hotel("Grand Hotel")
+        server = FrontDeskServer(hotel, port=0)
+        await server.start()
+
+        print("=================================================================")
+        print("Test Case 1: Pipelined Requests on One Connection.")
+        print("=================================================================")
+        requests = [{"op": "add_room", "room_type": "Doble", "room_number": number, "room_price": 100}
+                    for number in range(100)]
+        requests += [{"op": "check_in", "room_number": 7, "guest_name": "Alice"},
+                     {"op": "check_in", "room_number": 7, "guest_name": "Bob"},
+                     {"op": "unknown"}]
+        responses = await client(server.port, requests)
+
+        if (len(responses) == 103 and responses[100]["result"] == "Check-in successful for Alice in room 7."
+                and responses[101] == {"ok": False, "error": "Room not available or already occupied."}
+                and not responses[102]["ok"] and len(hotel.rooms) == 100):
+            print("Test PASS. Pipelined responses arrive in request order.")
+        else:
+            print("Test FAIL. Check the method _handle_client().")
+
+        print("=================================================================")
+        print("Test Case 2: Concurrent Clients.")
+        print("=================================================================")
+        batches = [[{"op": "check_in", "room_number": number, "guest_name": f"Guest {worker}"}
+                    for number in range(100)] + [{"op": "find_room", "room_number": 0}] * 1000
+                   for worker in range(10)]
+        start = perf_counter()
+        results = await asyncio.gather(*(client(server.port, batch) for batch in batches))
+        elapsed = perf_counter() - start
+        successes = sum(response["ok"]
+                        for responses in results for response in responses[:100])
+
+        if successes == 99 and len(hotel.reservations) == 100:
+            print("Test PASS. Every room has been checked in exactly once across clients.")
+        else:
+            print("Test FAIL. Check the method _handle_client() with concurrent clients.")
+        requests = sum(len(batch) for batch in batches)
+        print(f"Test INFO. Served {requests} requests at {requests / elapsed:,.0f} requests/s.")
+        await server.close()
+
+    asyncio.run(scenario())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,330 @@
+from collections import Counter
+
+def normalize(name: str) -> str:
+    """Get the form of a guest name used as key: lower case, single spaces."""
+    return " ".join(name.casefold().split())
+
+def trigrams(name: str) -> set:
+    """Get the trigrams of a normalized name, padded so short names have some."""
+    padded = f"  {name} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class Guest:
+    """Python class to implement a guest of the directory.
+
+    Syntax
+    ------
+    obj = Guest(guest_id, name)
+
+    Parameters
+    ----------
+    [in] guest_id : int
+        The ID of the guest.
+    [in] name : str
+        The name of the guest, as first seen.
+
+    Returns
+    -------
+    obj : Guest
+        Python object output parameter that represents an instance of the class Guest.
+
+    Attributes
+    ----------
+    guest_id : int
+        The ID of the guest.
+    name : str
+        The name of the guest.
+    stays : dict
+        The Reservation instances of the guest by reservation ID, oldest first.
+    """
+
+    __slots__ = ("guest_id", "name", "stays")
+
+    def __init__(self, guest_id: int, name: str):
+        self.guest_id = guest_id
+        self.name = name
+        self.stays = {}
+
+    def current_rooms(self) -> list:
+        """Get the numbers of the rooms the guest is checked in to."""
+        return [stay.room_number for stay in self.stays.values() if stay.status == "En curso"]
+
+    def past_rooms(self) -> list:
+        """Get the numbers of the rooms of the finished stays of the guest, oldest first."""
+        return [stay.room_number for stay in self.stays.values() if stay.status == "Finalizada"]
+
+
+class GuestDirectory:
+    """Python class to implement a registry of the guests of a hotel.
+
+    Every distinct name, compared without case and extra spaces, gets a guest ID. Names
+    are indexed twice: a trie over the words of each name answers prefix searches, so
+    "smi" finds "John Smith", and an inverted index of trigrams answers typo-tolerant
+    searches by ranking the guests that share the most trigrams with the query. Each guest
+    keeps its stays, so the rooms of a guest are found without scanning reservations.
+
+    Attached to a hotel, the directory indexes its existing bookings and follows its
+    reserve and check_in events.
+
+    Syntax
+    ------
+    obj = GuestDirectory(hotel)
+
+    Parameters
+    ----------
+    [in] hotel : Hotel, optional
+        The hotel to follow.
+
+    Returns
+    -------
+    obj : GuestDirectory
+        Python object output parameter that represents an instance of the class GuestDirectory.
+    """
+
+    def __init__(self, hotel=None):
+        self._guests = []
+        self._ids = {}
+        self._trie = {}
+        self._trigrams = {}
+        self._sizes = []
+        self._hotel = hotel
+        if hotel is not None:
+            for reservation in hotel.bookings:
+                self.add_stay(reservation)
+            hotel.subscribe(self)
+
+    def __len__(self) -> int:
+        return len(self._guests)
+
+    def close(self):
+        """Stop following the hotel."""
+        if self._hotel is not None:
+            self._hotel.unsubscribe(self)
+
+    def __call__(self, event: str, obj):
+        if event in ("reserve", "check_in"):
+            # Events of a transaction carry a copy; the live reservation is kept if there is one.
+            self.add_stay(self._hotel.bookings.get(obj.reservation_id) or obj)
+
+    def register(self, name: str) -> int:
+        """Get the ID of a guest, registering the guest if the name is new.
+
+        Parameters
+        ----------
+        name : str
+            The name of the guest.
+
+        Returns
+        -------
+        int
+            The ID of the guest.
+        """
+        key = normalize(name)
+        guest_id = self._ids.get(key)
+        if guest_id is None:
+            guest_id = len(self._guests)
+            self._ids[key] = guest_id
+            self._guests.append(Guest(guest_id, name))
+            for word in set(key.split()):
+                node = self._trie
+                for char in word:
+                    node = node.setdefault(char, {})
+                node.setdefault(None, []).append(guest_id)
+            grams = trigrams(key)
+            self._sizes.append(len(grams))
+            for trigram in grams:
+                self._trigrams.setdefault(trigram, []).append(guest_id)
+        return guest_id
+
+    def add_stay(self, reservation):
+        """Index a reservation under its guest.
+
+        Parameters
+        ----------
+        reservation : Reservation
+            The Reservation instance to index.
+        """
+        guest = self._guests[self.register(reservation.guest_name)]
+        guest.stays[reservation.reservation_id] = reservation
+
+    def guest(self, guest_id: int):
+        """Get a guest by ID.
+
+        Parameters
+        ----------
+        guest_id : int
+            The ID of the guest.
+
+        Returns
+        -------
+        Guest or None
+            The Guest instance, None if the ID is unknown.
+        """
+        return self._guests[guest_id] if 0 <= guest_id < len(self._guests) else None
+
+    def find(self, name: str):
+        """Get a guest by exact name, ignoring case and extra spaces.
+
+        Parameters
+        ----------
+        name : str
+            The name of the guest.
+
+        Returns
+        -------
+        Guest or None
+            The Guest instance, None if no guest has that name.
+        """
+        guest_id = self._ids.get(normalize(name))
+        return self._guests[guest_id] if guest_id is not None else None
+
+    def search_prefix(self, prefix: str, limit: int = 10) -> list:
+        """Get the guests with a word of their name starting with a prefix, alphabetically.
+
+        Parameters
+        ----------
+        prefix : str
+            The start of a first name or surname.
+        limit : int, optional
+            Most guests returned. Defaults to 10.
+
+        Returns
+        -------
+        list
+            The matching Guest instances.
+        """
+        node = self._trie
+        for char in normalize(prefix):
+            node = node.get(char)
+            if node is None:
+                return []
+        found = {}
+        stack = [node]
+        while stack and len(found) < limit:
+            node = stack.pop()
+            for guest_id in node.get(None, ()):
+                found.setdefault(guest_id, None)
+            stack.extend(node[char] for char in sorted((char for char in node if char is not None), reverse=True))
+        return [self._guests[guest_id] for guest_id in list(found)[:limit]]
+
+    def search_fuzzy(self, name: str, limit: int = 10, threshold: float = 0.4) -> list:
+        """Get the guests whose name is similar to a possibly misspelt one, best first.
+
+        Similarity is the Dice coefficient of the trigram sets of both names.
+
+        Parameters
+        ----------
+        name : str
+            The name to look for.
+        limit : int, optional
+            Most guests returned. Defaults to 10.
+        threshold : float, optional
+            Lowest similarity returned, from 0 to 1. Defaults to 0.4.
+
+        Returns
+        -------
+        list
+            (similarity, Guest) tuples sorted by decreasing similarity.
+        """
+        query = trigrams(normalize(name))
+        shared = Counter()
+        for trigram in query:
+            shared.update(self._trigrams.get(trigram, ()))
+        sizes = self._sizes
+        size = len(query)
+        scored = [(2 * count / (size + sizes[guest_id]), guest_id) for guest_id, count in shared.items()]
+        scored = [item for item in scored if item[0] >= threshold]
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [(score, self._guests[guest_id]) for score, guest_id in scored[:limit]]
+
+    def rooms_of(self, name: str) -> list:
+        """Get the rooms a guest is checked in to.
+
+        Parameters
+        ----------
+        name : str
+            The name of the guest.
+
+        Returns
+        -------
+        list
+            The room numbers, empty if the guest is unknown or not staying.
+        """
+        guest = self.find(name)
+        return guest.current_rooms() if guest is not None else []
+
+
+def main():
+    # TESTING
+    from datetime import date, timedelta
+    from time import perf_counter
+    from Hotel import Hotel
+    from Room import Room
+    from Roomtype import HotelRoomType
+
+    monday = date(2030, 1, 7)
+    hotel = Hotel("Grand Hotel")
+    for number in range(101, 106):
+        hotel.add_room(Room(HotelRoomType.DOBLE, number, "Desocupada", 100))
+    hotel.reserve(101, "John Smith", monday - timedelta(days=10), monday - timedelta(days=8))
+    directory = GuestDirectory(hotel)
+    hotel.check_in(101, "John Smith", on=monday - timedelta(days=10))
+    hotel.check_out(101, on=monday - timedelta(days=8))
+    hotel.check_in(102, "john  smith", on=monday)
+    hotel.check_in(103, "Jane Smithers", on=monday)
+    hotel.check_in(104, "Alice Jones", on=monday)
+
+    print("=================================================================")
+    print("Test Case 1: Guests and Their Rooms.")
+    print("=================================================================")
+    guest = directory.find("JOHN SMITH")
+
+    if (len(directory) == 3 and guest.current_rooms() == [102] and guest.past_rooms() == [101]
+            and directory.rooms_of("Alice Jones") == [104] and directory.rooms_of("Nobody") == []):
+        print("Test PASS. Each guest has one ID with its current and past rooms.")
+    else:
+        print("Test FAIL. Check the methods register() and add_stay().")
+
+    print("=================================================================")
+    print("Test Case 2: Prefix and Fuzzy Search.")
+    print("=================================================================")
+    prefix = [guest.name for guest in directory.search_prefix("smi")]
+    fuzzy = directory.search_fuzzy("Jon Smiht")
+
+    if (prefix == ["John Smith", "Jane Smithers"] and directory.search_prefix("zz") == []
+            and fuzzy and fuzzy[0][1].name == "John Smith"):
+        print("Test PASS. Guests are found by word prefix and despite typos.")
+    else:
+        print("Test FAIL. Check the methods search_prefix() and search_fuzzy().")
+
+    print("=================================================================")
+    print("Test Case 3: Lookups with a Million Historical Stays.")
+    print("=================================================================")
+    from Reservation import Reservation
+    directory = GuestDirectory()
+    first_names = ["Ana", "Luis", "Marta", "Pedro", "Sofia", "Jorge", "Lucia", "Diego", "Elena", "Pablo"]
+    for stay in range(1000000):
+        guest = stay % 100000
+        name = f"{first_names[guest % 10]} Guest{guest // 10}"
+        directory.add_stay(Reservation(stay, stay % 5000, name, monday, monday + timedelta(days=1), "Finalizada"))
+    start = perf_counter()
+    for guest in range(0, 100000, 100):
+        found = directory.find(f"{first_names[guest % 10]} Guest{guest // 10}")
+        found.past_rooms()
+    exact = (perf_counter() - start) / 1000
+    start = perf_counter()
+    for guest in range(0, 1000):
+        directory.search_prefix(f"guest{guest}")
+    prefix = (perf_counter() - start) / 1000
+    start = perf_counter()
+    fuzzy = directory.search_fuzzy("Lucia Gueest1236")
+    print(f"Test INFO. Fuzzy search over 100,000 guests in {(perf_counter() - start) * 1000:.1f} ms.")
+
+    if (len(directory) == 100000 and len(found.stays) == 10 and exact < 0.001 and prefix < 0.001
+            and fuzzy[0][1].name == "Lucia Guest1236"):
+        print(f"Test PASS. Guest lookup {exact * 1e6:.1f} us, prefix search {prefix * 1e6:.1f} us.")
+    else:
+        print(f"Test FAIL. Guest lookup {exact * 1e6:.1f} us, prefix search {prefix * 1e6:.1f} us.")
+
+if __name__ == "__main__":
+    main()
@@ -1,247 +1,1082 @@
-from Room import Room
-from Employee import Employee
-
-class Hotel:
-    """
-    Python class to implement a comprehensive hotel management system.
-
-    This class encompasses functionalities for managing hotel rooms, employees, and guest reservations, 
-    providing a foundational system for hotel operations.
-
-    Syntax
-    ------
-    obj = Hotel(name)
-
-    Parameters
-    ----------
-    [in] name : str
-        The name of the hotel.
-
-    Returns
-    -------
-    obj : Hotel
-        An instance of the Hotel class, representing a single hotel with its management capabilities.
-
-    Attributes
-    ----------
-    name : str
-        The name of the hotel.
-    rooms : list
-        A list of Room instances representing the rooms available in the hotel.
-    employees : list
-        A list of Employee instances representing the employees working at the hotel.
-    reservations : dict
-        A dictionary mapping room numbers to guest names, representing current reservations.
-    """
-    def __init__(self, name: str):
-        self.name = name
-        self.rooms = []
-        self.employees = []
-        self.reservations = {}
-
-    def add_room(self, room: Room):
-        """Add a room to the hotel.
-
-        Parameters
-        ----------
-        room : Room
-            The Room instance to be added.
-        """
-        self.rooms.append(room)
-
-    def remove_room(self, room_number: int):
-        """Remove a room from the hotel.
-
-        Parameters
-        ----------
-        room_number : int
-            The number of the room to be removed.
-        """
-        for room in self.rooms:
-            if room.room_number == room_number:
-                self.rooms.remove(room)
-                break
-
-    def add_employee(self, employee: Employee):
-        """Add an employee to the hotel.
-
-        Parameters
-        ----------
-        employee : Employee
-            The Employee instance to be added.
-        """
-        self.employees.append(employee)
-
-    def remove_employee(self, emp_id: int):
-        """Remove an employee from the hotel.
-
-        Parameters
-        ----------
-        emp_id : int
-            The ID of the employee to be removed.
-        """
-        for employee in self.employees:
-            if employee.get_emp_id() == emp_id:
-                self.employees.remove(employee)
-                break
-
-    def check_in(self, room_number: int, guest_name: str):
-        """Check-in a guest to a room.
-
-        Parameters
-        ----------
-        room_number : int
-            The number of the room to check-in the guest.
-        guest_name : str
-            The name of the guest to be checked-in.
-
-        Returns
-        -------
-        str
-            A message indicating the success or failure of the check-in operation.
-        """
-        room = self.find_room(room_number)
-        if room:
-            if room.is_occupied():
-                return "Room not available or already occupied."
-            else:
-                room.room_state = "Ocupada"  # Update the room state to "Ocupada"
-                self.reservations[room_number] = guest_name
-                return f"Check-in successful for {guest_name} in room {room_number}."
-        else:
-            return "Room not found."
-
-
-
-    def check_out(self, room_number: int):
-        """Check-out a guest from a room.
-
-        Parameters
-        ----------
-        room_number : int
-            The number of the room to check-out the guest from.
-
-        Returns
-        -------
-        str
-            A message indicating the success or failure of the check-out operation.
-        """
-        if room_number in self.reservations:
-            for room in self.rooms:
-                if room.room_number == room_number:
-                    room.check_out()
-                    guest_name = self.reservations.pop(room_number)
-                    return f"Check-out successful for {guest_name} from room {room_number}."
-        else:
-            return "No guest found in the specified room."
-
-    def find_room(self, room_number: int):
-        """Find a room by its number.
-
-        Parameters
-        ----------
-        room_number : int
-            The number of the room to find.
-
-        Returns
-        -------
-        Room or None
-            The Room instance if found, None otherwise.
-        """
-        for room in self.rooms:
-            if room.room_number == room_number:
-                return room
-        return None
-
-
-def main():
-    # TESTING
-    print("=================================================================")
-    print("Test Case 1: Create a Hotel.")
-    print("=================================================================")
-    hotel = Hotel("Grand Hotel")
-    if hotel.name == "Grand Hotel":
-        print("Test PASS. The parameter name has been correctly set.")
-    else:
-        print("Test FAIL. Check the method __init__().")
-
-    print("=================================================================")
-    print("Test Case 2: Add a Room to the Hotel.")
-    print("=================================================================")
-
-    room1 = Room("Doble", 101, "Desocupada", 150)
-    hotel.add_room(room1)
-
-    if hotel.rooms[0] == room1:
-        print("Test PASS. Room has been successfully added to the hotel.")
-    else:
-        print("Test FAIL. Check the method add_room().")
-
-    print("=================================================================")
-    print("Test Case 3: Remove a Room from the Hotel.")
-    print("=================================================================")
-
-    hotel.remove_room(101)
-    if len(hotel.rooms) == 0:
-        print("Test PASS. Room has been successfully removed from the hotel.")
-    else:
-        print("Test FAIL. Check the method remove_room().")
-
-    print("=================================================================")
-    print("Test Case 4: Add an Employee to the Hotel.")
-    print("=================================================================")
-
-    emp1 = Employee(1, "John Doe", "Receptionist", 30000)
-    hotel.add_employee(emp1)
-
-    if hotel.employees[0] == emp1:
-        print("Test PASS. Employee has been successfully added to the hotel.")
-    else:
-        print("Test FAIL. Check the method add_employee().")
-
-    print("=================================================================")
-    print("Test Case 5: Remove an Employee from the Hotel.")
-    print("=================================================================")
-
-    hotel.remove_employee(1)
-    if len(hotel.employees) == 0:
-        print("Test PASS. Employee has been successfully removed from the hotel.")
-    else:
-        print("Test FAIL. Check the method remove_employee().")
-
-    print("=================================================================")
-    print("Test Case 6: Check-in a Guest.")
-    print("=================================================================")
-
-    room2 = Room("Suite", 102, "Desocupada", 300)
-    hotel.add_room(room2)
-    check_in_result = hotel.check_in(102, "Alice")
-
-    if check_in_result == "Check-in successful for Alice in room 102." and room2.room_state == "Ocupada":
-        print("Test PASS. Check-in functionality has been implemented correctly.")
-    else:
-        print("Test FAIL. Check the method check_in().")
-
-    print("=================================================================")
-    print("Test Case 7: Check-out a Guest.")
-    print("=================================================================")
-
-    check_out_result = hotel.check_out(102)
-
-    if check_out_result == "Check-out successful for Alice from room 102." and room2.room_state == "Desocupada":
-        print("Test PASS. Check-out functionality has been implemented correctly.")
-    else:
-        print("Test FAIL. Check the method check_out().")
-
-    print("=================================================================")
-    print("Test Case 8: Attempt Check-in on an Occupied Room.")
-    print("=================================================================")
-
-    check_in_result = hotel.check_in(102, "Bob")
-    if check_in_result == "Room not available or already occupied.":
-        print("Test PASS. Check-in functionality has been implemented correctly.")
-    else:
-        print("Test FAIL. Check the method check_in().")
-
-if __name__ == "__main__":
-    main()
+from Room import Room
+from Employee import Employee
+from Roomtype import HotelRoomType
+from Roomstate import AVAILABLE_STATES, RoomState
+from Reservation import Reservation, ReservationBook
+from Transaction import Transaction
+from copy import copy
+from datetime import date, timedelta
+
+class Hotel:
+    """
+    Python class to implement a comprehensive hotel management system.
+
+    This class encompasses functionalities for managing hotel rooms, employees, and guest reservations, 
+    providing a foundational system for hotel operations.
+
+    Syntax
+    ------
+    obj = Hotel(name)
+
+    Parameters
+    ----------
+    [in] name : str
+        The name of the hotel.
+
+    Returns
+    -------
+    obj : Hotel
+        An instance of the Hotel class, representing a single hotel with its management capabilities.
+
+    Attributes
+    ----------
+    name : str
+        The name of the hotel.
+    rooms : list
+        A list of Room instances representing the rooms available in the hotel. Rooms are
+        indexed internally by number, type, floor and state, so lookups do not scan this list.
+    employees : list
+        A list of Employee instances representing the employees working at the hotel. Employees
+        are indexed internally by ID.
+    reservations : dict
+        A dictionary mapping room numbers to guest names, representing current reservations.
+    bookings : ReservationBook
+        The reservation engine holding the date-ranged stays of every room.
+    admission : callable
+        Overbooking policy consulted by check_in() for walk-ins on rooms held by pending
+        reservations, e.g. a Forecast.OverbookingPolicy. None, the default, refuses them.
+    """
+    def __init__(self, name: str):
+        self.name = name
+        self._rooms = {}
+        self._employees = {}
+        self._rooms_by_type = {}
+        self._rooms_by_state = {}
+        self._rooms_by_floor = {}
+        self.reservations = {}
+        self.bookings = ReservationBook()
+        self._stays = {}
+        self._listeners = []
+        self._queued = None
+        self._transaction = None
+        self.admission = None
+
+    @property
+    def rooms(self) -> list:
+        """List of the Room instances of the hotel, in insertion order."""
+        return list(self._rooms.values())
+
+    @property
+    def employees(self) -> list:
+        """List of the Employee instances of the hotel, in insertion order."""
+        return list(self._employees.values())
+
+    @property
+    def in_transaction(self) -> bool:
+        """True while a transaction() is open, when changes may still be rolled back."""
+        return self._transaction is not None
+
+    def subscribe(self, listener):
+        """Register a listener called after every mutation of the hotel.
+
+        The listener is called as listener(event, obj), where event is one of "add_room",
+        "remove_room", "room_state", "add_employee", "remove_employee", "update_employee",
+        "reserve", "cancel_reservation", "check_in" or "check_out", and obj is the Room, Employee or
+        Reservation concerned. Events raised by a listener are delivered once every listener
+        has seen the current one, so all listeners see the events in the same order. Events
+        raised inside a transaction() are delivered when it commits, except those of employees,
+        which are delivered at once.
+
+        Parameters
+        ----------
+        listener : callable
+            The callable to register.
+        """
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        """Unregister a listener added with subscribe().
+
+        Parameters
+        ----------
+        listener : callable
+            The callable to unregister.
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def transaction(self) -> Transaction:
+        """Open a transaction over room and reservation changes, used as a context manager.
+
+        The changes made inside the with block are applied all or nothing: they are kept
+        and their events delivered when the block ends, and undone, with their events
+        discarded, when it raises or Transaction.rollback() is called. Employee changes are
+        not part of the transaction: they are kept and notified at once. Transactions do not
+        nest.
+
+        Returns
+        -------
+        Transaction
+            The transaction, opened when the with block starts.
+        """
+        return Transaction(self)
+
+    def _begin(self, transaction: Transaction):
+        if self._transaction is not None:
+            raise RuntimeError("A transaction is already open.")
+        self._transaction = transaction
+
+    def _end(self, transaction: Transaction, events: list):
+        if self._transaction is transaction:
+            self._transaction = None
+        for event, obj in events:
+            self._notify(event, obj)
+
+    def _save_room(self, room_number: int) -> tuple:
+        room = self._rooms.get(room_number)
+        fields = None if room is None else (room.room_type, room.room_state, room.room_price)
+        return (room, fields, self.reservations.get(room_number), self._stays.get(room_number),
+                self.bookings.save_room(room_number))
+
+    def _restore_room(self, room_number: int, saved: tuple):
+        room, fields, guest_name, stay, stays = saved
+        current = self._rooms.get(room_number)
+        if current is not None:
+            self._unindex_room(current)
+            if current is not room:
+                self._rooms.pop(room_number)
+        if room is not None:
+            room.room_type, room.room_state, room.room_price = fields
+            if current is not room:
+                self._rooms[room_number] = room
+            self._index_room(room)
+        for target, value in ((self.reservations, guest_name), (self._stays, stay)):
+            if value is None:
+                target.pop(room_number, None)
+            else:
+                target[room_number] = value
+        self.bookings.restore_room(room_number, stays)
+
+    def _notify(self, event: str, obj):
+        if self._transaction is not None and event not in ("add_employee", "remove_employee", "update_employee"):
+            # Employees are not undone by a rollback, so their events are never held back.
+            # The others are held back with a copy of their object, so the listeners see it
+            # as it was when the event happened, not as the transaction leaves it.
+            self._transaction.events.append((event, copy(obj)))
+            return
+        if self._queued is not None:
+            self._queued.append((event, obj))
+            return
+        self._queued = queued = []
+        try:
+            for listener in self._listeners:
+                listener(event, obj)
+            for event, obj in queued:
+                for listener in self._listeners:
+                    listener(event, obj)
+        finally:
+            self._queued = None
+
+    def _index_room(self, room: Room):
+        self._rooms_by_type.setdefault(HotelRoomType(room.room_type), set()).add(room.room_number)
+        self._rooms_by_state.setdefault(room.room_state, set()).add(room.room_number)
+        self._rooms_by_floor.setdefault(room.floor, set()).add(room.room_number)
+
+    def _unindex_room(self, room: Room):
+        self._rooms_by_type[HotelRoomType(room.room_type)].discard(room.room_number)
+        self._rooms_by_state[room.room_state].discard(room.room_number)
+        self._rooms_by_floor[room.floor].discard(room.room_number)
+
+    def _set_room_state(self, room: Room, room_state: RoomState):
+        self._rooms_by_state[room.room_state].discard(room.room_number)
+        room.room_state = room_state
+        self._rooms_by_state.setdefault(room_state, set()).add(room.room_number)
+
+    def attach_snapshot(self, path: str) -> int:
+        """Take the rooms of the hotel from a room snapshot file, without loading it.
+
+        The file, written by RoomSnapshot.write_snapshot(), is memory-mapped: a Room instance
+        is only built when its room is first looked up, and each set of the type, state and
+        floor indexes when first used, so attaching takes the same time for any number of
+        rooms. Listeners are not notified of the attached rooms.
+
+        Parameters
+        ----------
+        path : str
+            Path of the snapshot file.
+
+        Returns
+        -------
+        int
+            Number of rooms in the snapshot.
+
+        Raises
+        ------
+        ValueError
+            If the hotel already has rooms or the file is not a room snapshot.
+        """
+        from RoomSnapshot import MappedRooms
+        if self._rooms:
+            raise ValueError("Rooms can only be attached to a hotel without rooms.")
+        rooms = MappedRooms(path)
+        self._rooms = rooms
+        self._rooms_by_type, self._rooms_by_state, self._rooms_by_floor = rooms.indexes()
+        return len(rooms.columns.room_number)
+
+    def add_room(self, room: Room) -> str:
+        """Add a room to the hotel.
+
+        A room with the same number already in the hotel is replaced, unless it has stays
+        or bookings: they belong to that room, so it must be removed first.
+
+        Parameters
+        ----------
+        room : Room
+            The Room instance to be added.
+
+        Returns
+        -------
+        str
+            A message indicating the success or failure of the addition.
+        """
+        if self.bookings.has_stays(room.room_number) and room.room_number in self._rooms:
+            return f"Room {room.room_number} has stays and cannot be replaced."
+        if self._transaction is not None:
+            self._transaction.touch(room.room_number)
+        previous = self._rooms.get(room.room_number)
+        if previous is not None:
+            self._unindex_room(previous)
+        self._rooms[room.room_number] = room
+        self._index_room(room)
+        if self._listeners:
+            self._notify("add_room", room)
+        return "Room added successfully."
+
+    def add_rooms(self, rooms) -> int:
+        """Add many rooms to the hotel at once.
+
+        Equivalent to calling add_room() for every room, with the index lookups hoisted
+        out of the loop. Rooms that would replace one with stays are left out.
+
+        Parameters
+        ----------
+        rooms : iterable
+            The Room instances to be added.
+
+        Returns
+        -------
+        int
+            Number of rooms added.
+        """
+        by_number = self._rooms
+        by_type = self._rooms_by_type
+        by_state = self._rooms_by_state
+        by_floor = self._rooms_by_floor
+        notify = self._notify if self._listeners else None
+        transaction = self._transaction
+        has_stays = self.bookings.has_stays
+        count = 0
+        for room in rooms:
+            number = room.room_number
+            if has_stays(number) and number in by_number:
+                continue
+            if transaction is not None:
+                transaction.touch(number)
+            previous = by_number.get(number)
+            if previous is not None:
+                self._unindex_room(previous)
+            by_number[number] = room
+            room_type = room.room_type
+            if room_type.__class__ is not HotelRoomType:
+                room_type = HotelRoomType(room_type)
+            numbers = by_type.get(room_type)
+            if numbers is None:
+                numbers = by_type[room_type] = set()
+            numbers.add(number)
+            numbers = by_state.get(room.room_state)
+            if numbers is None:
+                numbers = by_state[room.room_state] = set()
+            numbers.add(number)
+            numbers = by_floor.get(number // 100)
+            if numbers is None:
+                numbers = by_floor[number // 100] = set()
+            numbers.add(number)
+            if notify is not None:
+                notify("add_room", room)
+            count += 1
+        return count
+
+    def remove_room(self, room_number: int):
+        """Remove a room from the hotel.
+
+        Parameters
+        ----------
+        room_number : int
+            The number of the room to be removed.
+        """
+        if self._transaction is not None:
+            self._transaction.touch(room_number)
+        room = self._rooms.get(room_number)
+        if room is not None:
+            # Unindexed first, so a number found in an index always has its room.
+            self._unindex_room(room)
+            self._rooms.pop(room_number)
+            self.reservations.pop(room_number, None)
+            self._stays.pop(room_number, None)
+            self.bookings.remove_room(room_number)
+            if self._listeners:
+                self._notify("remove_room", room)
+
+    def set_room_state(self, room_number: int, room_state: RoomState) -> str:
+        """Move a room to another state, e.g. from "Sucia" to "Limpiando".
+
+        The move must be allowed by the TRANSITIONS table of Roomstate. Occupancy only
+        changes through check_in() and check_out(), so moves to or from "Ocupada" are refused.
+
+        Parameters
+        ----------
+        room_number : int
+            The number of the room.
+        room_state : RoomState
+            The new state. Its value (e.g., "Sucia") is also accepted.
+
+        Returns
+        -------
+        str
+            A message indicating the success or failure of the change.
+        """
+        room = self.find_room(room_number)
+        if room is None:
+            return "Room not found."
+        room_state = RoomState(room_state)
+        current = room.room_state
+        if RoomState.OCUPADA in (current, room_state) or not current.can_transition(room_state):
+            return f"Room {room_number} cannot go from {current} to {room_state}."
+        if self._transaction is not None:
+            self._transaction.touch(room_number)
+        self._set_room_state(room, room_state)
+        if self._listeners:
+            self._notify("room_state", room)
+        return f"Room {room_number} is now {room_state}."
+
+    def add_employee(self, employee: Employee):
+        """Add an employee to the hotel.
+
+        An employee with the same ID already in the hotel is replaced.
+
+        Parameters
+        ----------
+        employee : Employee
+            The Employee instance to be added.
+        """
+        self._employees[employee.get_emp_id()] = employee
+        if self._listeners:
+            self._notify("add_employee", employee)
+
+    def remove_employee(self, emp_id: int):
+        """Remove an employee from the hotel.
+
+        Parameters
+        ----------
+        emp_id : int
+            The ID of the employee to be removed.
+        """
+        employee = self._employees.pop(emp_id, None)
+        if employee is not None and self._listeners:
+            self._notify("remove_employee", employee)
+
+    def update_employee(self, emp_id: int, position: str = None, salary: float = None) -> str:
+        """Change the position or the salary of an employee.
+
+        Parameters
+        ----------
+        emp_id : int
+            The ID of the employee.
+        position : str, optional
+            The new position. Left as it is if omitted.
+        salary : float, optional
+            The new salary. Left as it is if omitted.
+
+        Returns
+        -------
+        str
+            A message indicating the success or failure of the update.
+        """
+        employee = self._employees.get(emp_id)
+        if employee is None:
+            return "Employee not found."
+        if position is not None:
+            employee.set_position(position)
+        if salary is not None:
+            employee.set_salary(salary)
+        if self._listeners:
+            self._notify("update_employee", employee)
+        return "Employee updated successfully."
+
+    def reserve(self, room_number: int, guest_name: str, arrival: date, departure: date):
+        """Book a room for a future stay.
+
+        Parameters
+        ----------
+        room_number : int
+            The number of the room to book.
+        guest_name : str
+            The name of the guest.
+        arrival : date
+            First night of the stay.
+        departure : date
+            Day the guest leaves the room.
+
+        Returns
+        -------
+        Reservation or None
+            The new Reservation instance, None if the room does not exist or is not free in that period.
+        """
+        if self.find_room(room_number) is None or departure <= arrival:
+            return None
+        if not self.bookings.is_free(room_number, arrival, departure):
+            return None
+        if self._transaction is not None:
+            self._transaction.touch(room_number)
+        reservation = self.bookings.book(room_number, guest_name, arrival, departure)
+        if self._transaction is not None:
+            self._transaction.booked(reservation.reservation_id)
+        if self._listeners:
+            self._notify("reserve", reservation)
+        return reservation
+
+    def cancel_reservation(self, reservation_id: int):
+        """Cancel a pending reservation.
+
+        Parameters
+        ----------
+        reservation_id : int
+            The ID of the reservation to cancel.
+
+        Returns
+        -------
+        str
+            A message indicating the success or failure of the cancellation.
+        """
+        if self._transaction is not None:
+            pending = self.bookings.get(reservation_id)
+            if pending is not None:
+                self._transaction.touch(pending.room_number)
+        reservation = self.bookings.cancel(reservation_id)
+        if reservation is None:
+            return "No pending reservation found."
+        if self._listeners:
+            self._notify("cancel_reservation", reservation)
+        return f"Reservation {reservation_id} cancelled for {reservation.guest_name}."
+
+    def displace_reservation(self, reservation_id: int):
+        """Release the room of a pending reservation, keeping the booking of its guest.
+
+        The reservation becomes "Desplazada": when its guest checks in, another room of
+        the type is found for them or, if every room of the type is occupied, the guest
+        is walked and the reservation cancelled.
+
+        Parameters
+        ----------
+        reservation_id : int
+            The ID of the reservation to displace.
+
+        Returns
+        -------
+        str
+            A message indicating the success or failure of the displacement.
+        """
+        if self._transaction is not None:
+            pending = self.bookings.get(reservation_id)
+            if pending is not None:
+                self._transaction.touch(pending.room_number)
+        reservation = self.bookings.displace(reservation_id)
+        if reservation is None:
+            return "No pending reservation found."
+        if self._listeners:
+            self._notify("displace_reservation", reservation)
+        return f"Reservation {reservation_id} displaced for {reservation.guest_name}."
+
+    def check_in(self, room_number: int, guest_name: str, departure: date = None, on: date = None):
+        """Check-in a guest to a room.
+
+        A pending reservation of the guest covering the check-in night is taken up; otherwise a
+        walk-in stay is booked, provided no other stay holds the room in that period. The room
+        must be ready for a guest: "Desocupada", "Inspeccionada" or "Reservada".
+
+        If the room is only held by pending reservations of other guests and an admission
+        policy is set, the walk-in may still be admitted: each pending reservation is moved,
+        under a new ID, to another room of the same type free for its nights, and those that
+        cannot be moved are displaced, i.e. overbooked, if admission(room_type, nights) accepts
+        the risk, nights being the number of displaced reservations on each night they cover.
+
+        A guest whose reservation was displaced is only walked when they arrive and the room
+        is actually missing: they are booked, under a new ID, into a room of the type free for
+        their nights or, failing that, into one held only by guests who have not arrived yet,
+        whose reservations are displaced in turn. If every room of the type is occupied, the
+        reservation is cancelled.
+
+        Parameters
+        ----------
+        room_number : int
+            The number of the room to check-in the guest.
+        guest_name : str
+            The name of the guest to be checked-in.
+        departure : date, optional
+            Day the guest leaves the room for a walk-in stay. Defaults to the day after check-in.
+        on : date, optional
+            Day of the check-in. Defaults to today.
+
+        Returns
+        -------
+        str
+            A message indicating the success or failure of the check-in operation.
+        """
+        room = self.find_room(room_number)
+        if room:
+            on = on or date.today()
+            displaced = self.bookings.displaced(room_number, guest_name, on)
+            if displaced is not None:
+                return self._rehouse(displaced, room, on)
+            if not room.room_state.can_transition(RoomState.OCUPADA):
+                return "Room not available or already occupied."
+            if self._transaction is not None:
+                self._transaction.touch(room_number)
+            stay = self.bookings.find(room_number, on)
+            if stay is None or (stay.guest_name != guest_name and self.admission is not None):
+                departure = departure or on + timedelta(days=1)
+                if departure <= on:
+                    return "Room not available or already occupied."
+                if not self.bookings.is_free(room_number, on, departure) and not self._admit(room, on, departure):
+                    return "Room not available or already occupied."
+                stay = self.bookings.book(room_number, guest_name, on, departure)
+                if self._transaction is not None:
+                    self._transaction.booked(stay.reservation_id)
+            elif stay.guest_name != guest_name or stay.status != "Confirmada":
+                return "Room not available or already occupied."
+            stay.status = "En curso"
+            self._stays[room_number] = stay
+            self._set_room_state(room, RoomState.OCUPADA)
+            self.reservations[room_number] = guest_name
+            if self._listeners:
+                self._notify("check_in", stay)
+            return f"Check-in successful for {guest_name} in room {room_number}."
+        else:
+            return "Room not found."
+
+    def _admit(self, room: Room, on: date, departure: date) -> bool:
+        if self.admission is None:
+            return False
+        conflicts = [reservation for reservation in self.bookings.reservations(room.room_number)
+                     if reservation.overlaps(on, departure)]
+        if any(reservation.status != "Confirmada" for reservation in conflicts):
+            return False
+        moves = []
+        walked = []
+        for reservation in conflicts:
+            # The conflicts never share a night, so one room may take several of them.
+            target = next((other for other in self.free_rooms(room.room_type, reservation.arrival, reservation.departure)
+                           if other.room_number != room.room_number), None)
+            if target is None:
+                walked.append(reservation)
+            else:
+                moves.append((reservation, target.room_number))
+        # The moved bookings are made first, so a failure leaves the original ones untouched.
+        moved = []
+        for reservation, room_number in moves:
+            booked = self.reserve(room_number, reservation.guest_name, reservation.arrival, reservation.departure)
+            if booked is None:
+                break
+            moved.append(booked)
+        nights = {}
+        for reservation in walked:
+            night = reservation.arrival
+            while night < reservation.departure:
+                nights[night] = nights.get(night, 0) + 1
+                night += timedelta(days=1)
+        if len(moved) < len(moves) or (walked and not self.admission(HotelRoomType(room.room_type), nights)):
+            for booked in moved:
+                self.cancel_reservation(booked.reservation_id)
+            return False
+        for reservation in conflicts:
+            if reservation in walked:
+                self.displace_reservation(reservation.reservation_id)
+            else:
+                self.bookings.cancel(reservation.reservation_id)
+                if self._listeners:
+                    self._notify("cancel_reservation", reservation)
+        return True
+
+    def _rehouse(self, reservation: Reservation, room: Room, on: date) -> str:
+        guest_name, departure = reservation.guest_name, reservation.departure
+        target = held = None
+        for other in [room] + self.rooms_by_type(room.room_type):
+            if not other.room_state.can_transition(RoomState.OCUPADA):
+                continue
+            conflicts = [stay for stay in self.bookings.reservations(other.room_number) if stay.overlaps(on, departure)]
+            if not conflicts:
+                target = other
+                break
+            if held is None and all(stay.status == "Confirmada" for stay in conflicts):
+                held = (other, conflicts)
+        if target is None and held is not None:
+            # The guests of that room have not arrived yet; they get a room when they do.
+            target, conflicts = held
+            for stay in conflicts:
+                self.displace_reservation(stay.reservation_id)
+        if target is None:
+            self.cancel_reservation(reservation.reservation_id)
+            return f"No room available: reservation {reservation.reservation_id} of {guest_name} cancelled."
+        self.reserve(target.room_number, guest_name, on, departure)
+        self.cancel_reservation(reservation.reservation_id)
+        return self.check_in(target.room_number, guest_name, on=on)
+
+    def check_out(self, room_number: int, on: date = None):
+        """Check-out a guest from a room.
+
+        The nights of the stay from the check-out day on are released.
+
+        Parameters
+        ----------
+        room_number : int
+            The number of the room to check-out the guest from.
+        on : date, optional
+            Day of the check-out. Defaults to today.
+
+        Returns
+        -------
+        str
+            A message indicating the success or failure of the check-out operation.
+        """
+        room = self.find_room(room_number)
+        if room is not None and room_number in self.reservations:
+            if self._transaction is not None:
+                self._transaction.touch(room_number)
+            stay = self._stays.pop(room_number)
+            self.bookings.close(stay.reservation_id, on or date.today())
+            self._set_room_state(room, RoomState.DESOCUPADA)
+            guest_name = self.reservations.pop(room_number)
+            if self._listeners:
+                self._notify("check_out", stay)
+            return f"Check-out successful for {guest_name} from room {room_number}."
+        else:
+            return "No guest found in the specified room."
+
+    def move_guest(self, from_room: int, to_room: int, room_state: RoomState = None, on: date = None) -> str:
+        """Move a checked-in guest to another room, e.g. after a maintenance issue.
+
+        The check-out, the check-in for the rest of the stay and the new state of the
+        vacated room are made in one transaction: if any of them fails, nothing changes.
+
+        Parameters
+        ----------
+        from_room : int
+            The number of the room the guest is in.
+        to_room : int
+            The number of the room to move the guest to.
+        room_state : RoomState, optional
+            State of the vacated room, e.g. "Fuera de servicio". Left "Desocupada" if omitted.
+        on : date, optional
+            Day of the move. Defaults to today.
+
+        Returns
+        -------
+        str
+            A message indicating the success or failure of the move.
+        """
+        stay = self.current_stay(from_room)
+        if stay is None:
+            return "No guest found in the specified room."
+        on = on or date.today()
+        guest_name, departure = stay.guest_name, max(stay.departure, on + timedelta(days=1))
+        with self.transaction() as transaction:
+            self.check_out(from_room, on)
+            result = self.check_in(to_room, guest_name, departure, on)
+            if result.startswith("Check-in successful") and room_state is not None:
+                result = self.set_room_state(from_room, room_state)
+            if not result.startswith(("Check-in successful", f"Room {from_room} is now")):
+                transaction.rollback()
+                return result
+        return f"{guest_name} moved from room {from_room} to room {to_room}."
+
+    def restore_reservation(self, reservation: Reservation):
+        """Load a saved reservation, keeping its ID and status, without notifying listeners.
+
+        A reservation with status "En curso" is restored as the current stay of its room.
+
+        Parameters
+        ----------
+        reservation : Reservation
+            The Reservation instance to be restored.
+        """
+        self.bookings.restore(reservation)
+        if reservation.status == "En curso":
+            self._stays[reservation.room_number] = reservation
+            self.reservations[reservation.room_number] = reservation.guest_name
+
+    def current_stay(self, room_number: int):
+        """Get the stay of the guest currently in a room.
+
+        Parameters
+        ----------
+        room_number : int
+            The number of the room.
+
+        Returns
+        -------
+        Reservation or None
+            The Reservation instance of the checked-in guest, None if the room is not occupied.
+        """
+        return self._stays.get(room_number)
+
+    def find_room(self, room_number: int):
+        """Find a room by its number.
+
+        Parameters
+        ----------
+        room_number : int
+            The number of the room to find.
+
+        Returns
+        -------
+        Room or None
+            The Room instance if found, None otherwise.
+        """
+        return self._rooms.get(room_number)
+
+    def find_employee(self, emp_id: int):
+        """Find an employee by its ID.
+
+        Parameters
+        ----------
+        emp_id : int
+            The ID of the employee to find.
+
+        Returns
+        -------
+        Employee or None
+            The Employee instance if found, None otherwise.
+        """
+        return self._employees.get(emp_id)
+
+    def rooms_by_type(self, room_type: HotelRoomType) -> list:
+        """Get the rooms of a given type.
+
+        Parameters
+        ----------
+        room_type : HotelRoomType
+            The type of the rooms to find. Its value ("Individual", "Doble", "Suite") is also accepted.
+
+        Returns
+        -------
+        list
+            List of the Room instances of the given type.
+        """
+        numbers = self._rooms_by_type.get(HotelRoomType(room_type), ())
+        return [self._rooms[number] for number in numbers]
+
+    def rooms_by_state(self, room_state: RoomState) -> list:
+        """Get the rooms in a given state.
+
+        Parameters
+        ----------
+        room_state : RoomState
+            The state of the rooms to find. Its value (e.g., "Ocupada", "Sucia") is also accepted.
+
+        Returns
+        -------
+        list
+            List of the Room instances in the given state.
+        """
+        return [self._rooms[number] for number in self._rooms_by_state.get(RoomState(room_state), ())]
+
+    def rooms_in_state(self, room_state: RoomState, floor: int = None, room_type: HotelRoomType = None) -> list:
+        """Get the rooms in a given state, optionally restricted to a floor and a type.
+
+        The state, floor and type indexes are intersected starting from the smallest one, so
+        queries like "the dirty rooms of floor 3" never look at the other rooms.
+
+        Parameters
+        ----------
+        room_state : RoomState
+            The state of the rooms to find. Its value (e.g., "Sucia") is also accepted.
+        floor : int, optional
+            The floor of the rooms. All floors are considered if omitted.
+        room_type : HotelRoomType, optional
+            The type of the rooms. All types are considered if omitted.
+
+        Returns
+        -------
+        list
+            List of the matching Room instances.
+        """
+        groups = [self._rooms_by_state.get(RoomState(room_state), set())]
+        if floor is not None:
+            groups.append(self._rooms_by_floor.get(floor, set()))
+        if room_type is not None:
+            groups.append(self._rooms_by_type.get(HotelRoomType(room_type), set()))
+        groups.sort(key=len)
+        numbers = groups[0].intersection(*groups[1:])
+        return [self._rooms[number] for number in numbers]
+
+    def free_rooms(self, room_type: HotelRoomType, arrival: date, departure: date) -> list:
+        """Get the rooms of a given type with no stay in a date range.
+
+        Each room of the type is checked with one binary search in its stay list, so the
+        query costs O(n log s) for n rooms of the type with up to s stays each, not the
+        O(log n + k) of an output-sensitive search. Reaching that would need an index of
+        the free gaps of every type, searched by start and end at once, and rebuilt on every
+        booking, cancellation and check-out. The per-room lists keep those writes at one
+        bisect and an insertion, and the scan is a tight loop over the type index.
+
+        Parameters
+        ----------
+        room_type : HotelRoomType
+            The type of the rooms to find.
+        arrival : date
+            First night of the range.
+        departure : date
+            Day after the last night of the range.
+
+        Returns
+        -------
+        list
+            List of the free Room instances.
+        """
+        is_free = self.bookings.is_free
+        return [self._rooms[number] for number in self._rooms_by_type.get(HotelRoomType(room_type), ())
+                if is_free(number, arrival, departure)]
+
+    def available_rooms(self, room_type: HotelRoomType = None) -> list:
+        """Get the rooms ready for a walk-in guest, optionally restricted to one type.
+
+        These are the rooms in one of the AVAILABLE_STATES of Roomstate: "Desocupada" or
+        "Inspeccionada".
+
+        Parameters
+        ----------
+        room_type : HotelRoomType, optional
+            The type of the rooms to find. All types are considered if omitted.
+
+        Returns
+        -------
+        list
+            List of the available Room instances.
+        """
+        by_state = self._rooms_by_state
+        numbers = set().union(*(by_state.get(room_state, ()) for room_state in AVAILABLE_STATES))
+        if room_type is not None:
+            numbers = numbers & self._rooms_by_type.get(HotelRoomType(room_type), set())
+        return [self._rooms[number] for number in numbers]
+
+
+def main():
+    # TESTING
+    print("=================================================================")
+    print("Test Case 1: Create a Hotel.")
+    print("=================================================================")
+    hotel = Hotel("Grand Hotel")
+    if hotel.name == "Grand Hotel":
+        print("Test PASS. The parameter name has been correctly set.")
+    else:
+        print("Test FAIL. Check the method __init__().")
+
+    print("=================================================================")
+    print("Test Case 2: Add a Room to the Hotel.")
+    print("=================================================================")
+
+    room1 = Room("Doble", 101, "Desocupada", 150)
+    hotel.add_room(room1)
+
+    if hotel.rooms[0] == room1:
+        print("Test PASS. Room has been successfully added to the hotel.")
+    else:
+        print("Test FAIL. Check the method add_room().")
+
+    print("=================================================================")
+    print("Test Case 3: Remove a Room from the Hotel.")
+    print("=================================================================")
+
+    hotel.remove_room(101)
+    if len(hotel.rooms) == 0:
+        print("Test PASS. Room has been successfully removed from the hotel.")
+    else:
+        print("Test FAIL. Check the method remove_room().")
+
+    print("=================================================================")
+    print("Test Case 4: Add an Employee to the Hotel.")
+    print("=================================================================")
+
+    emp1 = Employee(1, "John Doe", "Receptionist", 30000)
+    hotel.add_employee(emp1)
+
+    if hotel.employees[0] == emp1:
+        print("Test PASS. Employee has been successfully added to the hotel.")
+    else:
+        print("Test FAIL. Check the method add_employee().")
+
+    print("=================================================================")
+    print("Test Case 5: Remove an Employee from the Hotel.")
+    print("=================================================================")
+
+    hotel.remove_employee(1)
+    if len(hotel.employees) == 0:
+        print("Test PASS. Employee has been successfully removed from the hotel.")
+    else:
+        print("Test FAIL. Check the method remove_employee().")
+
+    print("=================================================================")
+    print("Test Case 6: Check-in a Guest.")
+    print("=================================================================")
+
+    room2 = Room("Suite", 102, "Desocupada", 300)
+    hotel.add_room(room2)
+    check_in_result = hotel.check_in(102, "Alice")
+
+    if check_in_result == "Check-in successful for Alice in room 102." and room2.room_state == "Ocupada":
+        print("Test PASS. Check-in functionality has been implemented correctly.")
+    else:
+        print("Test FAIL. Check the method check_in().")
+
+    print("=================================================================")
+    print("Test Case 7: Check-out a Guest.")
+    print("=================================================================")
+
+    check_out_result = hotel.check_out(102)
+
+    if check_out_result == "Check-out successful for Alice from room 102." and room2.room_state == "Desocupada":
+        print("Test PASS. Check-out functionality has been implemented correctly.")
+    else:
+        print("Test FAIL. Check the method check_out().")
+
+    print("=================================================================")
+    print("Test Case 8: Attempt Check-in on an Occupied Room.")
+    print("=================================================================")
+
+    check_in_result = hotel.check_in(102, "Bob")
+    if check_in_result == "Room not available or already occupied.":
+        print("Test PASS. Check-in functionality has been implemented correctly.")
+    else:
+        print("Test FAIL. Check the method check_in().")
+
+    print("=================================================================")
+    print("Test Case 9: Indexed Lookups by Number, Type and State.")
+    print("=================================================================")
+
+    hotel = Hotel("Indexed Hotel")
+    for number in range(1, 101):
+        room_type = HotelRoomType.SUITE if number % 10 == 0 else HotelRoomType.DOBLE
+        hotel.add_room(Room(room_type, number, "Desocupada", 100 + number))
+    hotel.check_in(10, "Alice")
+    hotel.remove_room(20)
+    suites = sorted(room.room_number for room in hotel.rooms_by_type(HotelRoomType.SUITE))
+    free_suites = sorted(room.room_number for room in hotel.available_rooms(HotelRoomType.SUITE))
+
+    if (hotel.find_room(55).room_price == 155 and hotel.find_room(20) is None
+            and suites == [10, 30, 40, 50, 60, 70, 80, 90, 100]
+            and free_suites == [30, 40, 50, 60, 70, 80, 90, 100]
+            and [room.room_number for room in hotel.rooms_by_state("Ocupada")] == [10]):
+        print("Test PASS. Room indexes are consistent after add, remove and check-in.")
+    else:
+        print("Test FAIL. Check the methods rooms_by_type(), rooms_by_state() and available_rooms().")
+
+    hotel.check_out(10)
+    if len(hotel.rooms_by_state("Ocupada")) == 0 and len(hotel.available_rooms()) == 99:
+        print("Test PASS. Room indexes are consistent after check-out.")
+    else:
+        print("Test FAIL. Check the method check_out().")
+
+    print("=================================================================")
+    print("Test Case 10: Indexed Employee Lookups.")
+    print("=================================================================")
+
+    hotel.add_employee(Employee(7, "Jane Roe", "Housekeeper", 25000))
+    hotel.add_employee(Employee(8, "Max Poe", "Manager", 60000))
+    hotel.remove_employee(7)
+    if hotel.find_employee(7) is None and hotel.find_employee(8).get_name() == "Max Poe" and len(hotel.employees) == 1:
+        print("Test PASS. Employee index is consistent after add and remove.")
+    else:
+        print("Test FAIL. Check the methods find_employee() and remove_employee().")
+
+    print("=================================================================")
+    print("Test Case 11: Date-Ranged Reservations.")
+    print("=================================================================")
+
+    today = date.today()
+    day = timedelta(days=1)
+    booking = hotel.reserve(30, "Carol", today + 2 * day, today + 5 * day)
+    free_suites = sorted(room.room_number for room in hotel.free_rooms(HotelRoomType.SUITE, today + 4 * day, today + 6 * day))
+
+    if (booking is not None and hotel.reserve(30, "Dave", today + 4 * day, today + 6 * day) is None
+            and free_suites == [10, 40, 50, 60, 70, 80, 90, 100]):
+        print("Test PASS. Reservations block their nights for other guests.")
+    else:
+        print("Test FAIL. Check the methods reserve() and free_rooms().")
+
+    walk_in = hotel.check_in(30, "Dave", departure=today + 3 * day)
+    arrival = hotel.check_in(30, "Carol", on=today + 2 * day)
+    if (walk_in == "Room not available or already occupied."
+            and arrival == "Check-in successful for Carol in room 30."
+            and hotel.current_stay(30) is booking and booking.status == "En curso"):
+        print("Test PASS. Check-in takes up the pending reservation of the guest.")
+    else:
+        print("Test FAIL. Check the method check_in() with reservations.")
+
+    hotel.check_out(30, on=today + 3 * day)
+    if booking.departure == today + 3 * day and booking.status == "Finalizada" and hotel.free_rooms(
+            HotelRoomType.SUITE, today + 3 * day, today + 6 * day) != [] and hotel.find_room(30).room_state == "Desocupada":
+        print("Test PASS. Check-out releases the remaining nights.")
+    else:
+        print("Test FAIL. Check the method check_out() with reservations.")
+
+    print("=================================================================")
+    print("Test Case 12: Room State Machine and State Queries.")
+    print("=================================================================")
+
+    hotel = Hotel("Housekeeping Hotel")
+    for floor in range(1, 4):
+        for number in range(1, 11):
+            room_type = HotelRoomType.SUITE if number > 8 else HotelRoomType.DOBLE
+            hotel.add_room(Room(room_type, floor * 100 + number, "Desocupada", 100))
+    events = []
+    hotel.subscribe(lambda event, obj: events.append((event, obj.room_number)))
+    for number in (301, 302, 309, 201):
+        hotel.set_room_state(number, RoomState.SUCIA)
+    hotel.set_room_state(309, "Limpiando")
+    hotel.set_room_state(309, "Inspeccionada")
+    dirty = hotel.check_in(301, "Alice")
+    skipped = hotel.set_room_state(302, RoomState.INSPECCIONADA)
+    dirty_third = sorted(room.room_number for room in hotel.rooms_in_state("Sucia", floor=3))
+    inspected_suites = [room.room_number for room in hotel.rooms_in_state("Inspeccionada", room_type="Suite")]
+    available = len(hotel.available_rooms())
+    inspected = hotel.check_in(309, "Bob")
+
+    if (dirty == "Room not available or already occupied." and skipped == "Room 302 cannot go from Sucia to Inspeccionada."
+            and dirty_third == [301, 302] and inspected_suites == [309] and available == 27
+            and inspected == "Check-in successful for Bob in room 309."
+            and hotel.set_room_state(309, "Sucia") == "Room 309 cannot go from Ocupada to Sucia."
+            and events[-2:] == [("room_state", 309), ("check_in", 309)]):
+        print("Test PASS. Transitions are validated and rooms are found by state, floor and type.")
+    else:
+        print("Test FAIL. Check the methods set_room_state(), rooms_in_state() and check_in().")
+
+    print("=================================================================")
+    print("Test Case 13: Replace a Room with Stays.")
+    print("=================================================================")
+    replaced = hotel.add_room(Room(HotelRoomType.SUITE, 309, "Desocupada", 500))
+    kept = hotel.find_room(309).is_occupied() and hotel.reservations.get(309) == "Bob"
+    added = hotel.add_rooms([Room(HotelRoomType.SUITE, 301, "Desocupada", 500),
+                             Room(HotelRoomType.SUITE, 310, "Desocupada", 500)])
+    hotel.remove_room(309)
+    readded = hotel.add_room(Room(HotelRoomType.SUITE, 309, "Desocupada", 500))
+
+    if (replaced == "Room 309 has stays and cannot be replaced." and kept and added == 2
+            and readded == "Room added successfully." and not hotel.find_room(309).is_occupied()
+            and 309 not in hotel.reservations and hotel.current_stay(309) is None
+            and hotel.find_room(310).room_price == 500):
+        print("Test PASS. A room with a guest is kept, and can be added again once removed.")
+    else:
+        print("Test FAIL. Check the methods add_room() and add_rooms().")
+
+if __name__ == "__main__":
+    main()
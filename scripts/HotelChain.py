@@ -0,0 +1,277 @@
+import heapq
+import multiprocessing
+import os
+import zlib
+from Hotel import Hotel
+from Roomtype import HotelRoomType
+
+def _free_rooms(hotels: dict, room_type, max_price, arrival, departure) -> list:
+    """Run a chain-wide availability search on the hotels of one shard, sorted by price."""
+    found = []
+    for property_id, hotel in hotels.items():
+        if arrival is None:
+            rooms = hotel.available_rooms(room_type)
+        else:
+            rooms = hotel.free_rooms(room_type, arrival, departure)
+        found.extend((room.room_price, property_id, room.room_number) for room in rooms
+                     if max_price is None or room.room_price <= max_price)
+    found.sort()
+    return found
+
+def _shard_main(connection):
+    """Serve the commands of a HotelChain for the hotels of one shard until told to stop."""
+    hotels = {}
+    while True:
+        message = connection.recv()
+        if message is None:
+            break
+        operation, property_id, args, kwargs = message
+        try:
+            if operation == "add_property":
+                hotels[property_id] = Hotel(*args)
+                result = None
+            elif operation == "free_rooms":
+                result = _free_rooms(hotels, *args)
+            else:
+                result = getattr(hotels[property_id], operation)(*args, **kwargs)
+            connection.send((True, result))
+        except Exception as error:
+            connection.send((False, error))
+    connection.close()
+
+class HotelChain:
+    """Python class to implement a chain of hotels sharded across worker processes.
+
+    Every property is a Hotel living in one worker process, chosen from its property ID,
+    so operations on different properties run in parallel without sharing state.
+    Operations on one property are routed to its shard. Chain-wide searches are sent to
+    every shard at once, run concurrently, and the per-shard results are merged.
+
+    Syntax
+    ------
+    obj = HotelChain(workers)
+
+    Parameters
+    ----------
+    [in] workers : int
+        Number of worker processes. Defaults to the number of CPUs.
+
+    Returns
+    -------
+    obj : HotelChain
+        Python object output parameter that represents an instance of the class HotelChain.
+
+    Attributes
+    ----------
+    workers : int
+        Number of worker processes.
+    """
+
+    def __init__(self, workers: int = None):
+        self.workers = workers or os.cpu_count() or 1
+        self._connections = []
+        self._processes = []
+        for _ in range(self.workers):
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_shard_main, args=(child,), daemon=True)
+            process.start()
+            child.close()
+            self._connections.append(parent)
+            self._processes.append(process)
+        self._properties = set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Stop the worker processes."""
+        for connection in self._connections:
+            connection.send(None)
+            connection.close()
+        for process in self._processes:
+            process.join()
+        self._connections = []
+        self._processes = []
+
+    def shard(self, property_id) -> int:
+        """Get the worker that holds a property.
+
+        Parameters
+        ----------
+        property_id : int or str
+            The ID of the property.
+
+        Returns
+        -------
+        int
+            Index of the worker process.
+        """
+        if isinstance(property_id, int):
+            return property_id % self.workers
+        return zlib.crc32(str(property_id).encode("utf-8")) % self.workers
+
+    def _request(self, shard: int, operation: str, property_id, *args, **kwargs):
+        connection = self._connections[shard]
+        connection.send((operation, property_id, args, kwargs))
+        ok, result = connection.recv()
+        if not ok:
+            raise result
+        return result
+
+    def add_property(self, property_id, name: str):
+        """Create an empty hotel in the chain.
+
+        Parameters
+        ----------
+        property_id : int or str
+            The ID of the property.
+        name : str
+            The name of the hotel.
+        """
+        self._request(self.shard(property_id), "add_property", property_id, name)
+        self._properties.add(property_id)
+
+    def call(self, property_id, method: str, *args, **kwargs):
+        """Call a Hotel method on one property.
+
+        Parameters
+        ----------
+        property_id : int or str
+            The ID of the property.
+        method : str
+            Name of the Hotel method, e.g. "check_in".
+        *args, **kwargs
+            Arguments of the method. They and the result are pickled between processes.
+
+        Returns
+        -------
+        object
+            The value returned by the method.
+        """
+        if property_id not in self._properties:
+            raise KeyError(f"Unknown property: {property_id}")
+        return self._request(self.shard(property_id), method, property_id, *args, **kwargs)
+
+    def add_rooms(self, property_id, rooms: list) -> int:
+        """Add rooms to a property in a single round trip.
+
+        Parameters
+        ----------
+        property_id : int or str
+            The ID of the property.
+        rooms : list
+            The Room instances to be added.
+
+        Returns
+        -------
+        int
+            Number of rooms added.
+        """
+        return self.call(property_id, "add_rooms", rooms)
+
+    def check_in(self, property_id, room_number: int, guest_name: str, departure=None, on=None) -> str:
+        """Check-in a guest to a room of a property. See Hotel.check_in()."""
+        return self.call(property_id, "check_in", room_number, guest_name, departure, on)
+
+    def check_out(self, property_id, room_number: int, on=None) -> str:
+        """Check-out a guest from a room of a property. See Hotel.check_out()."""
+        return self.call(property_id, "check_out", room_number, on)
+
+    def free_rooms(self, room_type: HotelRoomType, max_price: float = None, arrival=None, departure=None) -> list:
+        """Search the whole chain for free rooms of a type, cheapest first.
+
+        The search runs on every shard at once and the sorted partial results are merged.
+
+        Parameters
+        ----------
+        room_type : HotelRoomType
+            The type of the rooms to find.
+        max_price : float, optional
+            Highest accepted price per night. No limit if omitted.
+        arrival : date, optional
+            First night of the stay. If omitted, rooms unoccupied now are returned.
+        departure : date, optional
+            Day after the last night of the stay. Required with arrival.
+
+        Returns
+        -------
+        list
+            (room_price, property_id, room_number) tuples sorted by price.
+        """
+        args = (HotelRoomType(room_type), max_price, arrival, departure)
+        for connection in self._connections:
+            connection.send(("free_rooms", None, args, {}))
+        partials = []
+        for connection in self._connections:
+            ok, result = connection.recv()
+            if not ok:
+                raise result
+            partials.append(result)
+        return list(heapq.merge(*partials))
+
+
+def main():
+    # TESTING
+    from time import perf_counter
+    from Room import Room
+
+    print("=================================================================")
+    print("Test Case 1: Route Operations by Property.")
+    print("=================================================================")
+    with HotelChain(workers=2) as chain:
+        for property_id in range(4):
+            chain.add_property(property_id, f"Hotel {property_id}")
+            chain.add_rooms(property_id, [Room(HotelRoomType.SUITE, number, "Desocupada", 100 * property_id + number)
+                                          for number in range(1, 4)])
+        first = chain.check_in(2, 1, "Alice")
+        second = chain.check_in(2, 1, "Bob")
+        other = chain.check_in(3, 1, "Bob")
+
+        if (first == "Check-in successful for Alice in room 1." and second == "Room not available or already occupied."
+                and other == "Check-in successful for Bob in room 1." and chain.call(2, "find_room", 1).is_occupied()):
+            print("Test PASS. Operations reach the hotel of their property.")
+        else:
+            print("Test FAIL. Check the methods call(), check_in() and shard().")
+
+        print("=================================================================")
+        print("Test Case 2: Chain-Wide Search.")
+        print("=================================================================")
+        found = chain.free_rooms(HotelRoomType.SUITE, max_price=250)
+
+        if found == [(1, 0, 1), (2, 0, 2), (3, 0, 3), (101, 1, 1), (102, 1, 2), (103, 1, 3), (202, 2, 2), (203, 2, 3)]:
+            print("Test PASS. Results from every shard are merged by price.")
+        else:
+            print("Test FAIL. Check the method free_rooms().")
+
+        try:
+            chain.call(9, "find_room", 1)
+            print("Test FAIL. Check the method call() for unknown properties.")
+        except KeyError:
+            print("Test PASS. Unknown properties are rejected.")
+
+    print("=================================================================")
+    print("Test Case 3: Search Scaling with Workers.")
+    print("=================================================================")
+    timings = {}
+    for workers in sorted({1, os.cpu_count() or 1}):
+        with HotelChain(workers=workers) as chain:
+            for property_id in range(16):
+                chain.add_property(property_id, f"Hotel {property_id}")
+                chain.add_rooms(property_id, [Room(HotelRoomType(("Individual", "Doble", "Suite")[number % 3]), number,
+                                                   "Desocupada", 50 + number % 300) for number in range(20000)])
+            start = perf_counter()
+            for _ in range(5):
+                found = chain.free_rooms(HotelRoomType.SUITE, max_price=60)
+            timings[workers] = (perf_counter() - start) / 5
+        print(f"Test INFO. {workers} worker(s): chain-wide search over 320,000 rooms in {timings[workers]:.3f} s.")
+    expected = 16 * sum(1 for number in range(20000) if number % 3 == 2 and number % 300 <= 10)
+    if len(found) == expected:
+        print("Test PASS. The search returns every matching room.")
+    else:
+        print(f"Test FAIL. Check the method free_rooms() at scale ({len(found)} rooms found).")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,475 @@
+import heapq
+from itertools import count
+from Roomstate import RoomState
+
+class CleaningTask:
+    """Python class to implement the cleaning of a room after a check-out.
+
+    Syntax
+    ------
+    obj = CleaningTask(task_id, room_number, floor, urgency)
+
+    Parameters
+    ----------
+    [in] task_id : int
+        Unique identifier for the task.
+    [in] room_number : int
+        The number of the room to clean.
+    [in] floor : int
+        The floor of the room.
+    [in] urgency : int
+        Days until the next guest arrives in the room. Lower is more urgent.
+
+    Returns
+    -------
+    obj : CleaningTask
+        Python object output parameter that represents an instance of the class CleaningTask.
+
+    Attributes
+    ----------
+    task_id : int
+        Unique identifier for the task.
+    room_number : int
+        The number of the room to clean.
+    floor : int
+        The floor of the room.
+    urgency : int
+        Days until the next guest arrives in the room.
+    status : str
+        "Pendiente", "Asignada", "Completada" or "Cancelada".
+    assignee : int
+        ID of the housekeeper in charge, None while pending.
+    """
+
+    __slots__ = ("task_id", "room_number", "floor", "urgency", "status", "assignee", "_entry")
+
+    def __init__(self, task_id: int, room_number: int, floor: int, urgency: int):
+        self.task_id = task_id
+        self.room_number = room_number
+        self.floor = floor
+        self.urgency = urgency
+        self.status = "Pendiente"
+        self.assignee = None
+        self._entry = None
+
+    def __str__(self) -> str:
+        return f"Clean room {self.room_number}"
+
+
+class HousekeepingScheduler:
+    """Python class to implement the scheduling of room cleaning among housekeepers.
+
+    Every check-out creates a cleaning task for the room. Its urgency is the number of
+    days until the next guest arrives in the room, so rooms needed today come first.
+    Pending tasks wait in one heap per floor. A housekeeper is given the most urgent task,
+    ties going to the floor closest to the last task given to them; only the heads of the
+    floor heaps are compared, so picking a task takes O(floors + log n). Tasks taken off a
+    queue by completion or reassignment are not searched for: their heap entries are
+    skipped when they reach the top.
+
+    Assigned tasks are added to the task list of the housekeeper, an Employee whose
+    position matches. The scheduler follows the hotel: rooms and housekeepers being
+    removed cancel or release their tasks. It also moves the rooms through the
+    housekeeping states: a room waiting for cleaning is "Sucia", "Limpiando" once its task
+    is assigned and "Inspeccionada" when the task is completed.
+
+    Syntax
+    ------
+    obj = HousekeepingScheduler(hotel, position)
+
+    Parameters
+    ----------
+    [in] hotel : Hotel
+        The hotel to follow.
+    [in] position : str
+        Position of the employees who clean rooms. Defaults to "Housekeeper".
+
+    Returns
+    -------
+    obj : HousekeepingScheduler
+        Python object output parameter that represents an instance of the class HousekeepingScheduler.
+
+    Attributes
+    ----------
+    position : str
+        Position of the employees who clean rooms.
+    """
+
+    NO_ARRIVAL = 30
+
+    def __init__(self, hotel, position: str = "Housekeeper"):
+        self.position = position
+        self._hotel = hotel
+        self._ids = count(1)
+        self._entries = count()
+        self._tasks = {}
+        self._open = {}
+        self._queues = {}
+        self._pending = 0
+        self._staff = {employee.get_emp_id() for employee in hotel.employees if employee.get_position() == position}
+        self._loads = {}
+        self._locations = {}
+        hotel.subscribe(self)
+
+    def close(self):
+        """Stop following the hotel."""
+        self._hotel.unsubscribe(self)
+
+    def __call__(self, event: str, obj):
+        if event == "check_out":
+            following = self._hotel.bookings.next_arrival(obj.room_number, obj.departure)
+            urgency = (following.arrival - obj.departure).days if following is not None else self.NO_ARRIVAL
+            self.add_task(obj.room_number, min(urgency, self.NO_ARRIVAL))
+        elif event == "remove_room":
+            task_id = self._open.get(obj.room_number)
+            if task_id is not None:
+                self._finish(self._tasks[task_id], "Cancelada")
+        elif event in ("add_employee", "update_employee"):
+            if obj.get_position() == self.position:
+                self._staff.add(obj.get_emp_id())
+            else:
+                # Tasks already given are kept; no new ones are given.
+                self._staff.discard(obj.get_emp_id())
+        elif event == "remove_employee":
+            emp_id = obj.get_emp_id()
+            self._staff.discard(emp_id)
+            for task in obj.get_tasks():
+                if isinstance(task, CleaningTask) and task.assignee == emp_id:
+                    self.reassign(task.task_id)
+            self._loads.pop(emp_id, None)
+            self._locations.pop(emp_id, None)
+
+    def __len__(self) -> int:
+        return self._pending
+
+    def _push(self, task: CleaningTask):
+        task._entry = next(self._entries)
+        heapq.heappush(self._queues.setdefault(task.floor, []), (task.urgency, task._entry, task.task_id))
+
+    def _mark(self, task: CleaningTask, room_state: RoomState) -> bool:
+        room = self._hotel.find_room(task.room_number)
+        # Rooms removed or taken by a guest meanwhile keep their state, and a new task does
+        # not bring a room out of service back into use.
+        if room is None or room.room_state in (room_state, RoomState.OCUPADA):
+            return True
+        if room_state is RoomState.SUCIA and room.room_state is RoomState.FUERA_DE_SERVICIO:
+            return True
+        result = self._hotel.set_room_state(task.room_number, room_state)
+        return result.startswith(f"Room {task.room_number} is now")
+
+    def _release(self, task: CleaningTask):
+        employee = self._hotel.find_employee(task.assignee)
+        if employee is not None:
+            employee.remove_task(task)
+        self._loads[task.assignee] -= 1
+        task.assignee = None
+
+    def _finish(self, task: CleaningTask, status: str):
+        if task.status == "Pendiente":
+            self._pending -= 1
+        elif task.status == "Asignada":
+            self._release(task)
+        task.status = status
+        del self._open[task.room_number]
+
+    def add_task(self, room_number: int, urgency: int = 0) -> CleaningTask:
+        """Queue the cleaning of a room.
+
+        A room has at most one open task; if it already has one, the task keeps the
+        higher urgency of both.
+
+        Parameters
+        ----------
+        room_number : int
+            The number of the room to clean.
+        urgency : int, optional
+            Days until the next guest arrives in the room. Defaults to 0.
+
+        Returns
+        -------
+        CleaningTask
+            The task of the room.
+        """
+        task_id = self._open.get(room_number)
+        if task_id is not None:
+            task = self._tasks[task_id]
+            if urgency < task.urgency:
+                task.urgency = urgency
+                if task.status == "Pendiente":
+                    self._push(task)
+            return task
+        task = CleaningTask(next(self._ids), room_number, room_number // 100, urgency)
+        self._tasks[task.task_id] = task
+        self._open[room_number] = task.task_id
+        self._pending += 1
+        self._push(task)
+        self._mark(task, RoomState.SUCIA)
+        return task
+
+    def get_task(self, task_id: int):
+        """Get a task by ID.
+
+        Parameters
+        ----------
+        task_id : int
+            The ID of the task.
+
+        Returns
+        -------
+        CleaningTask or None
+            The CleaningTask instance, None if the ID is unknown.
+        """
+        return self._tasks.get(task_id)
+
+    def _pop(self, near):
+        best = None
+        for floor, queue in self._queues.items():
+            while queue:
+                urgency, entry, task_id = queue[0]
+                task = self._tasks[task_id]
+                if task.status == "Pendiente" and task._entry == entry:
+                    break
+                heapq.heappop(queue)
+            if queue:
+                key = (queue[0][0], abs(floor - near) if near is not None else 0, queue[0][1])
+                if best is None or key < best[0]:
+                    best = (key, queue)
+        if best is None:
+            return None
+        return self._tasks[heapq.heappop(best[1])[2]]
+
+    def _give(self, task: CleaningTask, emp_id: int):
+        employee = self._hotel.find_employee(emp_id)
+        if employee is None:
+            raise ValueError(f"Employee {emp_id} not found.")
+        if task.status == "Pendiente":
+            self._pending -= 1
+        task.status = "Asignada"
+        task.assignee = emp_id
+        employee.add_task(task)
+        self._loads[emp_id] = self._loads.get(emp_id, 0) + 1
+        self._locations[emp_id] = task.floor
+        self._mark(task, RoomState.LIMPIANDO)
+
+    def assign_next(self, emp_id: int):
+        """Give a housekeeper the best pending task for them.
+
+        Parameters
+        ----------
+        emp_id : int
+            The ID of the housekeeper.
+
+        Returns
+        -------
+        CleaningTask or None
+            The assigned task, None if no task is pending.
+        """
+        if self._hotel.find_employee(emp_id) is None:
+            raise ValueError(f"Employee {emp_id} not found.")
+        task = self._pop(self._locations.get(emp_id))
+        if task is not None:
+            self._give(task, emp_id)
+        return task
+
+    def assign_all(self, limit: int = None) -> list:
+        """Spread the pending tasks over the housekeepers, always serving the least loaded.
+
+        Parameters
+        ----------
+        limit : int, optional
+            Most open tasks per housekeeper. No limit if omitted.
+
+        Returns
+        -------
+        list
+            The assigned CleaningTask instances.
+        """
+        staff = [(self._loads.get(emp_id, 0), emp_id) for emp_id in self._staff]
+        staff = [member for member in staff if limit is None or member[0] < limit]
+        heapq.heapify(staff)
+        assigned = []
+        while staff and self._pending:
+            load, emp_id = staff[0]
+            task = self._pop(self._locations.get(emp_id))
+            if task is None:
+                break
+            self._give(task, emp_id)
+            assigned.append(task)
+            if limit is None or load + 1 < limit:
+                heapq.heapreplace(staff, (load + 1, emp_id))
+            else:
+                heapq.heappop(staff)
+        return assigned
+
+    def complete(self, task_id: int) -> bool:
+        """Mark a task as done, removing it from the task list of its housekeeper.
+
+        The room is left "Inspeccionada", going through "Limpiando" if the task was still
+        pending. If the room cannot make those moves, e.g. it is out of service, the task
+        stays open.
+
+        Parameters
+        ----------
+        task_id : int
+            The ID of the task.
+
+        Returns
+        -------
+        bool
+            True if the task was open and has been completed, False otherwise.
+        """
+        task = self._tasks.get(task_id)
+        if task is None or task.status not in ("Pendiente", "Asignada"):
+            return False
+        if task.status == "Pendiente" and not self._mark(task, RoomState.LIMPIANDO):
+            return False
+        if not self._mark(task, RoomState.INSPECCIONADA):
+            return False
+        self._finish(task, "Completada")
+        return True
+
+    def reassign(self, task_id: int, emp_id: int = None) -> bool:
+        """Move an open task to another housekeeper, or back to the queue.
+
+        Parameters
+        ----------
+        task_id : int
+            The ID of the task.
+        emp_id : int, optional
+            The ID of the new housekeeper. If omitted, the task is queued again.
+
+        Returns
+        -------
+        bool
+            True if the task was open, False otherwise.
+        """
+        task = self._tasks.get(task_id)
+        if task is None or task.status not in ("Pendiente", "Asignada"):
+            return False
+        if emp_id is not None and self._hotel.find_employee(emp_id) is None:
+            raise ValueError(f"Employee {emp_id} not found.")
+        if task.status == "Asignada":
+            self._release(task)
+            task.status = "Pendiente"
+            self._pending += 1
+            self._push(task)
+            self._mark(task, RoomState.SUCIA)
+        if emp_id is not None:
+            self._give(task, emp_id)
+        return True
+
+
+def main():
+    # TESTING
+    from datetime import date, timedelta
+    from random import Random
+    from time import perf_counter
+    from Employee import Employee
+    from Hotel import Hotel
+    from Room import Room
+    from Roomtype import HotelRoomType
+
+    monday = date(2030, 1, 7)
+    day = timedelta(days=1)
+    hotel = Hotel("Grand Hotel")
+    for number in (101, 102, 301, 302):
+        hotel.add_room(Room(HotelRoomType.DOBLE, number, "Desocupada", 100))
+    hotel.add_employee(Employee(1, "Ana", "Housekeeper", 20000))
+    hotel.add_employee(Employee(2, "Luis", "Housekeeper", 20000))
+    hotel.add_employee(Employee(3, "Marta", "Receptionist", 25000))
+    scheduler = HousekeepingScheduler(hotel)
+
+    print("=================================================================")
+    print("Test Case 1: Check-Outs Create Cleaning Tasks.")
+    print("=================================================================")
+    for number in (101, 102, 301, 302):
+        hotel.check_in(number, f"Guest {number}", on=monday)
+    hotel.reserve(302, "Next Guest", monday + day, monday + 2 * day)
+    for number in (101, 102, 301, 302):
+        hotel.check_out(number, on=monday + day)
+
+    if len(scheduler) == 4 and scheduler.get_task(4).room_number == 302 and scheduler.get_task(4).urgency == 0:
+        print("Test PASS. Every check-out queues its room, urgent if a guest arrives that day.")
+    else:
+        print("Test FAIL. Check the handling of check_out events.")
+
+    print("=================================================================")
+    print("Test Case 2: Assign by Urgency and Floor.")
+    print("=================================================================")
+    first = scheduler.assign_next(1)
+    second = scheduler.assign_next(1)
+    rest = scheduler.assign_all()
+
+    if (first.room_number == 302 and second.room_number == 301 and len(rest) == 2 and len(scheduler) == 0
+            and [str(task) for task in hotel.find_employee(1).get_tasks()] == ["Clean room 302", "Clean room 301"]
+            and hotel.find_employee(3).get_tasks() == []):
+        print("Test PASS. Urgent rooms come first, then rooms on the housekeeper's floor.")
+    else:
+        print("Test FAIL. Check the methods assign_next() and assign_all().")
+
+    print("=================================================================")
+    print("Test Case 3: Complete and Reassign.")
+    print("=================================================================")
+    scheduler.complete(first.task_id)
+    scheduler.reassign(second.task_id, 2)
+    moved = rest[0]
+    hotel.remove_employee(2)
+
+    if (first.status == "Completada" and [str(task) for task in hotel.find_employee(1).get_tasks()] == []
+            and second.status == "Pendiente" and moved.status == "Pendiente" and len(scheduler) == 3
+            and hotel.find_room(302).room_state == "Inspeccionada" and hotel.find_room(301).room_state == "Sucia"
+            and hotel.check_in(301, "Eve") == "Room not available or already occupied."
+            and hotel.check_in(302, "Eve") == "Check-in successful for Eve in room 302."):
+        print("Test PASS. Tasks are completed, moved and released when a housekeeper leaves.")
+    else:
+        print("Test FAIL. Check the methods complete() and reassign().")
+
+    pending = scheduler.complete(second.task_id)
+    hotel.set_room_state(moved.room_number, "Fuera de servicio")
+    blocked = scheduler.complete(moved.task_id)
+
+    if (pending and hotel.find_room(301).room_state == "Inspeccionada" and not blocked
+            and moved.status == "Pendiente" and hotel.find_room(moved.room_number).room_state == "Fuera de servicio"
+            and hotel.check_in(301, "Eve") == "Check-in successful for Eve in room 301."):
+        print("Test PASS. Pending tasks are cleaned on completion and rooms out of service keep their task.")
+    else:
+        print("Test FAIL. Check the room states set by complete().")
+
+    hotel.add_room(Room(HotelRoomType.DOBLE, 103, "Desocupada", 100))
+    moved = hotel.move_guest(302, 103, "Fuera de servicio")
+    task = scheduler.get_task(scheduler._open[302])
+
+    if (moved == "Eve moved from room 302 to room 103." and task.status == "Pendiente"
+            and hotel.find_room(302).room_state == "Fuera de servicio"):
+        print("Test PASS. A room taken out of service in a move is queued and stays out of service.")
+    else:
+        print("Test FAIL. Check the handling of check_out events inside a transaction.")
+
+    print("=================================================================")
+    print("Test Case 4: Balance Thousands of Turnovers.")
+    print("=================================================================")
+    hotel = Hotel("Big Hotel")
+    hotel.add_rooms(Room(HotelRoomType.DOBLE, floor * 100 + number, "Desocupada", 100)
+                    for floor in range(1, 26) for number in range(80))
+    for emp_id in range(100):
+        hotel.add_employee(Employee(emp_id, f"Housekeeper {emp_id}", "Housekeeper", 20000))
+    scheduler = HousekeepingScheduler(hotel)
+    generator = Random(7)
+    start = perf_counter()
+    for room in hotel.rooms:
+        scheduler.add_task(room.room_number, generator.randrange(4))
+    assigned = scheduler.assign_all()
+    loads = [len(employee.get_tasks()) for employee in hotel.employees]
+    for task in assigned[::2]:
+        scheduler.complete(task.task_id)
+    for task in assigned[1::4]:
+        scheduler.reassign(task.task_id)
+    elapsed = perf_counter() - start
+
+    if len(assigned) == 2000 and max(loads) == min(loads) == 20 and len(scheduler) == 500:
+        print(f"Test PASS. Scheduled 2,000 turnovers over 100 housekeepers in {elapsed * 1000:.0f} ms.")
+    else:
+        print(f"Test FAIL. Check the scheduler at scale (loads {min(loads)}-{max(loads)}).")
+
+if __name__ == "__main__":
+    main()
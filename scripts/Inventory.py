@@ -0,0 +1,250 @@
+from array import array
+from Employee import Employee
+from Room import Room
+from Roomtype import HotelRoomType
+from Roomstate import RoomState
+
+ROOM_TYPES = list(HotelRoomType)
+TYPE_CODES = {room_type: code for code, room_type in enumerate(ROOM_TYPES)}
+ROOM_STATES = list(RoomState)
+STATE_CODES = {room_state: code for code, room_state in enumerate(ROOM_STATES)}
+OCCUPIED = STATE_CODES[RoomState.OCUPADA]
+
+class RoomColumns:
+    """Python class to implement a columnar snapshot of the room inventory.
+
+    This Python class stores the rooms of a hotel as parallel typed arrays, one per
+    attribute, so reports can aggregate whole columns instead of visiting every Room
+    object. Row i of every column describes the same room. At 18 bytes per room it is
+    also the compact container for holding very large inventories in memory.
+
+    Syntax
+    ------
+    obj = RoomColumns()
+    obj = RoomColumns.from_rooms(rooms)
+
+    Parameters
+    ----------
+
+    Returns
+    -------
+    obj : RoomColumns
+        Python object output parameter that represents an instance of the class RoomColumns.
+
+    Attributes
+    ----------
+    room_number : array
+        Number of each room (signed 64-bit integers).
+    room_type : array
+        Type code of each room, the position of its HotelRoomType in ROOM_TYPES (signed bytes).
+    room_state : array
+        State code of each room, the position of its state in ROOM_STATES (signed bytes).
+    room_price : array
+        Price per night of each room (doubles).
+    """
+
+    def __init__(self):
+        self.room_number = array("q")
+        self.room_type = array("b")
+        self.room_state = array("b")
+        self.room_price = array("d")
+
+    def __len__(self) -> int:
+        return len(self.room_number)
+
+    @classmethod
+    def from_rooms(cls, rooms) -> "RoomColumns":
+        """Build a snapshot from an iterable of rooms.
+
+        Parameters
+        ----------
+        rooms : iterable
+            Room instances, e.g. hotel.rooms.
+
+        Returns
+        -------
+        RoomColumns
+            The columnar snapshot of the rooms.
+        """
+        columns = cls()
+        for room in rooms:
+            columns.append(room)
+        return columns
+
+    def nbytes(self) -> int:
+        """Get the memory used by the column buffers.
+
+        Returns
+        -------
+        int
+            Total size in bytes of the four arrays' items.
+        """
+        return sum(column.itemsize * len(column)
+                   for column in (self.room_number, self.room_type, self.room_state, self.room_price))
+
+    def append(self, room: Room):
+        """Append a room as a new row.
+
+        Parameters
+        ----------
+        room : Room
+            The Room instance to be added.
+        """
+        self.room_number.append(room.room_number)
+        self.room_type.append(TYPE_CODES[HotelRoomType(room.room_type)])
+        self.room_state.append(STATE_CODES[room.room_state])
+        self.room_price.append(room.room_price)
+
+    def room(self, index: int) -> Room:
+        """Build the Room instance of a row.
+
+        Parameters
+        ----------
+        index : int
+            Position of the row.
+
+        Returns
+        -------
+        Room
+            A new Room instance with the values of the row.
+        """
+        return Room(ROOM_TYPES[self.room_type[index]], self.room_number[index],
+                    ROOM_STATES[self.room_state[index]], self.room_price[index])
+
+
+class EmployeeColumns:
+    """Python class to implement a columnar snapshot of the staff.
+
+    The counterpart of RoomColumns for employees: one typed array per numeric attribute,
+    and positions stored as codes into a shared list of position names. Batch jobs such as
+    payroll read whole columns instead of calling the getters of every Employee.
+
+    Syntax
+    ------
+    obj = EmployeeColumns()
+    obj = EmployeeColumns.from_employees(employees)
+
+    Parameters
+    ----------
+
+    Returns
+    -------
+    obj : EmployeeColumns
+        Python object output parameter that represents an instance of the class EmployeeColumns.
+
+    Attributes
+    ----------
+    emp_id : array
+        ID of each employee (signed 64-bit integers).
+    position : array
+        Position code of each employee, the index of its name in positions (32-bit integers).
+    salary : array
+        Yearly salary of each employee (doubles).
+    positions : list
+        Names of the positions, in order of first appearance.
+    """
+
+    def __init__(self):
+        self.emp_id = array("q")
+        self.position = array("i")
+        self.salary = array("d")
+        self.positions = []
+        self._position_codes = {}
+
+    def __len__(self) -> int:
+        return len(self.emp_id)
+
+    @classmethod
+    def from_employees(cls, employees) -> "EmployeeColumns":
+        """Build a snapshot from an iterable of employees.
+
+        Parameters
+        ----------
+        employees : iterable
+            Employee instances, e.g. hotel.employees.
+
+        Returns
+        -------
+        EmployeeColumns
+            The columnar snapshot of the employees.
+        """
+        columns = cls()
+        for employee in employees:
+            columns.append(employee)
+        return columns
+
+    def position_code(self, position: str) -> int:
+        """Get the code of a position, adding the position if it is new.
+
+        Parameters
+        ----------
+        position : str
+            The name of the position.
+
+        Returns
+        -------
+        int
+            The index of the position in positions.
+        """
+        code = self._position_codes.get(position)
+        if code is None:
+            code = self._position_codes[position] = len(self.positions)
+            self.positions.append(position)
+        return code
+
+    def append(self, employee: Employee):
+        """Append an employee as a new row.
+
+        Parameters
+        ----------
+        employee : Employee
+            The Employee instance to be added.
+        """
+        self.emp_id.append(employee.get_emp_id())
+        self.position.append(self.position_code(employee.get_position()))
+        self.salary.append(employee.get_salary())
+
+
+def main():
+    # TESTING
+    print("=================================================================")
+    print("Test Case 1: Build Columns from Rooms.")
+    print("=================================================================")
+    rooms = [Room(HotelRoomType.INDIVIDUAL, 101, "Desocupada", 80),
+             Room(HotelRoomType.SUITE, 102, "Ocupada", 300),
+             Room("Doble", 103, "Desocupada", 150)]
+    columns = RoomColumns.from_rooms(rooms)
+
+    if (len(columns) == 3 and list(columns.room_number) == [101, 102, 103]
+            and list(columns.room_type) == [0, 2, 1] and list(columns.room_state) == [0, 1, 0]
+            and list(columns.room_price) == [80.0, 300.0, 150.0]):
+        print("Test PASS. The columns have been correctly filled.")
+    else:
+        print("Test FAIL. Check the methods from_rooms() and append().")
+
+    print("=================================================================")
+    print("Test Case 2: Rebuild a Room from a Row.")
+    print("=================================================================")
+    room = columns.room(1)
+
+    if (room.room_type == HotelRoomType.SUITE and room.room_number == 102
+            and room.room_state == "Ocupada" and room.room_price == 300):
+        print("Test PASS. The row has been correctly converted back to a Room.")
+    else:
+        print("Test FAIL. Check the method room().")
+
+    print("=================================================================")
+    print("Test Case 3: Build Columns from Employees.")
+    print("=================================================================")
+    columns = EmployeeColumns.from_employees([Employee(1, "Ana", "Housekeeper", 20000),
+                                              Employee(2, "Luis", "Receptionist", 25000),
+                                              Employee(3, "Marta", "Housekeeper", 21000)])
+
+    if (list(columns.emp_id) == [1, 2, 3] and list(columns.position) == [0, 1, 0]
+            and columns.positions == ["Housekeeper", "Receptionist"] and list(columns.salary) == [20000, 25000, 21000]):
+        print("Test PASS. The employee columns have been correctly filled.")
+    else:
+        print("Test FAIL. Check the methods from_employees() and append().")
+
+if __name__ == "__main__":
+    main()
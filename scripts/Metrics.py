@@ -0,0 +1,353 @@
+import cProfile
+import pstats
+from bisect import bisect_left
+from time import perf_counter_ns
+
+OPERATIONS = ("check_in", "check_out", "find_room", "add_room", "remove_room", "set_room_state", "reserve",
+              "cancel_reservation", "displace_reservation", "add_employee", "remove_employee", "update_employee",
+              "find_employee")
+
+# Bucket upper bounds in nanoseconds: 1, 2.5 and 5 times every power of ten from 100 ns to 10 s.
+BUCKETS = tuple(int(mantissa * 10 ** exponent) for exponent in range(2, 10) for mantissa in (1, 2.5, 5)) + (10 ** 10,)
+
+class Histogram:
+    """Python class to implement a latency histogram with fixed buckets.
+
+    Syntax
+    ------
+    obj = Histogram(bounds)
+
+    Parameters
+    ----------
+    [in] bounds : tuple
+        Sorted bucket upper bounds in nanoseconds. Defaults to BUCKETS.
+
+    Returns
+    -------
+    obj : Histogram
+        Python object output parameter that represents an instance of the class Histogram.
+
+    Attributes
+    ----------
+    bounds : tuple
+        Bucket upper bounds in nanoseconds.
+    counts : list
+        Observations per bucket; the last one counts those above every bound.
+    total : int
+        Sum of the observations in nanoseconds.
+    """
+
+    __slots__ = ("bounds", "counts", "total")
+
+    def __init__(self, bounds: tuple = BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0
+
+    def observe(self, nanoseconds: int):
+        """Record one observation.
+
+        Parameters
+        ----------
+        nanoseconds : int
+            The observed latency.
+        """
+        self.counts[bisect_left(self.bounds, nanoseconds)] += 1
+        self.total += nanoseconds
+
+    def count(self) -> int:
+        """Get the number of observations."""
+        return sum(self.counts)
+
+    def quantile(self, fraction: float) -> float:
+        """Estimate a quantile as the upper bound of the bucket that holds it.
+
+        Parameters
+        ----------
+        fraction : float
+            The quantile, from 0 to 1 (e.g., 0.99).
+
+        Returns
+        -------
+        float
+            The estimate in seconds, inf if it lies above every bound, 0 if empty.
+        """
+        rank = fraction * self.count()
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if count and seen >= rank:
+                return bound / 1e9
+        return float("inf") if self.counts[-1] else 0.0
+
+
+class Metrics:
+    """Python class to implement the metrics of an instrumented hotel.
+
+    Holds a latency histogram per operation, free-form counters and, when sampling is
+    enabled, the profile of the sampled calls. Everything can be exported in the
+    Prometheus text format or as a JSON-serializable dictionary.
+
+    Syntax
+    ------
+    obj = Metrics()
+
+    Parameters
+    ----------
+
+    Returns
+    -------
+    obj : Metrics
+        Python object output parameter that represents an instance of the class Metrics.
+
+    Attributes
+    ----------
+    histograms : dict
+        Histogram of each operation, by name.
+    counters : dict
+        Counter values, by name.
+    profiler : cProfile.Profile
+        Profile of the sampled calls, None if sampling is disabled.
+    """
+
+    def __init__(self):
+        self.histograms = {}
+        self.counters = {}
+        self.profiler = None
+        # Sampled calls running under the profiler; only the outermost one turns it on and off.
+        self._depth = 0
+
+    def increment(self, name: str, value: int = 1):
+        """Add to a counter.
+
+        Parameters
+        ----------
+        name : str
+            The name of the counter.
+        value : int, optional
+            The amount to add. Defaults to 1.
+        """
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def profile_stats(self):
+        """Get the statistics of the sampled calls, None if sampling is disabled.
+
+        Returns
+        -------
+        pstats.Stats or None
+            The profile, ready to be sorted and printed.
+        """
+        return pstats.Stats(self.profiler) if self.profiler is not None else None
+
+    def to_prometheus(self) -> str:
+        """Export the metrics in the Prometheus text exposition format.
+
+        Returns
+        -------
+        str
+            One hotel_operation_seconds histogram labelled by operation, and one
+            hotel_<name>_total counter per counter.
+        """
+        lines = ["# HELP hotel_operation_seconds Latency of Hotel operations.",
+                 "# TYPE hotel_operation_seconds histogram"]
+        for name, histogram in self.histograms.items():
+            cumulative = 0
+            for bound, count in zip(histogram.bounds, histogram.counts):
+                cumulative += count
+                lines.append(f'hotel_operation_seconds_bucket{{operation="{name}",le="{bound / 1e9:g}"}} {cumulative}')
+            cumulative += histogram.counts[-1]
+            lines.append(f'hotel_operation_seconds_bucket{{operation="{name}",le="+Inf"}} {cumulative}')
+            lines.append(f'hotel_operation_seconds_sum{{operation="{name}"}} {histogram.total / 1e9:.9f}')
+            lines.append(f'hotel_operation_seconds_count{{operation="{name}"}} {cumulative}')
+        for name, value in self.counters.items():
+            lines.append(f"# TYPE hotel_{name}_total counter")
+            lines.append(f"hotel_{name}_total {value}")
+        return "\n".join(lines) + "\n"
+
+    def to_json(self) -> dict:
+        """Export the metrics as a JSON-serializable dictionary.
+
+        Returns
+        -------
+        dict
+            {"operations": {name: {"count", "total_seconds", "mean_seconds", "p50_seconds",
+            "p99_seconds"}}, "counters": {name: value}}.
+        """
+        operations = {}
+        for name, histogram in self.histograms.items():
+            count = histogram.count()
+            operations[name] = {"count": count, "total_seconds": histogram.total / 1e9,
+                                "mean_seconds": histogram.total / 1e9 / count if count else 0.0,
+                                "p50_seconds": histogram.quantile(0.5), "p99_seconds": histogram.quantile(0.99)}
+        return {"operations": operations, "counters": dict(self.counters)}
+
+
+def _timed(method, histogram: Histogram):
+    counts = histogram.counts
+    bounds = histogram.bounds
+
+    def timed(*args, **kwargs):
+        start = perf_counter_ns()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            elapsed = perf_counter_ns() - start
+            counts[bisect_left(bounds, elapsed)] += 1
+            histogram.total += elapsed
+
+    return timed
+
+def _sampled(method, histogram: Histogram, metrics: Metrics, every: int):
+    timed = _timed(method, histogram)
+    calls = [0]
+
+    def sampled(*args, **kwargs):
+        calls[0] += 1
+        if calls[0] % every and not metrics._depth:
+            return timed(*args, **kwargs)
+        if not metrics._depth:
+            metrics.profiler.enable()
+        metrics._depth += 1
+        try:
+            return timed(*args, **kwargs)
+        finally:
+            metrics._depth -= 1
+            if not metrics._depth:
+                metrics.profiler.disable()
+
+    return sampled
+
+def instrument(hotel, operations: tuple = OPERATIONS, metrics: Metrics = None, sample_every: int = 0) -> Metrics:
+    """Start measuring the operations of a hotel.
+
+    The hotel is moved to a subclass of its class, made for it, whose operations time
+    each call into the histogram of the operation. Other hotels and hotels never
+    instrumented run the plain methods and pay nothing, and uninstrument() moves the hotel
+    back to its class. Calls an operation makes to another instrumented operation, like the
+    find_room() inside check_in(), are measured too.
+
+    Parameters
+    ----------
+    hotel : Hotel
+        The hotel to instrument.
+    operations : tuple, optional
+        Names of the methods to measure. Defaults to OPERATIONS.
+    metrics : Metrics, optional
+        Where to record, e.g. to share one Metrics among several hotels. A new one if omitted.
+    sample_every : int, optional
+        Run one call in sample_every of each operation under cProfile, along with every
+        instrumented call it makes. Disabled if 0.
+
+    Returns
+    -------
+    Metrics
+        The metrics being recorded.
+    """
+    uninstrument(hotel)
+    metrics = metrics or Metrics()
+    if sample_every and metrics.profiler is None:
+        metrics.profiler = cProfile.Profile()
+    base = type(hotel)
+    namespace = {"_instrumented_base": base}
+    for name in operations:
+        histogram = metrics.histograms.setdefault(name, Histogram())
+        if sample_every:
+            namespace[name] = _sampled(getattr(base, name), histogram, metrics, sample_every)
+        else:
+            namespace[name] = _timed(getattr(base, name), histogram)
+    hotel.__class__ = type(f"Instrumented{base.__name__}", (base,), namespace)
+    return metrics
+
+def uninstrument(hotel):
+    """Stop measuring the operations of a hotel, restoring its class.
+
+    Parameters
+    ----------
+    hotel : Hotel
+        The instrumented hotel. Hotels not instrumented are left as they are.
+    """
+    base = type(hotel).__dict__.get("_instrumented_base")
+    if base is not None:
+        hotel.__class__ = base
+
+
+def main():
+    # TESTING
+    import json
+    from Employee import Employee
+    from Hotel import Hotel
+    from Room import Room
+    from Roomtype import HotelRoomType
+
+    print("=================================================================")
+    print("Test Case 1: Count and Time Operations.")
+    print("=================================================================")
+    hotel = Hotel("Grand Hotel")
+    metrics = instrument(hotel)
+    for number in range(10):
+        hotel.add_room(Room(HotelRoomType.DOBLE, number, "Desocupada", 100))
+    hotel.add_employee(Employee(1, "John Doe", "Receptionist", 30000))
+    result = hotel.check_in(3, "Alice")
+    hotel.check_out(3)
+    report = metrics.to_json()["operations"]
+
+    if (result == "Check-in successful for Alice in room 3." and report["add_room"]["count"] == 10
+            and report["check_in"]["count"] == 1 and report["add_employee"]["count"] == 1
+            and report["check_in"]["p99_seconds"] > 0 and report["remove_room"]["count"] == 0):
+        print("Test PASS. Every call has been counted and timed.")
+    else:
+        print("Test FAIL. Check the function instrument().")
+
+    print("=================================================================")
+    print("Test Case 2: Export Prometheus Text and JSON.")
+    print("=================================================================")
+    metrics.increment("listings")
+    text = metrics.to_prometheus()
+    lines = text.splitlines()
+
+    if ('hotel_operation_seconds_count{operation="add_room"} 10' in lines
+            and 'hotel_operation_seconds_bucket{operation="check_in",le="+Inf"} 1' in lines
+            and "hotel_listings_total 1" in lines and json.loads(json.dumps(metrics.to_json()))):
+        print("Test PASS. The metrics have been exported.")
+    else:
+        print("Test FAIL. Check the methods to_prometheus() and to_json().")
+
+    print("=================================================================")
+    print("Test Case 3: Sampling Profiler and Removal.")
+    print("=================================================================")
+    hotel = Hotel("Profiled Hotel")
+    metrics = instrument(hotel, ("add_room",), sample_every=5)
+    for number in range(20):
+        hotel.add_room(Room(HotelRoomType.DOBLE, number, "Desocupada", 100))
+    stats = metrics.profile_stats()
+    sampled = sum(calls for (_, _, name), (_, calls, *_rest) in stats.stats.items() if name == "add_room")
+    uninstrument(hotel)
+    hotel.add_room(Room(HotelRoomType.DOBLE, 99, "Desocupada", 100))
+
+    if sampled == 4 and metrics.histograms["add_room"].count() == 20 and type(hotel) is Hotel:
+        print("Test PASS. One call in five has been profiled and the hotel restored.")
+    else:
+        print("Test FAIL. Check the sampling of instrument() and uninstrument().")
+
+    print("=================================================================")
+    print("Test Case 4: Nested Sampled Calls.")
+    print("=================================================================")
+    hotel = Hotel("Nested Hotel")
+    hotel.add_room(Room(HotelRoomType.DOBLE, 1, "Desocupada", 100))
+    hotel.add_employee(Employee(1, "John Doe", "Receptionist", 30000))
+    metrics = instrument(hotel, sample_every=1)
+    hotel.check_in(1, "Alice")
+    hotel.check_out(1)
+    hotel.set_room_state(1, "Limpiando")
+    hotel.update_employee(1, salary=32000)
+    names = {name for _, _, name in metrics.profile_stats().stats}
+
+    if ("find_room" in names and "book" in names and metrics._depth == 0
+            and metrics.histograms["set_room_state"].count() == 1
+            and metrics.histograms["update_employee"].count() == 1):
+        print("Test PASS. The profile covers the whole of the outer call.")
+    else:
+        print("Test FAIL. Check the function _sampled().")
+
+if __name__ == "__main__":
+    main()
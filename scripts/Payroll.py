@@ -0,0 +1,259 @@
+import heapq
+from array import array
+from datetime import date, timedelta
+from Inventory import EmployeeColumns
+
+def week_of(day: date) -> int:
+    """Get the number of the Monday-to-Sunday week of a day, counted from date.min."""
+    return (day.toordinal() - 1) // 7
+
+class Roster:
+    """Python class to implement a roster of staff shifts.
+
+    Shifts are stored as parallel typed arrays, one row per shift, so payroll can run
+    over the whole roster in one pass.
+
+    Syntax
+    ------
+    obj = Roster()
+
+    Parameters
+    ----------
+
+    Returns
+    -------
+    obj : Roster
+        Python object output parameter that represents an instance of the class Roster.
+
+    Attributes
+    ----------
+    emp_id : array
+        ID of the employee working each shift (signed 64-bit integers).
+    day : array
+        Day of each shift as a proleptic Gregorian ordinal (32-bit integers).
+    start : array
+        Starting hour of each shift (signed bytes).
+    hours : array
+        Length of each shift in hours (doubles).
+    """
+
+    def __init__(self):
+        self.emp_id = array("q")
+        self.day = array("i")
+        self.start = array("b")
+        self.hours = array("d")
+
+    def __len__(self) -> int:
+        return len(self.emp_id)
+
+    def add_shift(self, emp_id: int, day: date, start: int, hours: float):
+        """Add a shift to the roster.
+
+        Parameters
+        ----------
+        emp_id : int
+            The ID of the employee.
+        day : date
+            The day of the shift.
+        start : int
+            Starting hour, from 0 to 23.
+        hours : float
+            Length of the shift in hours.
+        """
+        self.emp_id.append(emp_id)
+        self.day.append(day.toordinal())
+        self.start.append(start)
+        self.hours.append(hours)
+
+
+def payroll(employees: EmployeeColumns, roster: Roster, start: date, end: date, weekly_hours: float = 40,
+            overtime_rate: float = 1.5, annual_hours: float = 2080) -> dict:
+    """Compute the hours and pay of all the staff for a period in one batch.
+
+    Hours are added up per employee and per Monday-to-Sunday week in a single pass over
+    the roster. Hours beyond weekly_hours in a week are overtime. The hourly rate is the
+    yearly salary divided by annual_hours, and overtime is paid overtime_rate times that.
+    Only shifts inside the period count, so a week cut by its edges is judged on the
+    days inside it.
+
+    Parameters
+    ----------
+    employees : EmployeeColumns
+        The staff, e.g. EmployeeColumns.from_employees(hotel.employees).
+    roster : Roster
+        The worked shifts.
+    start : date
+        First day of the period.
+    end : date
+        Day after the last day of the period.
+    weekly_hours : float, optional
+        Regular hours per week. Defaults to 40.
+    overtime_rate : float, optional
+        Pay multiplier of overtime hours. Defaults to 1.5.
+    annual_hours : float, optional
+        Paid hours per year, used to get the hourly rate. Defaults to 2080.
+
+    Returns
+    -------
+    dict
+        Arrays aligned with the employee columns: "emp_id", "regular_hours",
+        "overtime_hours" and "pay".
+    """
+    count = len(employees)
+    first_week = week_of(start)
+    weeks = week_of(end - timedelta(days=1)) - first_week + 1
+    rows = {emp_id: row for row, emp_id in enumerate(employees.emp_id)}
+    worked = array("d", bytes(8 * count * weeks))
+    lo, hi = start.toordinal(), end.toordinal()
+    for emp_id, day, hours in zip(roster.emp_id, roster.day, roster.hours):
+        if lo <= day < hi:
+            row = rows.get(emp_id)
+            if row is not None:
+                worked[row * weeks + (day - 1) // 7 - first_week] += hours
+
+    regular = array("d", bytes(8 * count))
+    overtime = array("d", bytes(8 * count))
+    for row in range(count):
+        for hours in worked[row * weeks:(row + 1) * weeks]:
+            if hours > weekly_hours:
+                regular[row] += weekly_hours
+                overtime[row] += hours - weekly_hours
+            else:
+                regular[row] += hours
+    pay = array("d", [salary / annual_hours * (normal + overtime_rate * extra)
+                      for salary, normal, extra in zip(employees.salary, regular, overtime)])
+    return {"emp_id": employees.emp_id, "regular_hours": regular, "overtime_hours": overtime, "pay": pay}
+
+def fill_coverage(employees: EmployeeColumns, roster: Roster, requirements: list, max_weekly_hours: float = 40) -> list:
+    """Staff the shifts required per position, adding them to the roster.
+
+    Requirements are filled in chronological order. For each one, the employees of the
+    position with the fewest hours that week are taken from a heap, skipping those who
+    already work that day or would go over max_weekly_hours. Existing shifts of the roster
+    count towards both limits.
+
+    Parameters
+    ----------
+    employees : EmployeeColumns
+        The staff.
+    roster : Roster
+        The roster to fill. Assigned shifts are added to it.
+    requirements : list
+        (day, start, hours, position, count) tuples: count employees of the position
+        needed for a shift of hours starting at hour start of day.
+    max_weekly_hours : float, optional
+        Most hours per employee and week. Defaults to 40.
+
+    Returns
+    -------
+    list
+        (day, start, position, missing) tuples for the requirements that could not be met.
+    """
+    weekly = {}
+    working = set()
+    for emp_id, day, hours in zip(roster.emp_id, roster.day, roster.hours):
+        key = (emp_id, (day - 1) // 7)
+        weekly[key] = weekly.get(key, 0) + hours
+        working.add((emp_id, day))
+
+    codes = {name: code for code, name in enumerate(employees.positions)}
+    unfilled = []
+    heaps = None
+    current_week = None
+    for day, start, hours, position, needed in sorted(requirements, key=lambda requirement: requirement[:2]):
+        week = week_of(day)
+        if week != current_week:
+            current_week = week
+            heaps = {}
+            for emp_id, code in zip(employees.emp_id, employees.position):
+                heaps.setdefault(code, []).append((weekly.get((emp_id, week), 0), emp_id))
+            for heap in heaps.values():
+                heapq.heapify(heap)
+        heap = heaps.get(codes.get(position), [])
+        ordinal = day.toordinal()
+        skipped = []
+        while needed and heap and heap[0][0] + hours <= max_weekly_hours:
+            worked, emp_id = heapq.heappop(heap)
+            if (emp_id, ordinal) in working:
+                skipped.append((worked, emp_id))
+                continue
+            roster.add_shift(emp_id, day, start, hours)
+            working.add((emp_id, ordinal))
+            weekly[(emp_id, week)] = worked + hours
+            skipped.append((worked + hours, emp_id))
+            needed -= 1
+        for entry in skipped:
+            heapq.heappush(heap, entry)
+        if needed:
+            unfilled.append((day, start, position, needed))
+    return unfilled
+
+
+def main():
+    # TESTING
+    from time import perf_counter
+    from Employee import Employee
+
+    monday = date(2030, 1, 7)
+    day = timedelta(days=1)
+
+    print("=================================================================")
+    print("Test Case 1: Hours, Overtime and Pay.")
+    print("=================================================================")
+    employees = EmployeeColumns.from_employees([Employee(1, "Ana", "Housekeeper", 20800),
+                                                Employee(2, "Luis", "Receptionist", 41600)])
+    roster = Roster()
+    for offset in range(5):
+        roster.add_shift(1, monday + offset * day, 8, 10)
+        roster.add_shift(2, monday + offset * day, 8, 8)
+    roster.add_shift(2, monday + 7 * day, 8, 8)
+    roster.add_shift(2, monday + 30 * day, 8, 8)
+    report = payroll(employees, roster, monday, monday + 14 * day)
+
+    if (list(report["regular_hours"]) == [40, 48] and list(report["overtime_hours"]) == [10, 0]
+            and list(report["pay"]) == [10 * 40 + 15 * 10, 20 * 48]):
+        print("Test PASS. Weekly overtime is paid at one and a half times the hourly rate.")
+    else:
+        print("Test FAIL. Check the function payroll().")
+
+    print("=================================================================")
+    print("Test Case 2: Fill Shift Coverage.")
+    print("=================================================================")
+    employees = EmployeeColumns.from_employees([Employee(emp_id, f"Housekeeper {emp_id}", "Housekeeper", 20000)
+                                                for emp_id in range(3)] + [Employee(9, "Marta", "Manager", 50000)])
+    roster = Roster()
+    roster.add_shift(0, monday, 8, 8)
+    requirements = [(monday + offset * day, 8, 8, "Housekeeper", 2) for offset in range(7)]
+    requirements.append((monday, 0, 8, "Night Auditor", 1))
+    unfilled = fill_coverage(employees, roster, requirements)
+    hours = payroll(employees, roster, monday, monday + 7 * day)["regular_hours"]
+
+    if (unfilled == [(monday, 0, "Night Auditor", 1)]
+            and list(hours) == [40, 40, 40, 0] and len(roster) == 15):
+        print("Test PASS. Shifts go to the least busy staff within the weekly limit.")
+    else:
+        print("Test FAIL. Check the function fill_coverage().")
+
+    print("=================================================================")
+    print("Test Case 3: Monthly Payroll for 50,000 Employees.")
+    print("=================================================================")
+    employees = EmployeeColumns.from_employees(Employee(emp_id, f"Employee {emp_id}", "Housekeeper",
+                                                        20000 + emp_id % 1000) for emp_id in range(50000))
+    roster = Roster()
+    first = date(2030, 1, 1)
+    for offset in range(31):
+        shift_day = first + offset * day
+        if shift_day.weekday() < 5:
+            for emp_id in range(50000):
+                roster.add_shift(emp_id, shift_day, 8, 8 + emp_id % 3)
+    start = perf_counter()
+    report = payroll(employees, roster, first, first + 31 * day)
+    elapsed = perf_counter() - start
+
+    if len(report["pay"]) == 50000 and report["overtime_hours"][2] > 0 and report["overtime_hours"][0] == 0:
+        print(f"Test PASS. Payroll of {len(roster):,} shifts computed in {elapsed:.2f} s.")
+    else:
+        print("Test FAIL. Check the function payroll() at scale.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,354 @@
+from array import array
+from bisect import bisect_right
+from datetime import date, timedelta
+from Inventory import ROOM_TYPES, TYPE_CODES
+from Roomtype import HotelRoomType
+
+class PricingRules:
+    """Python class to implement the rules of the dynamic pricing engine.
+
+    The nightly rate of a room is its base rate times three multipliers: one for the
+    occupancy of its room type that night, one for the day of the week and one for the
+    lead time, the number of days between today and the night.
+
+    Syntax
+    ------
+    obj = PricingRules(base_rates, occupancy_multipliers, weekday_multipliers, lead_time_multipliers)
+
+    Parameters
+    ----------
+    [in] base_rates : dict
+        Base rate per HotelRoomType. Rooms of a type not listed use their room_price.
+    [in] occupancy_multipliers : list
+        (occupancy, multiplier) pairs sorted by occupancy. The pair with the highest
+        occupancy not above the night's occupancy applies.
+    [in] weekday_multipliers : list
+        Seven multipliers, Monday first.
+    [in] lead_time_multipliers : list
+        (days, multiplier) pairs sorted by days. The pair with the most days not above
+        the lead time applies.
+
+    Returns
+    -------
+    obj : PricingRules
+        Python object output parameter that represents an instance of the class PricingRules.
+
+    Attributes
+    ----------
+    base_rates : dict
+        Base rate per HotelRoomType.
+    occupancy_multipliers : list
+        (occupancy, multiplier) pairs.
+    weekday_multipliers : list
+        Multipliers per day of the week.
+    lead_time_multipliers : list
+        (days, multiplier) pairs.
+    """
+
+    def __init__(self, base_rates: dict = None, occupancy_multipliers: list = None,
+                 weekday_multipliers: list = None, lead_time_multipliers: list = None):
+        self.base_rates = {HotelRoomType(room_type): rate for room_type, rate in (base_rates or {}).items()}
+        self.occupancy_multipliers = occupancy_multipliers or [(0.0, 1.0), (0.7, 1.15), (0.9, 1.3)]
+        self.weekday_multipliers = weekday_multipliers or [1.0, 1.0, 1.0, 1.0, 1.1, 1.2, 1.1]
+        self.lead_time_multipliers = lead_time_multipliers or [(0, 1.1), (3, 1.0), (30, 0.95)]
+
+    def factor(self, occupancy: float, night: date, today: date) -> float:
+        """Get the multiplier applied to the base rate of a room for one night.
+
+        Parameters
+        ----------
+        occupancy : float
+            Fraction of the rooms of the type booked that night.
+        night : date
+            The night being priced.
+        today : date
+            The day the price is computed.
+
+        Returns
+        -------
+        float
+            Product of the occupancy, weekday and lead-time multipliers.
+        """
+        thresholds = self.occupancy_multipliers
+        index = bisect_right(thresholds, (occupancy, float("inf"))) - 1
+        multiplier = thresholds[index][1] if index >= 0 else 1.0
+        thresholds = self.lead_time_multipliers
+        index = bisect_right(thresholds, ((night - today).days, float("inf"))) - 1
+        if index >= 0:
+            multiplier *= thresholds[index][1]
+        return multiplier * self.weekday_multipliers[night.weekday()]
+
+
+class PricingEngine:
+    """Python class to implement a dynamic pricing engine over a hotel inventory.
+
+    The engine prices every room for every night of a horizon. The multiplier of a
+    night depends only on the room type, so rooms are grouped by type and each
+    (type, night) pair is repriced as one batch: its rates are the base rates of the
+    type's rooms scaled by a single factor.
+
+    The engine listens to the hotel. Booking events update the per-night booked count
+    of the room type over the nights they cover, and adding or removing a room rebuilds
+    its type. refresh() then reprices only the (type, night) pairs whose inputs changed,
+    and skips those whose factor came out the same.
+
+    Syntax
+    ------
+    obj = PricingEngine(hotel, rules, start, nights)
+
+    Parameters
+    ----------
+    [in] hotel : Hotel
+        The hotel to price.
+    [in] rules : PricingRules
+        The pricing rules.
+    [in] start : date
+        First night of the horizon. Defaults to today.
+    [in] nights : int
+        Number of nights of the horizon. Defaults to 90.
+
+    Returns
+    -------
+    obj : PricingEngine
+        Python object output parameter that represents an instance of the class PricingEngine.
+
+    Attributes
+    ----------
+    rules : PricingRules
+        The pricing rules. Call invalidate() after changing them.
+    start : date
+        First night of the horizon.
+    nights : int
+        Number of nights of the horizon.
+    repriced : int
+        Number of room-nights repriced by the last refresh().
+    """
+
+    def __init__(self, hotel, rules: PricingRules, start: date = None, nights: int = 90):
+        self.rules = rules
+        self.start = start or date.today()
+        self.nights = nights
+        self.repriced = 0
+        self._hotel = hotel
+        self._today = None
+        self._numbers = [array("q") for _ in ROOM_TYPES]
+        self._bases = [array("d") for _ in ROOM_TYPES]
+        self._positions = {}
+        self._booked = [[0] * nights for _ in ROOM_TYPES]
+        self._counted = {}
+        self._by_room = {}
+        self._factors = {}
+        self._rates = {}
+        self._dirty = set()
+        for code in range(len(ROOM_TYPES)):
+            self._rebuild(code)
+        for reservation in hotel.bookings:
+            self._count(reservation)
+        hotel.subscribe(self)
+
+    def close(self):
+        """Stop following the hotel."""
+        self._hotel.unsubscribe(self)
+
+    def invalidate(self):
+        """Reprice everything on the next refresh(), e.g. after changing the rules."""
+        self._factors.clear()
+        self._dirty.update((code, night) for code in range(len(ROOM_TYPES)) for night in range(self.nights))
+
+    def __call__(self, event: str, obj):
+        if event in ("add_room", "remove_room"):
+            if event == "remove_room":
+                for reservation_id in list(self._by_room.get(obj.room_number, ())):
+                    self._uncount(reservation_id)
+            code = TYPE_CODES[HotelRoomType(obj.room_type)]
+            previous = self._positions.get(obj.room_number, (code,))[0]
+            if previous != code:
+                self._rebuild(previous)
+            self._rebuild(code)
+        elif event in ("reserve", "cancel_reservation", "displace_reservation", "check_in", "check_out"):
+            self._count(obj)
+
+    def refresh(self, today: date = None) -> int:
+        """Reprice the (type, night) pairs whose inputs changed.
+
+        Parameters
+        ----------
+        today : date, optional
+            The day the prices are computed, for lead times. Defaults to today.
+
+        Returns
+        -------
+        int
+            Number of room-nights repriced.
+        """
+        today = today or date.today()
+        if today != self._today:
+            self._today = today
+            self._dirty.update((code, night) for code in range(len(ROOM_TYPES)) for night in range(self.nights))
+        factor = self.rules.factor
+        start = self.start
+        repriced = 0
+        for code, night in self._dirty:
+            bases = self._bases[code]
+            capacity = len(bases)
+            occupancy = self._booked[code][night] / capacity if capacity else 0.0
+            value = factor(occupancy, start + timedelta(days=night), today)
+            if self._factors.get((code, night)) == value:
+                continue
+            self._factors[(code, night)] = value
+            self._rates[(code, night)] = array("d", [base * value for base in bases])
+            repriced += capacity
+        self._dirty.clear()
+        self.repriced = repriced
+        return repriced
+
+    def price(self, room_number: int, night: date):
+        """Get the rate of a room for a night, as of the last refresh().
+
+        Parameters
+        ----------
+        room_number : int
+            The number of the room.
+        night : date
+            The night to price.
+
+        Returns
+        -------
+        float or None
+            The nightly rate, None if the room or night is outside the engine.
+        """
+        position = self._positions.get(room_number)
+        index = (night - self.start).days
+        if position is None or not 0 <= index < self.nights:
+            return None
+        code, row = position
+        rates = self._rates.get((code, index))
+        return rates[row] if rates is not None else None
+
+    def rates(self, night: date, room_type: HotelRoomType) -> tuple:
+        """Get the rates of every room of a type for a night, as of the last refresh().
+
+        Parameters
+        ----------
+        night : date
+            The night to price.
+        room_type : HotelRoomType
+            The type of the rooms.
+
+        Returns
+        -------
+        tuple
+            (room numbers, rates), two arrays aligned row by row.
+        """
+        code = TYPE_CODES[HotelRoomType(room_type)]
+        return self._numbers[code], self._rates.get((code, (night - self.start).days), array("d"))
+
+    def _rebuild(self, code: int):
+        room_type = ROOM_TYPES[code]
+        base_rate = self.rules.base_rates.get(room_type)
+        numbers = array("q")
+        bases = array("d")
+        for room in self._hotel.rooms_by_type(room_type):
+            self._positions[room.room_number] = (code, len(numbers))
+            numbers.append(room.room_number)
+            bases.append(room.room_price if base_rate is None else base_rate)
+        for number in self._numbers[code]:
+            room = self._hotel.find_room(number)
+            if self._positions.get(number, (None,))[0] == code and (room is None or room.room_type != room_type):
+                del self._positions[number]
+        self._numbers[code] = numbers
+        self._bases[code] = bases
+        for night in range(self.nights):
+            self._factors.pop((code, night), None)
+            self._dirty.add((code, night))
+
+    def _uncount(self, reservation_id: int):
+        code, first, last, room_number = self._counted.pop(reservation_id)
+        self._by_room[room_number].discard(reservation_id)
+        booked = self._booked[code]
+        for night in range(first, last):
+            booked[night] -= 1
+            self._dirty.add((code, night))
+
+    def _count(self, reservation):
+        if reservation.reservation_id in self._counted:
+            self._uncount(reservation.reservation_id)
+        room = self._hotel.find_room(reservation.room_number)
+        if room is None or reservation.status in ("Cancelada", "Desplazada"):
+            return
+        first = max((reservation.arrival - self.start).days, 0)
+        last = min((reservation.departure - self.start).days, self.nights)
+        if first >= last:
+            return
+        code = TYPE_CODES[HotelRoomType(room.room_type)]
+        self._counted[reservation.reservation_id] = (code, first, last, reservation.room_number)
+        self._by_room.setdefault(reservation.room_number, set()).add(reservation.reservation_id)
+        booked = self._booked[code]
+        for night in range(first, last):
+            booked[night] += 1
+            self._dirty.add((code, night))
+
+
+def main():
+    # TESTING
+    from time import perf_counter
+    from Hotel import Hotel
+    from Room import Room
+
+    monday = date(2030, 1, 7)
+    day = timedelta(days=1)
+    rules = PricingRules(base_rates={HotelRoomType.SUITE: 300},
+                         occupancy_multipliers=[(0.0, 1.0), (0.5, 1.5)],
+                         weekday_multipliers=[1.0, 1.0, 1.0, 1.0, 1.0, 2.0, 2.0],
+                         lead_time_multipliers=[(0, 1.0)])
+
+    print("=================================================================")
+    print("Test Case 1: Price by Base Rate, Weekday and Occupancy.")
+    print("=================================================================")
+    hotel = Hotel("Grand Hotel")
+    hotel.add_room(Room(HotelRoomType.SUITE, 101, "Desocupada", 999))
+    hotel.add_room(Room(HotelRoomType.SUITE, 102, "Desocupada", 999))
+    hotel.add_room(Room(HotelRoomType.DOBLE, 201, "Desocupada", 150))
+    engine = PricingEngine(hotel, rules, start=monday, nights=7)
+    engine.refresh(today=monday)
+
+    if (engine.price(101, monday) == 300 and engine.price(201, monday) == 150
+            and engine.price(201, monday + 5 * day) == 300 and engine.price(201, monday + 7 * day) is None):
+        print("Test PASS. Base rates and weekday multipliers are applied.")
+    else:
+        print("Test FAIL. Check the methods refresh() and price().")
+
+    hotel.reserve(101, "Alice", monday + day, monday + 3 * day)
+    repriced = engine.refresh(today=monday)
+    if (repriced == 4 and engine.price(102, monday + day) == 450 and engine.price(102, monday + 3 * day) == 300
+            and engine.price(201, monday + day) == 150):
+        print("Test PASS. Only the nights touched by the booking are repriced.")
+    else:
+        print("Test FAIL. Check the incremental repricing of refresh().")
+
+    hotel.remove_room(101)
+    engine.refresh(today=monday)
+    numbers, prices = engine.rates(monday + day, HotelRoomType.SUITE)
+    if list(numbers) == [102] and list(prices) == [300] and engine.price(101, monday) is None:
+        print("Test PASS. Removing a room reprices its type.")
+    else:
+        print("Test FAIL. Check the handling of remove_room events.")
+
+    print("=================================================================")
+    print("Test Case 2: Full Reprice of a Million Room-Nights.")
+    print("=================================================================")
+    hotel = Hotel("Big Hotel")
+    hotel.add_rooms(Room(ROOM_TYPES[number % 3], number, "Desocupada", 50.0 + number % 400)
+                    for number in range(10000))
+    engine = PricingEngine(hotel, PricingRules(),start=monday, nights=100)
+    start = perf_counter()
+    repriced = engine.refresh(today=monday)
+    elapsed = perf_counter() - start
+
+    if repriced == 1000000 and elapsed < 1.0:
+        print(f"Test PASS. Repriced {repriced:,} room-nights in {elapsed:.3f} s.")
+    else:
+        print(f"Test FAIL. Repriced {repriced:,} room-nights in {elapsed:.3f} s.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+from collections import OrderedDict
+from datetime import date
+from time import monotonic
+from Roomstate import AVAILABLE_STATES
+from Roomtype import HotelRoomType
+
+class AvailabilityCache:
+    """Python class to implement a read-through cache of room availability queries.
+
+    Results of free-room searches by type, price band and dates, and of the full room
+    listing, are kept in an LRU of bounded size, each for at most ttl seconds. The cache
+    listens to the hotel and drops exactly the results an event can change:
+
+    - every result that contains the room of the event, since the room was removed, taken
+      or changed;
+    - every result the room may now belong to, when a room is added, nights are released
+      by a cancellation or a check-out, or the room becomes available again after
+      housekeeping, matched by room type, price band and dates.
+
+    An inverted index from room number to results and one from room type to results keep
+    this proportional to the results affected. Rooms must be changed through the Hotel for
+    the cache to see it. While a transaction of the hotel is open, queries are run without
+    the cache.
+
+    Syntax
+    ------
+    obj = AvailabilityCache(hotel, maxsize, ttl)
+
+    Parameters
+    ----------
+    [in] hotel : Hotel
+        The hotel to query.
+    [in] maxsize : int
+        Most results kept. Defaults to 256.
+    [in] ttl : float
+        Seconds a result is kept at most. Defaults to 60.
+
+    Returns
+    -------
+    obj : AvailabilityCache
+        Python object output parameter that represents an instance of the class AvailabilityCache.
+
+    Attributes
+    ----------
+    hits : int
+        Queries served from the cache.
+    misses : int
+        Queries run against the hotel.
+    evictions : int
+        Results dropped to respect maxsize.
+    invalidations : int
+        Results dropped by hotel events.
+    """
+
+    def __init__(self, hotel, maxsize: int = 256, ttl: float = 60.0, clock=monotonic):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._hotel = hotel
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._by_room = {}
+        self._by_type = {}
+        hotel.subscribe(self)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def close(self):
+        """Stop following the hotel and drop every result."""
+        self._hotel.unsubscribe(self)
+        self.clear()
+
+    def clear(self):
+        """Drop every result."""
+        self._entries.clear()
+        self._by_room.clear()
+        self._by_type.clear()
+
+    def stats(self) -> dict:
+        """Get the cache metrics.
+
+        Returns
+        -------
+        dict
+            hits, misses, hit_rate, evictions, invalidations and size.
+        """
+        queries = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hits / queries if queries else 0.0,
+                "evictions": self.evictions, "invalidations": self.invalidations, "size": len(self._entries)}
+
+    def free_rooms(self, room_type: HotelRoomType = None, min_price: float = None, max_price: float = None,
+                   arrival: date = None, departure: date = None) -> list:
+        """Get the free rooms of a type and price band, sorted by price.
+
+        Parameters
+        ----------
+        room_type : HotelRoomType, optional
+            The type of the rooms. All types if omitted.
+        min_price : float, optional
+            Lowest price per night. No limit if omitted.
+        max_price : float, optional
+            Highest price per night. No limit if omitted.
+        arrival : date, optional
+            First night of the stay. If omitted, rooms unoccupied now are returned.
+        departure : date, optional
+            Day after the last night of the stay. Required with arrival.
+
+        Returns
+        -------
+        list
+            The free Room instances.
+        """
+        if room_type is not None:
+            room_type = HotelRoomType(room_type)
+        key = ("dates" if arrival is not None else "now", room_type, min_price, max_price, arrival, departure)
+        return self._get(key)
+
+    def list_rooms(self) -> list:
+        """Get every room of the hotel, sorted by number.
+
+        Returns
+        -------
+        list
+            The Room instances.
+        """
+        return self._get(("all", None, None, None, None, None))
+
+    def _get(self, key: tuple) -> list:
+        if self._hotel.in_transaction:
+            # A rollback sends no event, so what is seen partway through is never kept.
+            self.misses += 1
+            return list(self._run(key))
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > self._clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return list(entry[1])
+            self._drop(key)
+        self.misses += 1
+        rooms = self._run(key)
+        self._entries[key] = (self._clock() + self._ttl, rooms)
+        for room in rooms:
+            self._by_room.setdefault(room.room_number, set()).add(key)
+        self._by_type.setdefault(key[1], set()).add(key)
+        if len(self._entries) > self._maxsize:
+            self._drop(next(iter(self._entries)))
+            self.evictions += 1
+        return list(rooms)
+
+    def _run(self, key: tuple) -> tuple:
+        kind, room_type, min_price, max_price, arrival, departure = key
+        hotel = self._hotel
+        if kind == "all":
+            return tuple(sorted(hotel.rooms, key=lambda room: room.room_number))
+        if kind == "now":
+            rooms = hotel.available_rooms(room_type)
+        elif room_type is not None:
+            rooms = hotel.free_rooms(room_type, arrival, departure)
+        else:
+            rooms = [room for each in HotelRoomType for room in hotel.free_rooms(each, arrival, departure)]
+        return tuple(sorted((room for room in rooms if (min_price is None or room.room_price >= min_price)
+                             and (max_price is None or room.room_price <= max_price)),
+                            key=lambda room: (room.room_price, room.room_number)))
+
+    def _drop(self, key: tuple):
+        _, rooms = self._entries.pop(key)
+        for room in rooms:
+            keys = self._by_room.get(room.room_number)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_room[room.room_number]
+        self._by_type[key[1]].discard(key)
+
+    def __call__(self, event: str, obj):
+        if event in ("add_room", "remove_room", "room_state"):
+            room = obj
+        elif event in ("reserve", "cancel_reservation", "displace_reservation", "check_in", "check_out"):
+            room = self._hotel.find_room(obj.room_number)
+        else:
+            return
+        # A displaced reservation releases its nights like a cancelled one.
+        cancelled = event in ("cancel_reservation", "displace_reservation")
+        stale = set(self._by_room.get(obj.room_number, ()))
+        if event == "room_state":
+            # Results by dates only depend on the reservations.
+            stale = {key for key in stale if key[0] != "dates"}
+            if room.room_state not in AVAILABLE_STATES:
+                room = None
+        if room is not None and (cancelled or event in ("add_room", "check_out", "room_state")):
+            # Nights released from this day on, or the whole calendar for a new room.
+            released = obj.arrival if cancelled else obj.departure if event == "check_out" else None
+            price = room.room_price
+            for room_type in (HotelRoomType(room.room_type), None):
+                for key in self._by_type.get(room_type, ()):
+                    kind, _, min_price, max_price, arrival, departure = key
+                    if ((min_price is not None and price < min_price) or (max_price is not None and price > max_price)
+                            or (kind == "now" and cancelled) or (kind == "all" and event != "add_room")
+                            or (kind == "dates" and event == "room_state")):
+                        continue
+                    if kind == "dates" and released is not None and departure <= released:
+                        continue
+                    if kind == "dates" and cancelled and arrival >= obj.departure:
+                        continue
+                    stale.add(key)
+        for key in stale:
+            if key in self._entries:
+                self._drop(key)
+                self.invalidations += 1
+
+
+def main():
+    # TESTING
+    from datetime import timedelta
+    from time import perf_counter
+    from Hotel import Hotel
+    from Room import Room
+
+    now = [0.0]
+    monday = date(2030, 1, 7)
+    day = timedelta(days=1)
+    hotel = Hotel("Grand Hotel")
+    for number, price in ((101, 80), (102, 120), (103, 200), (201, 90)):
+        hotel.add_room(Room(HotelRoomType.DOBLE if number < 200 else HotelRoomType.SUITE, number, "Desocupada", price))
+    cache = AvailabilityCache(hotel, maxsize=3, ttl=10, clock=lambda: now[0])
+
+    print("=================================================================")
+    print("Test Case 1: Serve Repeated Queries from the Cache.")
+    print("=================================================================")
+    first = cache.free_rooms(HotelRoomType.DOBLE, max_price=150)
+    second = cache.free_rooms("Doble", max_price=150)
+
+    if ([room.room_number for room in first] == [101, 102] and second == first
+            and cache.hits == 1 and cache.misses == 1):
+        print("Test PASS. The second query is a hit.")
+    else:
+        print("Test FAIL. Check the method free_rooms().")
+
+    print("=================================================================")
+    print("Test Case 2: Precise Invalidation.")
+    print("=================================================================")
+    cache.free_rooms(HotelRoomType.DOBLE, min_price=150)
+    hotel.check_in(201, "Carol")
+    kept = cache.stats()["invalidations"] == 0
+    hotel.check_in(101, "Alice")
+    after_check_in = [room.room_number for room in cache.free_rooms(HotelRoomType.DOBLE, max_price=150)]
+    hits = cache.hits
+    cache.free_rooms(HotelRoomType.DOBLE, min_price=150)
+    untouched = cache.hits == hits + 1
+    hotel.check_out(101)
+    after_check_out = [room.room_number for room in cache.free_rooms(HotelRoomType.DOBLE, max_price=150)]
+
+    if kept and untouched and after_check_in == [102] and after_check_out == [101, 102]:
+        print("Test PASS. Only the results a check-in or check-out can change are dropped.")
+    else:
+        print("Test FAIL. Check the event handling of the cache.")
+
+    cache.free_rooms(HotelRoomType.DOBLE, arrival=monday, departure=monday + 2 * day)
+    reservation = hotel.reserve(102, "Bob", monday + day, monday + 3 * day)
+    booked = [room.room_number for room in cache.free_rooms(HotelRoomType.DOBLE, arrival=monday, departure=monday + 2 * day)]
+    hotel.cancel_reservation(reservation.reservation_id)
+    freed = [room.room_number for room in cache.free_rooms(HotelRoomType.DOBLE, arrival=monday, departure=monday + 2 * day)]
+    hotel.add_room(Room(HotelRoomType.DOBLE, 104, "Desocupada", 70))
+    added = [room.room_number for room in cache.list_rooms()]
+
+    hotel.set_room_state(104, "Sucia")
+    dirty = [room.room_number for room in cache.free_rooms(HotelRoomType.DOBLE, max_price=150)]
+    hotel.set_room_state(104, "Limpiando")
+    hotel.set_room_state(104, "Inspeccionada")
+    inspected = [room.room_number for room in cache.free_rooms(HotelRoomType.DOBLE, max_price=150)]
+
+    if (booked == [101, 103] and freed == [101, 102, 103] and added == [101, 102, 103, 104, 201]
+            and dirty == [101, 102] and inspected == [104, 101, 102]):
+        print("Test PASS. Reservations, new rooms and state changes refresh the affected results.")
+    else:
+        print("Test FAIL. Check the handling of reservation, add_room and room_state events.")
+
+    with hotel.transaction() as transaction:
+        hotel.check_in(104, "Dave")
+        inside = [room.room_number for room in cache.free_rooms(HotelRoomType.DOBLE, max_price=75)]
+        transaction.rollback()
+    hotel.check_in(104, "Erin")
+    after_rollback = [room.room_number for room in cache.free_rooms(HotelRoomType.DOBLE, max_price=75)]
+
+    if inside == [] and after_rollback == []:
+        print("Test PASS. Results seen inside a transaction are not cached.")
+    else:
+        print("Test FAIL. Check the transaction handling of the cache.")
+
+    print("=================================================================")
+    print("Test Case 3: LRU Eviction and TTL.")
+    print("=================================================================")
+    for price in (10, 20, 30, 40):
+        cache.free_rooms(max_price=price)
+    size = len(cache)
+    evictions = cache.evictions
+    misses = cache.misses
+    now[0] = 11.0
+    cache.free_rooms(max_price=40)
+
+    if size == 3 and evictions > 0 and cache.misses == misses + 1:
+        print("Test PASS. The cache is bounded and results expire.")
+    else:
+        print("Test FAIL. Check the eviction and expiry of the cache.")
+
+    print("=================================================================")
+    print("Test Case 4: Hot Query Speed-Up.")
+    print("=================================================================")
+    hotel = Hotel("Big Hotel")
+    hotel.add_rooms(Room(HotelRoomType("Individual" if number % 2 else "Doble"), number, "Desocupada",
+                         50.0 + number % 300) for number in range(100000))
+    cache = AvailabilityCache(hotel)
+    start = perf_counter()
+    for _ in range(20):
+        hotel.available_rooms(HotelRoomType.DOBLE)
+    uncached = (perf_counter() - start) / 20
+    start = perf_counter()
+    for _ in range(20):
+        cache.free_rooms(HotelRoomType.DOBLE, max_price=60)
+    cached = (perf_counter() - start) / 20
+
+    if cache.stats()["hit_rate"] == 0.95 and cached < uncached:
+        print(f"Test PASS. {uncached * 1000:.2f} ms uncached, {cached * 1000:.3f} ms per cached query.")
+    else:
+        print(f"Test FAIL. {uncached * 1000:.2f} ms uncached, {cached * 1000:.3f} ms per cached query.")
+
+if __name__ == "__main__":
+    main()
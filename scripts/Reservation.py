@@ -0,0 +1,586 @@
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+from itertools import count
+
+class Reservation:
+    """Python class to implement a date-ranged booking of a hotel room.
+
+    This Python class represents a single booking of a room between an arrival
+    date and a departure date. The departure date is excluded, so a stay from
+    the 1st to the 3rd covers the nights of the 1st and the 2nd.
+
+    Syntax
+    ------
+    obj = Reservation(reservation_id, room_number, guest_name, arrival, departure, status)
+
+    Parameters
+    ----------
+    [in] reservation_id : int
+        Unique identifier of the reservation.
+    [in] room_number : int
+        Number of the booked room.
+    [in] guest_name : str
+        Name of the guest.
+    [in] arrival : date
+        Date of the first night of the stay.
+    [in] departure : date
+        Date the guest leaves the room.
+    [in] status : str
+        State of the reservation. Expected values are "Confirmada", "En curso",
+        "Finalizada", "Cancelada" or "Desplazada", a pending reservation whose room
+        has been given to an overbooked walk-in.
+
+    Returns
+    -------
+    obj : Reservation
+        Python object output parameter that represents an instance of the class Reservation.
+
+    Attributes
+    ----------
+    reservation_id : int
+        Unique identifier of the reservation.
+    room_number : int
+        Number of the booked room.
+    guest_name : str
+        Name of the guest.
+    arrival : date
+        Date of the first night of the stay.
+    departure : date
+        Date the guest leaves the room.
+    status : str
+        State of the reservation.
+    """
+
+    def __init__(self, reservation_id: int, room_number: int, guest_name: str, arrival: date,
+                 departure: date, status: str = "Confirmada"):
+        self.reservation_id = reservation_id
+        self.room_number = room_number
+        self.guest_name = guest_name
+        self.arrival = arrival
+        self.departure = departure
+        self.status = status
+
+    def nights(self) -> int:
+        """Get the number of nights of the stay.
+
+        Returns
+        -------
+        int
+            Number of nights between arrival and departure.
+        """
+        return (self.departure - self.arrival).days
+
+    def overlaps(self, arrival: date, departure: date) -> bool:
+        """Check if the stay shares at least one night with a date range.
+
+        Parameters
+        ----------
+        arrival : date
+            First night of the range.
+        departure : date
+            Day after the last night of the range.
+
+        Returns
+        -------
+        bool
+            True if both ranges share a night, False otherwise.
+        """
+        return self.arrival < departure and arrival < self.departure
+
+
+class ReservationBook:
+    """Python class to implement the reservation engine of a hotel.
+
+    This Python class stores the reservations of every room in a sorted interval
+    list per room. Stays of the same room never overlap, so the list is ordered by
+    both arrival and departure and any availability check is a single binary
+    search, O(log n) in the number of stays of the room.
+
+    Syntax
+    ------
+    obj = ReservationBook()
+
+    Parameters
+    ----------
+
+    Returns
+    -------
+    obj : ReservationBook
+        Python object output parameter that represents an instance of the class ReservationBook.
+
+    Attributes
+    ----------
+    """
+
+    def __init__(self):
+        # next() on a count is atomic in CPython, so concurrent bookings never share an ID.
+        self._ids = count(1)
+        self._by_id = {}
+        self._arrivals = {}
+        self._stays = {}
+        # Stays closed before their first night, which hold no nights, by room.
+        self._empty = {}
+        # Pending reservations displaced from their room, by room.
+        self._displaced = {}
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __iter__(self):
+        return iter(self._by_id.values())
+
+    def get(self, reservation_id: int):
+        """Get a reservation by its ID.
+
+        Parameters
+        ----------
+        reservation_id : int
+            The ID of the reservation.
+
+        Returns
+        -------
+        Reservation or None
+            The Reservation instance if found, None otherwise.
+        """
+        return self._by_id.get(reservation_id)
+
+    def reservations(self, room_number: int) -> list:
+        """Get the stays holding nights of a room, ordered by arrival.
+
+        Parameters
+        ----------
+        room_number : int
+            The number of the room.
+
+        Returns
+        -------
+        list
+            List of Reservation instances.
+        """
+        return list(self._stays.get(room_number, ()))
+
+    def has_stays(self, room_number: int) -> bool:
+        """Check if a room has stays, past, current or pending, or displaced reservations.
+
+        Parameters
+        ----------
+        room_number : int
+            The number of the room.
+
+        Returns
+        -------
+        bool
+            True if any reservation still belongs to the room, False otherwise.
+        """
+        return bool(self._stays.get(room_number) or self._empty.get(room_number) or self._displaced.get(room_number))
+
+    def is_free(self, room_number: int, arrival: date, departure: date) -> bool:
+        """Check if a room has no stay in a date range.
+
+        Parameters
+        ----------
+        room_number : int
+            The number of the room.
+        arrival : date
+            First night of the range.
+        departure : date
+            Day after the last night of the range.
+
+        Returns
+        -------
+        bool
+            True if no stay of the room overlaps the range, False otherwise.
+        """
+        arrivals = self._arrivals.get(room_number)
+        if not arrivals:
+            return True
+        # Only the last stay arriving before the range ends can reach into it.
+        index = bisect_left(arrivals, departure) - 1
+        return index < 0 or self._stays[room_number][index].departure <= arrival
+
+    def find(self, room_number: int, night: date):
+        """Find the stay of a room that covers a given night.
+
+        Parameters
+        ----------
+        room_number : int
+            The number of the room.
+        night : date
+            The night to look up.
+
+        Returns
+        -------
+        Reservation or None
+            The Reservation instance covering the night, None otherwise.
+        """
+        arrivals = self._arrivals.get(room_number)
+        if not arrivals:
+            return None
+        index = bisect_right(arrivals, night) - 1
+        if index >= 0 and self._stays[room_number][index].departure > night:
+            return self._stays[room_number][index]
+        return None
+
+    def next_arrival(self, room_number: int, on: date):
+        """Find the first stay of a room arriving on or after a given day.
+
+        Parameters
+        ----------
+        room_number : int
+            The number of the room.
+        on : date
+            The earliest arrival day.
+
+        Returns
+        -------
+        Reservation or None
+            The Reservation instance of the next arrival, None if there is none.
+        """
+        arrivals = self._arrivals.get(room_number)
+        if not arrivals:
+            return None
+        index = bisect_left(arrivals, on)
+        return self._stays[room_number][index] if index < len(arrivals) else None
+
+    def book(self, room_number: int, guest_name: str, arrival: date, departure: date) -> Reservation:
+        """Book a room for a date range.
+
+        Parameters
+        ----------
+        room_number : int
+            The number of the room.
+        guest_name : str
+            The name of the guest.
+        arrival : date
+            First night of the stay.
+        departure : date
+            Day the guest leaves the room.
+
+        Returns
+        -------
+        Reservation
+            The new Reservation instance.
+
+        Raises
+        ------
+        ValueError
+            If the range is empty or the room is already booked in it.
+        """
+        if departure <= arrival:
+            raise ValueError("Departure must be after arrival.")
+        if not self.is_free(room_number, arrival, departure):
+            raise ValueError(f"Room {room_number} is already booked in that period.")
+        reservation = Reservation(next(self._ids), room_number, guest_name, arrival, departure)
+        self._by_id[reservation.reservation_id] = reservation
+        self._insert(reservation)
+        return reservation
+
+    def restore(self, reservation: Reservation):
+        """Add an existing reservation, keeping its ID and status.
+
+        Used to reload saved reservations. Later bookings get IDs above the restored ones.
+
+        Parameters
+        ----------
+        reservation : Reservation
+            The Reservation instance to be restored.
+
+        Raises
+        ------
+        ValueError
+            If a stay holding nights overlaps one already in the room.
+        """
+        holds_nights = (reservation.status not in ("Cancelada", "Desplazada")
+                        and reservation.departure > reservation.arrival)
+        if holds_nights and not self.is_free(reservation.room_number, reservation.arrival, reservation.departure):
+            raise ValueError(f"Room {reservation.room_number} is already booked in that period.")
+        self._by_id[reservation.reservation_id] = reservation
+        following = next(self._ids)
+        self._ids = count(max(following, reservation.reservation_id + 1))
+        if holds_nights:
+            self._insert(reservation)
+        elif reservation.status == "Finalizada":
+            self._empty.setdefault(reservation.room_number, []).append(reservation)
+        elif reservation.status == "Desplazada":
+            self._displaced.setdefault(reservation.room_number, []).append(reservation)
+
+    def cancel(self, reservation_id: int):
+        """Cancel a reservation and release its nights.
+
+        Parameters
+        ----------
+        reservation_id : int
+            The ID of the reservation.
+
+        Returns
+        -------
+        Reservation or None
+            The cancelled Reservation instance, None if it does not exist or is not pending.
+        """
+        reservation = self._by_id.get(reservation_id)
+        if reservation is None or reservation.status not in ("Confirmada", "Desplazada"):
+            return None
+        if reservation.status == "Desplazada":
+            self._displaced[reservation.room_number].remove(reservation)
+        else:
+            self._discard(reservation)
+        reservation.status = "Cancelada"
+        return reservation
+
+    def displace(self, reservation_id: int):
+        """Release the nights of a pending reservation, keeping it for its guest.
+
+        The guest is given a room, or walked, on arrival.
+
+        Parameters
+        ----------
+        reservation_id : int
+            The ID of the reservation.
+
+        Returns
+        -------
+        Reservation or None
+            The displaced Reservation instance, None if it does not exist or is not "Confirmada".
+        """
+        reservation = self._by_id.get(reservation_id)
+        if reservation is None or reservation.status != "Confirmada":
+            return None
+        self._discard(reservation)
+        reservation.status = "Desplazada"
+        self._displaced.setdefault(reservation.room_number, []).append(reservation)
+        return reservation
+
+    def displaced(self, room_number: int, guest_name: str, night: date):
+        """Find the displaced reservation of a guest covering a night.
+
+        Parameters
+        ----------
+        room_number : int
+            The number of the room the reservation was booked in.
+        guest_name : str
+            The name of the guest.
+        night : date
+            The night to look up.
+
+        Returns
+        -------
+        Reservation or None
+            The displaced Reservation instance, None if there is none.
+        """
+        for reservation in self._displaced.get(room_number, ()):
+            if reservation.guest_name == guest_name and reservation.arrival <= night < reservation.departure:
+                return reservation
+        return None
+
+    def close(self, reservation_id: int, on: date):
+        """Close a stay, releasing the nights from a given date on.
+
+        Parameters
+        ----------
+        reservation_id : int
+            The ID of the reservation.
+        on : date
+            The day the guest leaves the room.
+
+        Returns
+        -------
+        Reservation or None
+            The closed Reservation instance, None if it does not exist.
+        """
+        reservation = self._by_id.get(reservation_id)
+        if reservation is None:
+            return None
+        if on <= reservation.arrival:
+            self._discard(reservation)
+            reservation.departure = reservation.arrival
+            self._empty.setdefault(reservation.room_number, []).append(reservation)
+        elif on < reservation.departure:
+            # Arrivals are unchanged, so the room list stays sorted.
+            reservation.departure = on
+        reservation.status = "Finalizada"
+        return reservation
+
+    def remove_room(self, room_number: int):
+        """Forget the stays of a room, cancelling the pending ones.
+
+        The current stay is finalized and, with the finished ones, including those closed
+        before their first night, dropped from the book, so a room added later under the
+        same number starts without a guest or history.
+
+        Parameters
+        ----------
+        room_number : int
+            The number of the room.
+        """
+        self._arrivals.pop(room_number, None)
+        for reservation in self._stays.pop(room_number, ()):
+            if reservation.status == "Confirmada":
+                reservation.status = "Cancelada"
+            else:
+                reservation.status = "Finalizada"
+                self._by_id.pop(reservation.reservation_id, None)
+        for reservation in self._empty.pop(room_number, ()):
+            self._by_id.pop(reservation.reservation_id, None)
+        for reservation in self._displaced.pop(room_number, ()):
+            reservation.status = "Cancelada"
+
+    def save_room(self, room_number: int) -> tuple:
+        """Save the stays of a room so restore_room() can bring them back.
+
+        Only the room's own lists and the fields a stay may change are copied, so the cost
+        is proportional to the stays of the room.
+
+        Parameters
+        ----------
+        room_number : int
+            The number of the room.
+
+        Returns
+        -------
+        tuple
+            The saved arrivals, stays, (reservation, status, departure) of each stay and
+            of each displaced reservation, stays closed before their first night and
+            displaced reservations.
+        """
+        arrivals = self._arrivals.get(room_number)
+        stays = self._stays.get(room_number)
+        empty = self._empty.get(room_number)
+        displaced = self._displaced.get(room_number)
+        return (None if arrivals is None else list(arrivals), None if stays is None else list(stays),
+                [(reservation, reservation.status, reservation.departure)
+                 for reservation in (stays or []) + (displaced or [])],
+                None if empty is None else list(empty), None if displaced is None else list(displaced))
+
+    def restore_room(self, room_number: int, saved: tuple):
+        """Bring back the stays of a room saved with save_room().
+
+        Parameters
+        ----------
+        room_number : int
+            The number of the room.
+        saved : tuple
+            The value returned by save_room().
+        """
+        arrivals, stays, fields, empty, displaced = saved
+        for target, values in ((self._arrivals, arrivals), (self._stays, stays), (self._empty, empty),
+                               (self._displaced, displaced)):
+            if values is None:
+                target.pop(room_number, None)
+            else:
+                target[room_number] = values
+        for reservation, status, departure in fields:
+            # Stays dropped by remove_room() come back too.
+            self._by_id[reservation.reservation_id] = reservation
+            reservation.status = status
+            reservation.departure = departure
+        for reservation in empty or ():
+            self._by_id[reservation.reservation_id] = reservation
+
+    def forget(self, reservation_id: int):
+        """Drop a reservation from the book by its ID, e.g. one booked in a rolled back transaction.
+
+        Parameters
+        ----------
+        reservation_id : int
+            The ID of the reservation.
+        """
+        reservation = self._by_id.pop(reservation_id, None)
+        if reservation is not None:
+            self._discard(reservation)
+
+    def next_id(self) -> int:
+        """Get the ID the next booking gets, without using it.
+
+        Returns
+        -------
+        int
+            The next reservation ID.
+        """
+        following = next(self._ids)
+        self._ids = count(following)
+        return following
+
+    def rewind(self, reservation_id: int):
+        """Make the next booking get a given ID again.
+
+        Used when the reservations from that ID on have been forgotten, so IDs stay
+        gapless and a replayed log hands out the same IDs.
+
+        Parameters
+        ----------
+        reservation_id : int
+            The ID the next booking gets.
+        """
+        self._ids = count(reservation_id)
+
+    def _insert(self, reservation: Reservation):
+        arrivals = self._arrivals.setdefault(reservation.room_number, [])
+        stays = self._stays.setdefault(reservation.room_number, [])
+        index = bisect_left(arrivals, reservation.arrival)
+        arrivals.insert(index, reservation.arrival)
+        stays.insert(index, reservation)
+
+    def _discard(self, reservation: Reservation):
+        arrivals = self._arrivals.get(reservation.room_number, [])
+        stays = self._stays.get(reservation.room_number, [])
+        index = bisect_left(arrivals, reservation.arrival)
+        if index < len(stays) and stays[index] is reservation:
+            del arrivals[index]
+            del stays[index]
+
+
+def main():
+    # TESTING
+    today = date.today()
+    day = timedelta(days=1)
+
+    print("=================================================================")
+    print("Test Case 1: Book a Room.")
+    print("=================================================================")
+    book = ReservationBook()
+    first = book.book(101, "Alice", today, today + 3 * day)
+
+    if first.reservation_id == 1 and first.nights() == 3 and first.status == "Confirmada":
+        print("Test PASS. The reservation has been correctly created.")
+    else:
+        print("Test FAIL. Check the method book().")
+
+    print("=================================================================")
+    print("Test Case 2: Reject Overlapping Bookings.")
+    print("=================================================================")
+    try:
+        book.book(101, "Bob", today + 2 * day, today + 4 * day)
+        print("Test FAIL. Check the method book() for overlapping stays.")
+    except ValueError:
+        print("Test PASS. Overlapping booking has been rejected.")
+
+    second = book.book(101, "Bob", today + 3 * day, today + 5 * day)
+    if second.arrival == first.departure and len(book.reservations(101)) == 2:
+        print("Test PASS. Back-to-back booking has been accepted.")
+    else:
+        print("Test FAIL. Check the method book() for adjacent stays.")
+
+    print("=================================================================")
+    print("Test Case 3: Availability and Night Lookup.")
+    print("=================================================================")
+    if (not book.is_free(101, today + 4 * day, today + 6 * day) and book.is_free(101, today + 5 * day, today + 9 * day)
+            and book.is_free(102, today, today + day) and book.find(101, today + day) is first
+            and book.find(101, today + 4 * day) is second and book.find(101, today + 5 * day) is None):
+        print("Test PASS. Availability queries are correct.")
+    else:
+        print("Test FAIL. Check the methods is_free() and find().")
+
+    print("=================================================================")
+    print("Test Case 4: Close and Cancel Reservations.")
+    print("=================================================================")
+    book.close(first.reservation_id, today + day)
+    book.cancel(second.reservation_id)
+
+    if (first.departure == today + day and first.status == "Finalizada" and second.status == "Cancelada"
+            and book.is_free(101, today + day, today + 9 * day) and len(book) == 2):
+        print("Test PASS. Released nights are available again.")
+    else:
+        print("Test FAIL. Check the methods close() and cancel().")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,342 @@
+import mmap
+import os
+import struct
+from bisect import bisect_left
+from itertools import compress
+from Inventory import OCCUPIED, STATE_CODES, TYPE_CODES, RoomColumns
+from Roomstate import RoomState
+
+HEADER = struct.Struct("<8sQ")
+MAGIC = b"HOTELRMS"
+
+def write_snapshot(rooms, path: str) -> int:
+    """Write a room inventory to a binary snapshot file.
+
+    The file holds a header with the number of rooms and then the four columns of a
+    RoomColumns, sorted by room number: numbers (8 bytes each), prices (8 bytes each),
+    type codes and state codes (1 byte each). The 8-byte columns come first so every
+    column is aligned once the file is mapped. The file is written aside and renamed, so a
+    crash never leaves a partial snapshot.
+
+    The snapshot holds rooms, not guests, so an occupied room is written as "Sucia", the
+    state its room reaches once the guest leaves; otherwise it would come back occupied by
+    nobody, and no check-in, check-out or state change could free it.
+
+    Parameters
+    ----------
+    rooms : iterable
+        Room instances, e.g. hotel.rooms.
+    path : str
+        Path of the snapshot file.
+
+    Returns
+    -------
+    int
+        Number of rooms written.
+    """
+    columns = RoomColumns.from_rooms(sorted(rooms, key=lambda room: room.room_number))
+    temporary = path + ".tmp"
+    vacated = bytearray(range(256))
+    vacated[OCCUPIED] = STATE_CODES[RoomState.SUCIA]
+    with open(temporary, "wb") as file:
+        file.write(HEADER.pack(MAGIC, len(columns)))
+        for column in (columns.room_number, columns.room_price, columns.room_type):
+            file.write(column.tobytes())
+        file.write(columns.room_state.tobytes().translate(vacated))
+    os.replace(temporary, path)
+    return len(columns)
+
+
+class MappedRooms(dict):
+    """Python class to implement the rooms of a hotel backed by a memory-mapped snapshot.
+
+    A dictionary from room number to Room, as kept by Hotel, that starts empty over a
+    snapshot written by write_snapshot(). Opening it only maps the file: the columns are
+    read in place through memoryviews, a room is found by binary search in the sorted
+    numbers, and its Room instance is built the first time it is looked up. Later changes
+    live in the Room instances and the dictionary; the file is never written.
+
+    Rooms removed from the hotel are remembered so the snapshot does not bring them back.
+    Iterating or taking the length builds every remaining room, in snapshot order
+    followed by the rooms added since.
+
+    Syntax
+    ------
+    obj = MappedRooms(path)
+
+    Parameters
+    ----------
+    [in] path : str
+        Path of the snapshot file.
+
+    Returns
+    -------
+    obj : MappedRooms
+        Python object output parameter that represents an instance of the class MappedRooms.
+
+    Attributes
+    ----------
+    columns : RoomColumns
+        The columns of the snapshot, as read-only memoryviews over the mapped file.
+    """
+
+    def __init__(self, path: str):
+        super().__init__()
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a room snapshot.")
+        view = memoryview(self._map)
+        position = HEADER.size
+        self.columns = columns = RoomColumns()
+        for name, code, size in (("room_number", "q", 8), ("room_price", "d", 8),
+                                 ("room_type", "b", 1), ("room_state", "b", 1)):
+            setattr(columns, name, view[position:position + count * size].cast(code))
+            position += count * size
+        self._removed = set()
+        self._complete = False
+
+    def _find(self, room_number):
+        numbers = self.columns.room_number
+        index = bisect_left(numbers, room_number)
+        if index == len(numbers) or numbers[index] != room_number or room_number in self._removed:
+            return None
+        # Another thread may have built the room meanwhile; the first one wins.
+        return dict.setdefault(self, room_number, self.columns.room(index))
+
+    def __missing__(self, room_number):
+        room = None if self._complete else self._find(room_number)
+        if room is None:
+            raise KeyError(room_number)
+        return room
+
+    def get(self, room_number, default=None):
+        room = dict.get(self, room_number)
+        if room is None and not self._complete:
+            room = self._find(room_number)
+        return default if room is None else room
+
+    def __contains__(self, room_number) -> bool:
+        return self.get(room_number) is not None
+
+    def __setitem__(self, room_number, room):
+        self._removed.discard(room_number)
+        dict.__setitem__(self, room_number, room)
+
+    def pop(self, room_number, *default):
+        room = self.get(room_number)
+        if room is None:
+            if default:
+                return default[0]
+            raise KeyError(room_number)
+        self._removed.add(room_number)
+        return dict.pop(self, room_number)
+
+    def _build(self):
+        if self._complete:
+            return
+        rooms = {}
+        for number in self.columns.room_number:
+            room = self.get(number)
+            if room is not None:
+                rooms[number] = room
+        for number, room in dict.items(self):
+            rooms.setdefault(number, room)
+        dict.clear(self)
+        dict.update(self, rooms)
+        self._complete = True
+
+    def __len__(self) -> int:
+        self._build()
+        return dict.__len__(self)
+
+    def __iter__(self):
+        self._build()
+        return dict.__iter__(self)
+
+    def keys(self):
+        self._build()
+        return dict.keys(self)
+
+    def values(self):
+        self._build()
+        return dict.values(self)
+
+    def items(self):
+        self._build()
+        return dict.items(self)
+
+    def indexes(self) -> tuple:
+        """Make the type, state and floor indexes of the snapshot rooms for a Hotel.
+
+        Each index builds the set of a key from the columns the first time the key is used.
+        Every change of a room goes through the set of its old key first, so a set is always
+        built before the snapshot stops describing it.
+
+        Returns
+        -------
+        tuple
+            The LazyIndex instances by type, by state and by floor.
+        """
+        columns = self.columns
+        numbers = columns.room_number
+
+        def by_code(codes, column):
+            def build(key):
+                code = codes.get(key)
+                if code is None:
+                    return set()
+                # One byte per room, 1 where the room has the code.
+                table = bytearray(256)
+                table[code] = 1
+                return set(compress(numbers, column.tobytes().translate(table)))
+            return build
+
+        def by_floor(floor):
+            start = bisect_left(numbers, floor * 100)
+            return set(numbers[start:bisect_left(numbers, floor * 100 + 100, start)])
+
+        return (LazyIndex(by_code(TYPE_CODES, columns.room_type)),
+                LazyIndex(by_code(STATE_CODES, columns.room_state)), LazyIndex(by_floor))
+
+
+class LazyIndex(dict):
+    """Python class to implement an index of room numbers whose sets are built on first use.
+
+    Syntax
+    ------
+    obj = LazyIndex(build)
+
+    Parameters
+    ----------
+    [in] build : callable
+        Called with a key, returns the set of room numbers of the key.
+
+    Returns
+    -------
+    obj : LazyIndex
+        Python object output parameter that represents an instance of the class LazyIndex.
+
+    Attributes
+    ----------
+    """
+
+    def __init__(self, build):
+        super().__init__()
+        self._build = build
+
+    def __missing__(self, key):
+        numbers = self[key] = self._build(key)
+        return numbers
+
+    def get(self, key, default=None):
+        return self[key]
+
+    def setdefault(self, key, default=None):
+        return self[key]
+
+
+def main():
+    # TESTING
+    import tempfile
+    from time import perf_counter
+    from Hotel import Hotel
+    from Room import Room
+    from Roomtype import HotelRoomType
+
+    path = os.path.join(tempfile.mkdtemp(), "rooms.snapshot")
+
+    print("=================================================================")
+    print("Test Case 1: Attach a Hotel to a Snapshot.")
+    print("=================================================================")
+    source = Hotel("Grand Hotel")
+    for number, room_type, room_state in ((305, "Suite", "Sucia"), (101, "Doble", "Desocupada"),
+                                          (102, "Doble", "Ocupada"), (301, "Individual", "Desocupada"),
+                                          (302, "Doble", "Desocupada")):
+        source.add_room(Room(HotelRoomType(room_type), number, room_state, number / 2))
+    written = write_snapshot(source.rooms, path)
+    hotel = Hotel("Grand Hotel")
+    attached = hotel.attach_snapshot(path)
+    built = dict.__len__(hotel._rooms)
+    room = hotel.find_room(302)
+
+    if (written == attached == 5 and built == 0 and room.room_type == HotelRoomType.DOBLE
+            and room.room_price == 151 and hotel.find_room(303) is None and hotel.find_room(302) is room
+            and sorted(room.room_number for room in hotel.rooms_in_state("Desocupada", floor=3)) == [301, 302]
+            and sorted(room.room_number for room in hotel.rooms_by_state("Sucia")) == [102, 305]
+            and not hotel.rooms_by_state("Ocupada")):
+        print("Test PASS. Rooms are found in the snapshot and built on first access, occupied ones vacated.")
+    else:
+        print("Test FAIL. Check the class MappedRooms and the method Hotel.attach_snapshot().")
+
+    print("=================================================================")
+    print("Test Case 2: Change a Hotel Attached to a Snapshot.")
+    print("=================================================================")
+    hotel.check_in(101, "Alice")
+    hotel.remove_room(301)
+    hotel.add_room(Room(HotelRoomType.SUITE, 401, "Desocupada", 500))
+    hotel.add_room(Room(HotelRoomType.SUITE, 102, "Desocupada", 250))
+
+    if ([room.room_number for room in hotel.rooms] == [101, 102, 302, 305, 401]
+            and hotel.find_room(301) is None and hotel.find_room(101).is_occupied()
+            and sorted(room.room_number for room in hotel.available_rooms()) == [102, 302, 401]
+            and sorted(room.room_number for room in hotel.rooms_by_type("Suite")) == [102, 305, 401]):
+        print("Test PASS. Changes are kept over the snapshot and the indexes stay consistent.")
+    else:
+        print("Test FAIL. Check the methods of MappedRooms and LazyIndex.")
+
+    print("=================================================================")
+    print("Test Case 3: Attach Time.")
+    print("=================================================================")
+    source = Hotel("Big Hotel")
+    source.add_rooms(Room(HotelRoomType("Individual" if number % 2 else "Doble"), number, "Desocupada", 100.0)
+                     for number in range(1000000))
+    write_snapshot(source.rooms, path)
+    start = perf_counter()
+    hotel = Hotel("Big Hotel")
+    hotel.attach_snapshot(path)
+    room = hotel.find_room(123456)
+    attach = perf_counter() - start
+    start = perf_counter()
+    result = hotel.check_in(123456, "Alice")
+    first = perf_counter() - start
+
+    if (room.room_number == 123456 and result == "Check-in successful for Alice in room 123456."
+            and os.path.getsize(path) == HEADER.size + 18000000 and attach < 0.1):
+        print(f"Test PASS. Attached 1,000,000 rooms in {attach * 1000:.2f} ms, "
+              f"first check-in with its state index in {first * 1000:.0f} ms.")
+    else:
+        print(f"Test FAIL. Attached in {attach * 1000:.2f} ms. Check the snapshot at scale.")
+
+    print("=================================================================")
+    print("Test Case 4: Save and Reload an Occupied Room through main.py.")
+    print("=================================================================")
+    import json
+    import subprocess
+    import sys
+
+    def run(*args, commands):
+        script = os.path.join(os.path.dirname(path), "commands.jsonl")
+        with open(script, "w", encoding="utf-8") as file:
+            file.writelines(json.dumps(command) + "\n" for command in commands)
+        main_py = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
+        return subprocess.run([sys.executable, main_py, "--batch", script, "--output", "-", *args],
+                              capture_output=True, text=True)
+
+    saved = run("--save-snapshot", path, commands=[
+        {"op": "add_room", "room_type": "Doble", "room_number": 101, "room_price": 100},
+        {"op": "check_in", "room_number": 101, "guest_name": "Alice"}])
+    reloaded = run("--snapshot", path, commands=[
+        {"op": "set_room_state", "room_number": 101, "room_state": "Limpiando"},
+        {"op": "set_room_state", "room_number": 101, "room_state": "Inspeccionada"},
+        {"op": "check_in", "room_number": 101, "guest_name": "Bob"},
+        {"op": "check_out", "room_number": 101}])
+
+    if saved.returncode == 0 and reloaded.returncode == 0 and reloaded.stdout.count('"ok": true') == 4:
+        print("Test PASS. A room saved occupied is cleaned and let again after the reload.")
+    else:
+        print("Test FAIL. Check write_snapshot() with occupied rooms.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+from enum import Enum
+
+class RoomState(str, Enum):
+    """Python class to implement an enumeration for the attribute Room State.
+
+    This Python class implements an enumeration for the attribute Room State. Members
+    compare equal to their string value, so RoomState.OCUPADA == "Ocupada".
+
+    Besides occupancy, a room goes through the housekeeping cycle (Sucia, Limpiando,
+    Inspeccionada), can be held for an arriving guest (Reservada) or taken out of service
+    (Fuera de servicio). TRANSITIONS lists the states each state may move to, and
+    can_transition() checks a move against it.
+
+    Syntax
+    ------
+      obj = RoomState.Enum
+
+    Parameters
+    ----------
+
+    Returns
+    -------
+      obj : RoomState
+          Python object output parameter that represents an instance
+          of the class RoomState.
+
+    Attributes
+    ----------
+    """
+    #Here you start your code.
+    DESOCUPADA = "Desocupada"
+    OCUPADA = "Ocupada"
+    SUCIA = "Sucia"
+    LIMPIANDO = "Limpiando"
+    INSPECCIONADA = "Inspeccionada"
+    FUERA_DE_SERVICIO = "Fuera de servicio"
+    RESERVADA = "Reservada"
+
+    def __str__(self) -> str:
+        return self.value
+
+    def can_transition(self, room_state) -> bool:
+        """Check whether a room in this state may move to another state.
+
+        Parameters
+        ----------
+        room_state : RoomState
+            The target state. Its value (e.g., "Sucia") is also accepted.
+
+        Returns
+        -------
+        bool
+            True if the move is allowed, False otherwise.
+        """
+        return RoomState(room_state) in TRANSITIONS[self]
+
+
+TRANSITIONS = {
+    RoomState.DESOCUPADA: frozenset({RoomState.OCUPADA, RoomState.SUCIA, RoomState.INSPECCIONADA,
+                                     RoomState.RESERVADA, RoomState.FUERA_DE_SERVICIO}),
+    RoomState.OCUPADA: frozenset({RoomState.DESOCUPADA}),
+    RoomState.SUCIA: frozenset({RoomState.LIMPIANDO, RoomState.FUERA_DE_SERVICIO}),
+    RoomState.LIMPIANDO: frozenset({RoomState.SUCIA, RoomState.INSPECCIONADA, RoomState.FUERA_DE_SERVICIO}),
+    RoomState.INSPECCIONADA: frozenset({RoomState.OCUPADA, RoomState.DESOCUPADA, RoomState.SUCIA,
+                                        RoomState.RESERVADA, RoomState.FUERA_DE_SERVICIO}),
+    RoomState.FUERA_DE_SERVICIO: frozenset({RoomState.DESOCUPADA, RoomState.SUCIA}),
+    RoomState.RESERVADA: frozenset({RoomState.OCUPADA, RoomState.DESOCUPADA, RoomState.FUERA_DE_SERVICIO}),
+}
+
+# States of the rooms a walk-in guest can be given.
+AVAILABLE_STATES = (RoomState.DESOCUPADA, RoomState.INSPECCIONADA)
+
+
+def main():
+    #TESTING
+    print("=================================================================.")
+    print("Test Case 1: Check Class RoomState.")
+    print("=================================================================.")
+
+    if RoomState("Ocupada") is RoomState.OCUPADA and RoomState.OCUPADA == "Ocupada":
+        print("Test PASS. The enum for Ocupada has been correctly set.")
+    else:
+        print("Test FAIL. Check the value of RoomState.OCUPADA.")
+
+    if RoomState("Desocupada") is RoomState.DESOCUPADA and f"{RoomState.DESOCUPADA}" == "Desocupada":
+        print("Test PASS. The enum for Desocupada has been correctly set.")
+    else:
+        print("Test FAIL. Check the value of RoomState.DESOCUPADA.")
+
+    print("=================================================================.")
+    print("Test Case 2: Check the State Transitions.")
+    print("=================================================================.")
+
+    if (RoomState.SUCIA.can_transition(RoomState.LIMPIANDO) and RoomState.INSPECCIONADA.can_transition("Ocupada")
+            and not RoomState.SUCIA.can_transition(RoomState.OCUPADA)
+            and not RoomState.OCUPADA.can_transition(RoomState.FUERA_DE_SERVICIO)
+            and all(room_state in TRANSITIONS for room_state in RoomState)):
+        print("Test PASS. Only the allowed transitions are accepted.")
+    else:
+        print("Test FAIL. Check the table TRANSITIONS and the method can_transition().")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,372 @@
+import mmap
+import os
+import struct
+from Inventory import OCCUPIED, ROOM_STATES, ROOM_TYPES, STATE_CODES, TYPE_CODES
+from Room import Room
+from Roomtype import HotelRoomType
+
+HEADER = struct.Struct("<8sQQ")
+MAGIC = b"HOTELSHM"
+COUNT_OFFSET = 16
+SEQUENCE = struct.Struct("<Q")
+FIELDS = struct.Struct("<qBB6xd")
+RECORD = struct.Struct("<QqBB6xd")
+REMOVED = 255
+
+class InventoryWriter:
+    """Python class to implement the single writer of a shared room inventory file.
+
+    The file holds a header and one fixed-width record per room: a sequence number, the
+    room number, the HotelRoomType and RoomState codes of Inventory and the price, 32
+    bytes in all. The writer follows a hotel and rewrites the record of a room on every
+    event that changes it. Each write is guarded like a seqlock: the sequence number is
+    made odd, the fields are written, and it is made even again, so a reader that sees the
+    same even number before and after its read knows the record was not being written.
+
+    A room keeps its slot for good. New rooms are appended and the file grows when full;
+    removed rooms are marked with the state code REMOVED and get their slot back if added
+    again. Only one writer may follow a file at a time.
+
+    Syntax
+    ------
+    obj = InventoryWriter(hotel, path, capacity)
+
+    Parameters
+    ----------
+    [in] hotel : Hotel
+        The hotel to follow. Its current rooms are written when the file is created.
+    [in] path : str
+        Path of the inventory file. It is created, replacing any previous one.
+    [in] capacity : int
+        Number of records the file has room for before growing. Defaults to twice the
+        current rooms, at least 1024.
+
+    Returns
+    -------
+    obj : InventoryWriter
+        Python object output parameter that represents an instance of the class InventoryWriter.
+
+    Attributes
+    ----------
+    path : str
+        Path of the inventory file.
+    """
+
+    def __init__(self, hotel, path: str, capacity: int = None):
+        rooms = hotel.rooms
+        self.path = path
+        self._hotel = hotel
+        self._slots = {}
+        capacity = max(capacity or 2 * len(rooms), len(rooms), 1024)
+        # A new file replaces the old one, so readers of the old one are not cut short.
+        temporary = path + ".tmp"
+        with open(temporary, "wb") as file:
+            file.write(HEADER.pack(MAGIC, capacity, 0))
+            file.truncate(HEADER.size + capacity * RECORD.size)
+        os.replace(temporary, path)
+        self._file = open(path, "r+b")
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        self._capacity = capacity
+        for room in rooms:
+            self.write_room(room)
+        hotel.subscribe(self)
+
+    def close(self):
+        """Stop following the hotel and close the file. Readers keep their mapping."""
+        self._hotel.unsubscribe(self)
+        self._map.close()
+        self._file.close()
+
+    def __call__(self, event: str, obj):
+        if event in ("add_room", "room_state"):
+            self.write_room(obj)
+        elif event == "remove_room":
+            slot = self._slots.get(obj.room_number)
+            if slot is not None:
+                self._write(slot, obj.room_number, TYPE_CODES[HotelRoomType(obj.room_type)], REMOVED, obj.room_price)
+        elif event in ("check_in", "check_out"):
+            room = self._hotel.find_room(obj.room_number)
+            if room is not None:
+                self.write_room(room)
+
+    def write_room(self, room: Room):
+        """Write the current values of a room to its record, appending it if new.
+
+        Parameters
+        ----------
+        room : Room
+            The Room instance to be written.
+        """
+        slot = self._slots.get(room.room_number)
+        if slot is None:
+            slot = len(self._slots)
+            if slot == self._capacity:
+                self._grow()
+            self._slots[room.room_number] = slot
+            self._write(slot, room.room_number, TYPE_CODES[HotelRoomType(room.room_type)],
+                        STATE_CODES[room.room_state], room.room_price)
+            # Publish the new record only once it is complete.
+            SEQUENCE.pack_into(self._map, COUNT_OFFSET, slot + 1)
+        else:
+            self._write(slot, room.room_number, TYPE_CODES[HotelRoomType(room.room_type)],
+                        STATE_CODES[room.room_state], room.room_price)
+
+    def _write(self, slot: int, room_number: int, type_code: int, state_code: int, room_price: float):
+        offset = HEADER.size + slot * RECORD.size
+        sequence, = SEQUENCE.unpack_from(self._map, offset)
+        SEQUENCE.pack_into(self._map, offset, sequence + 1)
+        FIELDS.pack_into(self._map, offset + SEQUENCE.size, room_number, type_code, state_code, room_price)
+        SEQUENCE.pack_into(self._map, offset, sequence + 2)
+
+    def _grow(self):
+        self._capacity *= 2
+        self._map.close()
+        self._file.truncate(HEADER.size + self._capacity * RECORD.size)
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        HEADER.pack_into(self._map, 0, MAGIC, self._capacity, len(self._slots))
+
+
+class InventoryReader:
+    """Python class to implement a reader of a shared room inventory file.
+
+    Any number of processes may open the file written by an InventoryWriter. The file is
+    memory-mapped read-only and records are decoded in place, so readers share the
+    writer's pages and nothing is copied or pickled between processes. Every record is
+    read under its seqlock: the read is retried while the record is being written.
+
+    The reader learns the slots of new rooms from the header the next time a room is not
+    found, and maps the file again if the writer made it grow.
+
+    Syntax
+    ------
+    obj = InventoryReader(path)
+
+    Parameters
+    ----------
+    [in] path : str
+        Path of the inventory file.
+
+    Returns
+    -------
+    obj : InventoryReader
+        Python object output parameter that represents an instance of the class InventoryReader.
+
+    Attributes
+    ----------
+    path : str
+        Path of the inventory file.
+    retries : int
+        Reads repeated because the record was being written.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.retries = 0
+        self._map = None
+        self._slots = {}
+        self._count = 0
+        self._open()
+
+    def _open(self):
+        if self._map is not None:
+            self._map.close()
+        with open(self.path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, _, _ = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a shared room inventory.")
+
+    def close(self):
+        """Unmap the file."""
+        self._map.close()
+
+    def refresh(self) -> int:
+        """Learn the rooms appended by the writer since the last refresh.
+
+        Returns
+        -------
+        int
+            Number of slots in use.
+        """
+        count, = SEQUENCE.unpack_from(self._map, COUNT_OFFSET)
+        if HEADER.size + count * RECORD.size > len(self._map):
+            self._open()
+            count, = SEQUENCE.unpack_from(self._map, COUNT_OFFSET)
+        for slot in range(self._count, count):
+            self._slots[self._read(slot)[0]] = slot
+        self._count = count
+        return count
+
+    def _read(self, slot: int) -> tuple:
+        data = self._map
+        offset = HEADER.size + slot * RECORD.size
+        unpack_record = RECORD.unpack_from
+        unpack_sequence = SEQUENCE.unpack_from
+        while True:
+            sequence, room_number, type_code, state_code, room_price = unpack_record(data, offset)
+            if not sequence & 1 and unpack_sequence(data, offset)[0] == sequence:
+                return room_number, type_code, state_code, room_price
+            self.retries += 1
+
+    def _slot(self, room_number: int):
+        slot = self._slots.get(room_number)
+        if slot is None:
+            self.refresh()
+            slot = self._slots.get(room_number)
+        return slot
+
+    def record(self, room_number: int):
+        """Get the consistent values of a room without building a Room.
+
+        Parameters
+        ----------
+        room_number : int
+            The number of the room.
+
+        Returns
+        -------
+        tuple or None
+            (room_number, type code, state code, room_price), None if the room does not exist.
+        """
+        slot = self._slot(room_number)
+        if slot is None:
+            return None
+        record = self._read(slot)
+        return None if record[2] == REMOVED else record
+
+    def find_room(self, room_number: int):
+        """Find a room by its number.
+
+        Parameters
+        ----------
+        room_number : int
+            The number of the room to find.
+
+        Returns
+        -------
+        Room or None
+            A new Room instance with the current values, None if the room does not exist.
+        """
+        record = self.record(room_number)
+        if record is None:
+            return None
+        room_number, type_code, state_code, room_price = record
+        return Room(ROOM_TYPES[type_code], room_number, ROOM_STATES[state_code], room_price)
+
+    def is_occupied(self, room_number: int) -> bool:
+        """Check if a room is occupied.
+
+        Parameters
+        ----------
+        room_number : int
+            The number of the room.
+
+        Returns
+        -------
+        bool
+            True if the room exists and is occupied, False otherwise.
+        """
+        record = self.record(room_number)
+        return record is not None and record[2] == OCCUPIED
+
+    def count_by_state(self) -> dict:
+        """Count the rooms in each state.
+
+        Returns
+        -------
+        dict
+            Number of rooms by RoomState, for the states with at least one room.
+        """
+        counts = {}
+        for slot in range(self.refresh()):
+            state_code = self._read(slot)[2]
+            if state_code != REMOVED:
+                counts[ROOM_STATES[state_code]] = counts.get(ROOM_STATES[state_code], 0) + 1
+        return counts
+
+
+def _read_rooms(path: str, numbers: range, passes: int) -> tuple:
+    """Read rooms in a worker process, counting the reads that broke the writer's invariant."""
+    reader = InventoryReader(path)
+    broken = 0
+    for _ in range(passes):
+        for number in numbers:
+            record = reader.record(number)
+            if record is None or record[3] != 100.0 + number or record[0] != number:
+                broken += 1
+    reader.close()
+    return passes * len(numbers), broken
+
+
+def main():
+    # TESTING
+    import multiprocessing
+    import tempfile
+    from time import perf_counter
+    from Hotel import Hotel
+    from Roomstate import RoomState
+
+    path = os.path.join(tempfile.mkdtemp(), "rooms.shm")
+
+    print("=================================================================")
+    print("Test Case 1: Readers Follow the Writer.")
+    print("=================================================================")
+    hotel = Hotel("Grand Hotel")
+    for number in (101, 102, 103):
+        hotel.add_room(Room(HotelRoomType.DOBLE, number, "Desocupada", 100))
+    writer = InventoryWriter(hotel, path)
+    reader = InventoryReader(path)
+    before = reader.is_occupied(101)
+    hotel.check_in(101, "Alice")
+    hotel.set_room_state(103, "Fuera de servicio")
+    hotel.add_room(Room(HotelRoomType.SUITE, 201, "Desocupada", 300))
+    hotel.remove_room(102)
+
+    if (not before and reader.is_occupied(101) and reader.find_room(103).room_state == "Fuera de servicio"
+            and reader.find_room(201).room_type == HotelRoomType.SUITE and reader.find_room(102) is None
+            and reader.count_by_state() == {RoomState.OCUPADA: 1, RoomState.FUERA_DE_SERVICIO: 1, RoomState.DESOCUPADA: 1}):
+        print("Test PASS. Check-ins, state changes, new and removed rooms are seen by the reader.")
+    else:
+        print("Test FAIL. Check the classes InventoryWriter and InventoryReader.")
+
+    print("=================================================================")
+    print("Test Case 2: Grow the File.")
+    print("=================================================================")
+    hotel.add_rooms(Room(HotelRoomType.INDIVIDUAL, number, "Desocupada", 50) for number in range(1000, 3000))
+
+    if reader.find_room(2999).room_price == 50 and reader.refresh() == 2004 and reader.find_room(101).is_occupied():
+        print("Test PASS. The reader maps the file again after it grows.")
+    else:
+        print("Test FAIL. Check the methods _grow() and refresh().")
+    writer.close()
+    reader.close()
+
+    print("=================================================================")
+    print("Test Case 3: Processes Reading While the Writer Updates.")
+    print("=================================================================")
+    hotel = Hotel("Big Hotel")
+    hotel.add_rooms(Room(HotelRoomType.DOBLE, number, "Desocupada", 100.0 + number) for number in range(1000))
+    writer = InventoryWriter(hotel, path)
+    processes = max(2, os.cpu_count() or 1)
+    with multiprocessing.Pool(processes) as pool:
+        start = perf_counter()
+        pending = pool.starmap_async(_read_rooms, [(path, range(1000), 100)] * processes)
+        turnovers = 0
+        while not pending.ready():
+            number = turnovers % 1000
+            hotel.check_in(number, "Guest")
+            hotel.check_out(number)
+            turnovers += 1
+        results = pending.get()
+        elapsed = perf_counter() - start
+    writer.close()
+    reads = sum(count for count, _ in results)
+
+    if sum(broken for _, broken in results) == 0 and turnovers > 0:
+        print(f"Test PASS. {processes} readers made {reads / elapsed:,.0f} consistent reads/s "
+              f"during {turnovers:,} writer turnovers.")
+    else:
+        print("Test FAIL. Check the seqlock of the records.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,351 @@
+import sqlite3
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from datetime import date
+from Employee import Employee
+from Reservation import Reservation
+from Room import Room
+from Roomtype import HotelRoomType
+
+class Storage(ABC):
+    """Python abstract class to implement the interface of a persistence backend for a hotel.
+
+    A backend is a Hotel listener: attach() loads the saved state into a hotel and
+    subscribes the backend, so every later mutation of the hotel is written through
+    on_<event>() methods. Subclasses must implement load() and define the handlers they
+    need; events without a handler are ignored.
+
+    Syntax
+    ------
+    obj = SQLiteStorage(path), or any other subclass
+
+    Parameters
+    ----------
+
+    Returns
+    -------
+    obj : Storage
+        Python object output parameter that represents an instance of the class Storage.
+
+    Attributes
+    ----------
+    """
+
+    def __call__(self, event: str, obj):
+        handler = getattr(self, "on_" + event, None)
+        if handler is not None:
+            handler(obj)
+
+    def attach(self, hotel):
+        """Load the saved state into a hotel and persist its later mutations.
+
+        Parameters
+        ----------
+        hotel : Hotel
+            The hotel to be restored. It is expected to be empty.
+        """
+        self.load(hotel)
+        hotel.subscribe(self)
+
+    @abstractmethod
+    def load(self, hotel):
+        """Load the saved rooms, employees and reservations into a hotel.
+
+        Parameters
+        ----------
+        hotel : Hotel
+            The hotel to be restored.
+        """
+
+    def close(self):
+        """Release the resources of the backend."""
+
+
+class SQLiteStorage(Storage):
+    """Python class to implement a SQLite persistence backend for a hotel.
+
+    The database runs in write-ahead logging mode with synchronous=NORMAL, so a commit
+    appends to the WAL file without waiting for a full sync of the database. Every
+    statement is a constant SQL string, which sqlite3 prepares once and keeps in its
+    statement cache. Each hotel mutation is one transaction unless it happens inside
+    batch(), which groups any number of mutations into a single commit.
+
+    Syntax
+    ------
+    obj = SQLiteStorage(path)
+
+    Parameters
+    ----------
+    [in] path : str
+        Path of the database file. It is created if it does not exist.
+
+    Returns
+    -------
+    obj : SQLiteStorage
+        Python object output parameter that represents an instance of the class SQLiteStorage.
+
+    Attributes
+    ----------
+    path : str
+        Path of the database file.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS rooms (
+            room_number INTEGER PRIMARY KEY,
+            room_type TEXT NOT NULL,
+            room_state TEXT NOT NULL,
+            room_price REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS employees (
+            emp_id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            position TEXT NOT NULL,
+            salary REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS reservations (
+            reservation_id INTEGER PRIMARY KEY,
+            room_number INTEGER NOT NULL,
+            guest_name TEXT NOT NULL,
+            arrival TEXT NOT NULL,
+            departure TEXT NOT NULL,
+            status TEXT NOT NULL
+        );
+    """
+    SAVE_ROOM = "INSERT OR REPLACE INTO rooms VALUES (?, ?, ?, ?)"
+    DELETE_ROOM = "DELETE FROM rooms WHERE room_number = ?"
+    SET_ROOM_STATE = "UPDATE rooms SET room_state = ? WHERE room_number = ?"
+    DELETE_ROOM_STAYS = ("DELETE FROM reservations "
+                         "WHERE room_number = ? AND status IN ('En curso', 'Finalizada')")
+    CANCEL_ROOM_RESERVATIONS = ("UPDATE reservations SET status = 'Cancelada' "
+                                "WHERE room_number = ? AND status IN ('Confirmada', 'Desplazada')")
+    SAVE_EMPLOYEE = "INSERT OR REPLACE INTO employees VALUES (?, ?, ?, ?)"
+    DELETE_EMPLOYEE = "DELETE FROM employees WHERE emp_id = ?"
+    SAVE_RESERVATION = "INSERT OR REPLACE INTO reservations VALUES (?, ?, ?, ?, ?, ?)"
+
+    def __init__(self, path: str):
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(self.SCHEMA)
+        self._depth = 0
+
+    def __call__(self, event: str, obj):
+        handler = getattr(self, "on_" + event, None)
+        if handler is None:
+            return
+        if self._depth:
+            handler(obj)
+        else:
+            with self._connection:
+                handler(obj)
+
+    @contextmanager
+    def batch(self):
+        """Group the writes made inside a with block into one transaction.
+
+        Nested blocks join the outermost one. The transaction is rolled back if the
+        block raises.
+        """
+        self._depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._depth -= 1
+            if not self._depth:
+                self._connection.rollback()
+            raise
+        self._depth -= 1
+        if not self._depth:
+            self._connection.commit()
+
+    def load(self, hotel):
+        """Load the saved rooms, employees and reservations into a hotel.
+
+        Parameters
+        ----------
+        hotel : Hotel
+            The hotel to be restored.
+        """
+        execute = self._connection.execute
+        for room_number, room_type, room_state, room_price in execute("SELECT * FROM rooms"):
+            hotel.add_room(Room(HotelRoomType(room_type), room_number, room_state, room_price))
+        for emp_id, name, position, salary in execute("SELECT * FROM employees"):
+            hotel.add_employee(Employee(emp_id, name, position, salary))
+        fromisoformat = date.fromisoformat
+        rows = execute("SELECT * FROM reservations WHERE status != 'Cancelada' ORDER BY reservation_id")
+        for reservation_id, room_number, guest_name, arrival, departure, status in rows:
+            hotel.restore_reservation(Reservation(reservation_id, room_number, guest_name,
+                                                  fromisoformat(arrival), fromisoformat(departure), status))
+
+    def save(self, hotel):
+        """Write the full state of a hotel in one transaction.
+
+        Parameters
+        ----------
+        hotel : Hotel
+            The hotel to be saved.
+        """
+        with self.batch():
+            executemany = self._connection.executemany
+            executemany(self.SAVE_ROOM, ((room.room_number, HotelRoomType(room.room_type).value,
+                                          room.room_state.value, room.room_price) for room in hotel.rooms))
+            executemany(self.SAVE_EMPLOYEE, ((employee.get_emp_id(), employee.get_name(), employee.get_position(),
+                                              employee.get_salary()) for employee in hotel.employees))
+            executemany(self.SAVE_RESERVATION, (self._reservation_row(reservation) for reservation in hotel.bookings))
+
+    def close(self):
+        """Close the database connection."""
+        self._connection.close()
+
+    def on_add_room(self, room: Room):
+        self._connection.execute(self.SAVE_ROOM, (room.room_number, HotelRoomType(room.room_type).value,
+                                                  room.room_state.value, room.room_price))
+
+    def on_remove_room(self, room: Room):
+        self._connection.execute(self.DELETE_ROOM, (room.room_number,))
+        self._connection.execute(self.DELETE_ROOM_STAYS, (room.room_number,))
+        self._connection.execute(self.CANCEL_ROOM_RESERVATIONS, (room.room_number,))
+
+    def on_add_employee(self, employee: Employee):
+        self._connection.execute(self.SAVE_EMPLOYEE, (employee.get_emp_id(), employee.get_name(),
+                                                      employee.get_position(), employee.get_salary()))
+
+    on_update_employee = on_add_employee
+
+    def on_remove_employee(self, employee: Employee):
+        self._connection.execute(self.DELETE_EMPLOYEE, (employee.get_emp_id(),))
+
+    def on_reserve(self, reservation: Reservation):
+        self._connection.execute(self.SAVE_RESERVATION, self._reservation_row(reservation))
+
+    on_cancel_reservation = on_displace_reservation = on_reserve
+
+    def on_check_in(self, reservation: Reservation):
+        self._connection.execute(self.SAVE_RESERVATION, self._reservation_row(reservation))
+        self._connection.execute(self.SET_ROOM_STATE, ("Ocupada", reservation.room_number))
+
+    def on_check_out(self, reservation: Reservation):
+        self._connection.execute(self.SAVE_RESERVATION, self._reservation_row(reservation))
+        self._connection.execute(self.SET_ROOM_STATE, ("Desocupada", reservation.room_number))
+
+    def on_room_state(self, room: Room):
+        self._connection.execute(self.SET_ROOM_STATE, (room.room_state.value, room.room_number))
+
+    @staticmethod
+    def _reservation_row(reservation: Reservation) -> tuple:
+        return (reservation.reservation_id, reservation.room_number, reservation.guest_name,
+                reservation.arrival.isoformat(), reservation.departure.isoformat(), reservation.status)
+
+
+def main():
+    # TESTING
+    import os
+    import tempfile
+    from time import perf_counter
+    from Hotel import Hotel
+
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "hotel.db")
+
+    print("=================================================================")
+    print("Test Case 1: Persist Hotel Mutations.")
+    print("=================================================================")
+    hotel = Hotel("Grand Hotel")
+    storage = SQLiteStorage(path)
+    storage.attach(hotel)
+    hotel.add_room(Room(HotelRoomType.DOBLE, 101, "Desocupada", 150))
+    hotel.add_room(Room(HotelRoomType.SUITE, 102, "Desocupada", 300))
+    hotel.add_room(Room(HotelRoomType.SUITE, 103, "Desocupada", 320))
+    hotel.add_employee(Employee(1, "John Doe", "Receptionist", 30000))
+    hotel.update_employee(1, salary=32000)
+    hotel.check_in(101, "Alice")
+    hotel.check_in(102, "Bob")
+    hotel.check_out(102)
+    hotel.set_room_state(102, "Sucia")
+    hotel.check_in(103, "Erin")
+    hotel.check_out(103)
+    hotel.check_in(103, "Carol")
+    hotel.remove_room(103)
+    hotel.add_room(Room(HotelRoomType.SUITE, 103, "Desocupada", 320))
+    hotel.check_in(103, "Dave")
+    storage.close()
+
+    restored = Hotel("Grand Hotel")
+    storage = SQLiteStorage(path)
+    storage.attach(restored)
+
+    if (sorted(room.room_number for room in restored.rooms) == [101, 102, 103]
+            and restored.find_room(101).is_occupied() and restored.find_room(102).room_state == "Sucia"
+            and restored.reservations == {101: "Alice", 103: "Dave"} and restored.current_stay(101).guest_name == "Alice"
+            and restored.find_employee(1).get_name() == "John Doe" and restored.find_employee(1).get_salary() == 32000
+            and sorted(reservation.reservation_id for reservation in restored.bookings)
+            == sorted(reservation.reservation_id for reservation in hotel.bookings)):
+        print("Test PASS. The hotel state has been restored from the database.")
+    else:
+        print("Test FAIL. Check the methods load() and on_<event>().")
+
+    if restored.check_out(101) == "Check-out successful for Alice from room 101.":
+        print("Test PASS. Restored stays can be checked out.")
+    else:
+        print("Test FAIL. Check the method load() for current stays.")
+
+    print("=================================================================")
+    print("Test Case 2: Write Latency and Cold Start.")
+    print("=================================================================")
+    start = perf_counter()
+    for number in range(100):
+        restored.check_in(101, f"Guest {number}")
+        restored.check_out(101)
+    latency = (perf_counter() - start) / 200
+    if latency < 0.001:
+        print(f"Test PASS. Check-in/check-out took {latency * 1000:.3f} ms on average.")
+    else:
+        print(f"Test FAIL. Check-in/check-out took {latency * 1000:.3f} ms on average.")
+
+    big = Hotel("Big Hotel")
+    for number in range(100000):
+        big.add_room(Room(HotelRoomType.DOBLE, number, "Desocupada", 100))
+    storage.save(big)
+    storage.close()
+
+    start = perf_counter()
+    cold = Hotel("Big Hotel")
+    storage = SQLiteStorage(path)
+    storage.load(cold)
+    elapsed = perf_counter() - start
+    storage.close()
+    if len(cold.rooms) == 100000 and elapsed < 1.5:
+        print(f"Test PASS. Cold start of 100,000 rooms took {elapsed:.3f} s.")
+    else:
+        print(f"Test FAIL. Cold start of 100,000 rooms took {elapsed:.3f} s.")
+
+    print("=================================================================")
+    print("Test Case 3: Backends Implement load().")
+    print("=================================================================")
+
+    class Incomplete(Storage):
+        def on_add_room(self, room: Room):
+            pass
+
+    class Memory(Storage):
+        def load(self, hotel):
+            hotel.add_room(Room(HotelRoomType.SUITE, 201, "Desocupada", 300))
+
+    refused = []
+    for backend in (Storage, Incomplete):
+        try:
+            backend()
+        except TypeError:
+            refused.append(backend)
+    hotel = Hotel("Grand Hotel")
+    Memory().attach(hotel)
+
+    if refused == [Storage, Incomplete] and [room.room_number for room in hotel.rooms] == [201]:
+        print("Test PASS. Only backends with a load() method can be created.")
+    else:
+        print("Test FAIL. Check the abstract class Storage.")
+
+if __name__ == "__main__":
+    main()
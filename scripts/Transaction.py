@@ -0,0 +1,221 @@
+class Transaction:
+    """Python class to implement an all-or-nothing batch of room and reservation changes.
+
+    Opened with Hotel.transaction() as a context manager. Inside the block the hotel is
+    changed through its usual methods, and every room touched is saved the first time it
+    is touched: the Room instance and its fields, its guest and current stay, and its stays
+    in the ReservationBook. This undo log is copy-on-write, so neither opening, committing
+    nor rolling back copies the hotel; the cost is proportional to the rooms touched.
+
+    Events are held back while the transaction is open, each with a copy of its room or
+    reservation as it was at that point. When the block ends normally the transaction
+    commits: the log is dropped and the events are delivered in order. When it raises,
+    or rollback() is called, every touched room is put back as it was, the reservations
+    booked in the block are forgotten and the events are discarded, so the listeners
+    never see the batch. Employees are not part of the transaction: their changes
+    are kept and their events delivered at once.
+
+    Syntax
+    ------
+    with hotel.transaction() as obj:
+        ...
+
+    Parameters
+    ----------
+    [in] hotel : Hotel
+        The hotel to change.
+
+    Returns
+    -------
+    obj : Transaction
+        Python object output parameter that represents an instance of the class Transaction.
+
+    Attributes
+    ----------
+    events : list
+        The (event, obj) pairs held back until the commit.
+    open : bool
+        True until the transaction commits or rolls back.
+    """
+
+    def __init__(self, hotel):
+        self._hotel = hotel
+        self._saved = {}
+        self._booked = []
+        self.events = []
+        self.open = False
+
+    def __enter__(self):
+        self._hotel._begin(self)
+        self.open = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.open:
+            if exc_type is None:
+                self.commit()
+            else:
+                self.rollback()
+        return False
+
+    def __len__(self) -> int:
+        return len(self._saved)
+
+    def touch(self, room_number: int):
+        """Save a room before its first change in the transaction.
+
+        Parameters
+        ----------
+        room_number : int
+            The number of the room about to change.
+        """
+        if room_number not in self._saved:
+            self._saved[room_number] = self._hotel._save_room(room_number)
+
+    def booked(self, reservation_id: int):
+        """Remember a reservation booked in the transaction.
+
+        Parameters
+        ----------
+        reservation_id : int
+            The ID of the new reservation.
+        """
+        self._booked.append(reservation_id)
+
+    def commit(self):
+        """Keep the changes and deliver the events held back."""
+        self._close(self.events)
+
+    def rollback(self):
+        """Undo the changes and discard the events held back."""
+        hotel = self._hotel
+        try:
+            for reservation_id in self._booked:
+                hotel.bookings.forget(reservation_id)
+            if self._booked:
+                # The IDs are handed out again, as a replay of the events would.
+                hotel.bookings.rewind(min(self._booked))
+            for room_number, saved in self._saved.items():
+                hotel._restore_room(room_number, saved)
+        finally:
+            self.events = []
+            self._close([])
+
+    def _close(self, events: list):
+        self.open = False
+        self._saved = {}
+        self._booked = []
+        self._hotel._end(self, events)
+
+
+def main():
+    # TESTING
+    from datetime import date, timedelta
+    from time import perf_counter
+    from Employee import Employee
+    from Hotel import Hotel
+    from Room import Room
+    from Roomtype import HotelRoomType
+
+    today = date(2030, 5, 1)
+    day = timedelta(days=1)
+    hotel = Hotel("Grand Hotel")
+    for number in (101, 102, 103):
+        hotel.add_room(Room(HotelRoomType.DOBLE, number, "Desocupada", 100))
+    hotel.check_in(101, "Alice", today + 3 * day, today)
+    hotel.reserve(103, "Bob", today + day, today + 2 * day)
+    events = []
+    hotel.subscribe(lambda event, obj: events.append(event))
+
+    print("=================================================================")
+    print("Test Case 1: Commit a Room Move.")
+    print("=================================================================")
+    with hotel.transaction() as transaction:
+        hotel.check_out(101, today)
+        hotel.check_in(102, "Alice", today + 3 * day, today)
+        held = list(events)
+        touched = len(transaction)
+
+    if (held == [] and touched == 2 and events == ["check_out", "check_in"] and not hotel.find_room(101).is_occupied()
+            and hotel.current_stay(102).guest_name == "Alice"):
+        print("Test PASS. Events are held back until the commit.")
+    else:
+        print("Test FAIL. Check the method commit().")
+
+    print("=================================================================")
+    print("Test Case 2: Roll Back on Failure.")
+    print("=================================================================")
+    stay = hotel.current_stay(102)
+    bookings = len(hotel.bookings)
+    events.clear()
+    try:
+        with hotel.transaction():
+            hotel.check_out(102, today)
+            hotel.reserve(101, "Carol", today + 5 * day, today + 6 * day)
+            hotel.set_room_state(102, "Fuera de servicio")
+            hotel.cancel_reservation(hotel.bookings.find(103, today + day).reservation_id)
+            hotel.remove_room(103)
+            raise ValueError("Room 104 is not ready.")
+    except ValueError:
+        pass
+
+    if (events == [] and hotel.current_stay(102) is stay and stay.status == "En curso" and stay.departure == today + 3 * day
+            and hotel.find_room(102).is_occupied() and hotel.reservations == {102: "Alice"}
+            and hotel.bookings.find(103, today + day).guest_name == "Bob" and len(hotel.bookings) == bookings
+            and hotel.bookings.is_free(101, today + 5 * day, today + 6 * day)
+            and hotel.reserve(101, "Erin", today + 7 * day, today + 8 * day).reservation_id == bookings + 1
+            and [room.room_number for room in hotel.rooms_by_state("Desocupada")] == [101, 103]):
+        print("Test PASS. Rooms, stays, reservations and indexes are put back and no event is seen.")
+    else:
+        print("Test FAIL. Check the method rollback().")
+
+    print("=================================================================")
+    print("Test Case 3: Employees Outside the Transaction.")
+    print("=================================================================")
+    events.clear()
+    with hotel.transaction() as transaction:
+        hotel.add_employee(Employee(1, "John Doe", "Receptionist", 30000))
+        seen = list(events)
+        transaction.rollback()
+
+    if seen == ["add_employee"] and hotel.find_employee(1) is not None:
+        print("Test PASS. Employee changes are kept and notified at once.")
+    else:
+        print("Test FAIL. Check the employee events in Hotel._notify().")
+
+    print("=================================================================")
+    print("Test Case 4: Move a Guest.")
+    print("=================================================================")
+    hotel.check_in(103, "Dave", today + 2 * day, today)
+    refused = hotel.move_guest(102, 103, on=today)
+    moved = hotel.move_guest(102, 101, "Fuera de servicio", on=today)
+
+    if (refused == "Room not available or already occupied." and hotel.find_room(101).is_occupied()
+            and moved == "Alice moved from room 102 to room 101." and hotel.current_stay(101).departure == today + 3 * day
+            and hotel.find_room(102).room_state == "Fuera de servicio"):
+        print("Test PASS. A failed move leaves the guest in place.")
+    else:
+        print("Test FAIL. Check the method Hotel.move_guest().")
+
+    print("=================================================================")
+    print("Test Case 5: Cost Proportional to the Rooms Touched.")
+    print("=================================================================")
+    hotel = Hotel("Big Hotel")
+    hotel.add_rooms(Room(HotelRoomType.DOBLE, number, "Desocupada", 100.0) for number in range(200000))
+    start = perf_counter()
+    for number in range(0, 1000, 2):
+        with hotel.transaction():
+            hotel.check_in(number, "Guest", on=today)
+            hotel.check_in(number + 1, "Guest", on=today)
+    elapsed = (perf_counter() - start) / 500
+    with hotel.transaction() as transaction:
+        hotel.check_out(0, today)
+        transaction.rollback()
+
+    if hotel.find_room(0).is_occupied() and len(hotel.reservations) == 1000 and elapsed < 0.001:
+        print(f"Test PASS. {elapsed * 1e6:.1f} us per two-room transaction over 200,000 rooms.")
+    else:
+        print(f"Test FAIL. {elapsed * 1e6:.1f} us per two-room transaction.")
+
+if __name__ == "__main__":
+    main()
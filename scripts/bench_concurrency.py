@@ -0,0 +1,50 @@
+import sys
+import threading
+from time import perf_counter
+from ConcurrentHotel import ConcurrentHotel
+from Room import Room
+from Roomtype import HotelRoomType
+
+def run(threads: int, rooms: int, rounds: int) -> tuple:
+    """Run check-in/check-out turnovers from several threads and count double bookings."""
+    hotel = ConcurrentHotel("Stress Hotel")
+    for number in range(rooms):
+        hotel.add_room(Room(HotelRoomType.DOBLE, number, "Desocupada", 100))
+    occupants = {}
+    double_bookings = []
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(worker_id: int):
+        barrier.wait()
+        guest = f"Guest {worker_id}"
+        for turn in range(rounds):
+            # Every worker walks all rooms, so each room is contended by all threads.
+            for number in range(turn % rooms, rooms):
+                if hotel.check_in(number, guest).startswith("Check-in successful"):
+                    if occupants.setdefault(number, guest) != guest:
+                        double_bookings.append(number)
+                    del occupants[number]
+                    hotel.check_out(number)
+
+    pool = [threading.Thread(target=worker, args=(worker_id,)) for worker_id in range(threads)]
+    for thread in pool:
+        thread.start()
+    barrier.wait()
+    start = perf_counter()
+    for thread in pool:
+        thread.join()
+    elapsed = perf_counter() - start
+    operations = len(hotel.bookings) * 2
+    return operations / elapsed, len(double_bookings)
+
+
+def main():
+    rooms = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    print(f"{'threads':>7} {'ops/s':>12} {'double bookings':>16}")
+    for threads in (1, 2, 4, 8, 16):
+        throughput, double_bookings = run(threads, rooms, rounds)
+        print(f"{threads:>7} {throughput:>12,.0f} {double_bookings:>16}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+from statistics import median
+from time import perf_counter
+from BulkIO import load_rooms
+from Employee import Employee
+from Hotel import Hotel
+from Room import Room
+from Roomtype import HotelRoomType
+
+ROOM_TYPES = list(HotelRoomType)
+
+def make_rooms(count: int) -> list:
+    return [Room(ROOM_TYPES[number % 3], number, "Desocupada", 50.0 + number % 400) for number in range(count)]
+
+def make_hotel(rooms: int, employees: int) -> Hotel:
+    hotel = Hotel("Benchmark Hotel")
+    hotel.add_rooms(make_rooms(rooms))
+    for emp_id in range(employees):
+        hotel.add_employee(Employee(emp_id, f"Employee {emp_id}", "Housekeeper", 25000.0))
+    return hotel
+
+def timed(function, repeat: int) -> float:
+    """Run function repeat times and return the median wall time in seconds."""
+    samples = []
+    for _ in range(repeat):
+        start = perf_counter()
+        function()
+        samples.append(perf_counter() - start)
+    return median(samples)
+
+def bench_size(rooms: int, employees: int, operations: int, repeat: int, seed: int) -> dict:
+    """Time the hot paths on a hotel of a given size, in nanoseconds per operation."""
+    generator = random.Random(seed)
+    operations = min(operations, rooms)
+    numbers = generator.sample(range(rooms), operations)
+    emp_ids = generator.sample(range(employees), min(operations, employees))
+    results = {"rooms": rooms, "employees": employees, "operations": operations}
+
+    build = make_rooms(rooms)
+    results["add_rooms_ns"] = timed(lambda: Hotel("Bulk").add_rooms(build), repeat) * 1e9 / rooms
+    del build
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "rooms.csv")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("room_number,room_type,room_state,room_price\n")
+            file.writelines(f"{number},{ROOM_TYPES[number % 3].value},Desocupada,{50 + number % 400}\n"
+                            for number in range(rooms))
+        results["load_csv_ns"] = timed(lambda: load_rooms(Hotel("Bulk"), path), 1) * 1e9 / rooms
+
+    hotel = make_hotel(rooms, employees)
+    find_room = hotel.find_room
+    results["find_room_ns"] = timed(lambda: [find_room(number) for number in numbers], repeat) * 1e9 / operations
+
+    def check_in_all():
+        for number in numbers:
+            hotel.check_in(number, "Guest")
+
+    def check_out_all():
+        for number in numbers:
+            hotel.check_out(number)
+
+    check_in_samples, check_out_samples = [], []
+    for _ in range(repeat):
+        check_in_samples.append(timed(check_in_all, 1))
+        check_out_samples.append(timed(check_out_all, 1))
+    results["check_in_ns"] = median(check_in_samples) * 1e9 / operations
+    results["check_out_ns"] = median(check_out_samples) * 1e9 / operations
+
+    results["remove_room_ns"] = timed(lambda: [hotel.remove_room(number) for number in numbers], 1) * 1e9 / operations
+    results["remove_employee_ns"] = (timed(lambda: [hotel.remove_employee(emp_id) for emp_id in emp_ids], 1)
+                                     * 1e9 / len(emp_ids))
+    return results
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        return ""
+
+def compare(current: dict, baseline: dict):
+    """Print the ratio of every timing against a previous run, above 1 meaning slower."""
+    previous = {result["rooms"]: result for result in baseline["results"]}
+    for result in current["results"]:
+        before = previous.get(result["rooms"])
+        if before is None:
+            continue
+        for key, value in result.items():
+            if key.endswith("_ns") and before.get(key):
+                ratio = value / before[key]
+                flag = "  <-- slower" if ratio > 1.2 else ""
+                print(f"{result['rooms']:>9} {key:<20} {before[key]:>10.0f} -> {value:>10.0f} ns  x{ratio:.2f}{flag}",
+                      file=sys.stderr)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Hotel hot paths.")
+    parser.add_argument("--sizes", default="1000,100000,1000000", help="comma-separated room counts")
+    parser.add_argument("--employees", type=int, default=10000, help="number of employees")
+    parser.add_argument("--operations", type=int, default=10000, help="operations timed per hot path")
+    parser.add_argument("--repeat", type=int, default=3, help="repetitions, the median is reported")
+    parser.add_argument("--seed", type=int, default=1234, help="seed of the sampled room numbers")
+    parser.add_argument("--output", help="write the JSON results to this file instead of stdout")
+    parser.add_argument("--compare", help="JSON results of a previous run to compare against")
+    args = parser.parse_args()
+
+    report = {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": {"employees": args.employees, "operations": args.operations,
+                       "repeat": args.repeat, "seed": args.seed},
+        "results": [bench_size(int(size), args.employees, args.operations, args.repeat, args.seed)
+                    for size in args.sizes.split(",")],
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            compare(report, json.load(file))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import sys
+import tracemalloc
+from Employee import Employee
+from Inventory import RoomColumns
+from Room import Room
+from Roomtype import HotelRoomType
+
+class DictRoom:
+    """Room with the original dict-backed layout and string state, kept as baseline."""
+
+    def __init__(self, room_type, room_number, room_state, room_price):
+        self.room_type = room_type
+        self.room_number = room_number
+        self.room_state = room_state
+        self.room_price = room_price
+
+
+class DictEmployee:
+    """Employee with the original dict-backed layout and eager task list, kept as baseline."""
+
+    def __init__(self, emp_id, name, position, salary):
+        self._emp_id = emp_id
+        self._name = name
+        self._position = position
+        self._salary = salary
+        self._tasks = []
+
+
+def bytes_per_item(factory, count: int) -> float:
+    """Measure the memory allocated per object built by factory(i) for i in range(count)."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    items = [factory(index) for index in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # The list holding the objects is not part of their footprint.
+    return (after - before - sys.getsizeof(items)) / count
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    room_type = HotelRoomType.DOBLE
+    dict_room = bytes_per_item(lambda index: DictRoom(room_type, index, "Desocupada", 100.0 + index), count)
+    slots_room = bytes_per_item(lambda index: Room(room_type, index, "Desocupada", 100.0 + index), count)
+    columns = RoomColumns()
+    for index in range(count):
+        columns.room_number.append(index)
+        columns.room_type.append(1)
+        columns.room_state.append(0)
+        columns.room_price.append(100.0 + index)
+    dict_employee = bytes_per_item(lambda index: DictEmployee(index, "John Doe", "Housekeeper", 25000.0), count)
+    slots_employee = bytes_per_item(lambda index: Employee(index, "John Doe", "Housekeeper", 25000.0), count)
+
+    print(f"Memory per object over {count} objects")
+    print(f"Room, dict-backed       : {dict_room:8.1f} bytes")
+    print(f"Room, __slots__         : {slots_room:8.1f} bytes")
+    print(f"Room, RoomColumns       : {columns.nbytes() / count:8.1f} bytes")
+    print(f"Employee, dict-backed   : {dict_employee:8.1f} bytes")
+    print(f"Employee, __slots__     : {slots_employee:8.1f} bytes")
+
+if __name__ == "__main__":
+    main()
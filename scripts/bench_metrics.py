@@ -0,0 +1,82 @@
+import argparse
+import json
+import sys
+from time import perf_counter
+from Hotel import Hotel
+from Metrics import instrument, uninstrument
+from Room import Room
+from Roomtype import HotelRoomType
+
+def make_hotel(rooms: int) -> Hotel:
+    hotel = Hotel("Benchmark Hotel")
+    hotel.add_rooms(Room(HotelRoomType.DOBLE, number, "Desocupada", 100.0) for number in range(rooms))
+    return hotel
+
+def per_call(hotel: Hotel, rooms: int) -> dict:
+    """Time find_room (ten times), check_in and check_out over every room, in nanoseconds per call."""
+    numbers = range(rooms)
+    timings = {}
+    start = perf_counter()
+    for _ in range(10):
+        for number in numbers:
+            hotel.find_room(number)
+    timings["find_room"] = (perf_counter() - start) * 1e9 / rooms / 10
+    start = perf_counter()
+    for number in numbers:
+        hotel.check_in(number, "Guest")
+    timings["check_in"] = (perf_counter() - start) * 1e9 / rooms
+    start = perf_counter()
+    for number in numbers:
+        hotel.check_out(number)
+    timings["check_out"] = (perf_counter() - start) * 1e9 / rooms
+    return timings
+
+def build(rooms: int, mode: str) -> Hotel:
+    """Make a hotel for a mode: plain, enabled (instrumented), disabled (not instrumented
+    while another hotel is) or removed (instrumented, then uninstrumented)."""
+    hotel = make_hotel(rooms)
+    if mode == "disabled":
+        instrument(Hotel("Other Hotel"))
+    if mode in ("enabled", "removed"):
+        instrument(hotel)
+    if mode == "removed":
+        uninstrument(hotel)
+    return hotel
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the overhead of the Hotel instrumentation.")
+    parser.add_argument("--rooms", type=int, default=20000, help="rooms, each operation is timed once per room")
+    parser.add_argument("--repeat", type=int, default=7, help="repetitions, the fastest is reported")
+    parser.add_argument("--max-overhead-ns", type=float, default=2000, help="largest accepted cost per timed call")
+    parser.add_argument("--max-disabled-ratio", type=float, default=1.25,
+                        help="largest accepted slowdown of a hotel not instrumented")
+    args = parser.parse_args()
+
+    # Every run gets a fresh hotel, since each turnover grows the booking history, and the
+    # modes take turns so drift in the machine load hits them alike. The fastest
+    # run of each mode is kept, the one least disturbed by the rest of the machine.
+    best = {"plain": {}, "enabled": {}, "disabled": {}, "removed": {}}
+    for _ in range(args.repeat):
+        for mode, timings in best.items():
+            for name, value in per_call(build(args.rooms, mode), args.rooms).items():
+                timings[name] = min(value, timings.get(name, value))
+    plain, enabled, disabled, removed = best["plain"], best["enabled"], best["disabled"], best["removed"]
+
+    report = {"rooms": args.rooms, "repeat": args.repeat, "operations": {}}
+    failed = False
+    for name in plain:
+        overhead = enabled[name] - plain[name]
+        ratio = disabled[name] / plain[name]
+        report["operations"][name] = {"plain_ns": plain[name], "enabled_ns": enabled[name],
+                                      "disabled_ns": disabled[name], "removed_ns": removed[name],
+                                      "overhead_ns": overhead}
+        # check_in and check_out also call the instrumented find_room, so they pay twice.
+        limit = (2 if name in ("check_in", "check_out") else 1) * args.max_overhead_ns
+        if overhead > limit or ratio > args.max_disabled_ratio:
+            failed = True
+            print(f"{name}: overhead {overhead:.0f} ns, disabled x{ratio:.2f} over the limit", file=sys.stderr)
+    print(json.dumps(report, indent=2))
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
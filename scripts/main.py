@@ -1,107 +1,190 @@
-from Hotel import Hotel
-from Room import Room
-from Employee import Employee
-
-def main_menu():
-    print("\nWelcome to the Hotel Management System")
-    print("1. Hotel Management")
-    print("2. Employee Management")
-    print("3. Room Management")
-    print("4. Exit")
-    return input("Please select an option (1-4): ")
-
-def hotel_menu():
-    print("\nHotel Management")
-    print("1. Add Room")
-    print("2. Remove Room")
-    print("3. Add Employee")
-    print("4. Remove Employee")
-    print("5. Check-in Guest")
-    print("6. Check-out Guest")
-    print("7. Return to Main Menu")
-    return input("Please select an option (1-7): ")
-
-def employee_menu():
-    print("\nEmployee Management")
-    print("1. View Employee Details")
-    print("2. Update Employee Position")
-    print("3. Update Employee Salary")
-    print("4. Return to Main Menu")
-    return input("Please select an option (1-4): ")
-
-def room_menu():
-    print("\nRoom Management")
-    print("1. Check Room Availability")
-    print("2. Check-in to Room")
-    print("3. Check-out of Room")
-    print("4. Return to Main Menu")
-    return input("Please select an option (1-4): ")
-
-def main():
-    hotel = Hotel("Grand Hotel")
-    running = True
-    while running:
-        choice = main_menu()
-        if choice == '1':
-            while True:
-                hotel_choice = hotel_menu()
-                if hotel_choice == '1':
-                    # Add Room
-                    room_type = input("Enter room type (Individual, Doble, Suite): ")
-                    room_number = int(input("Enter room number: "))
-                    room_state = "Desocupada"
-                    room_price = float(input("Enter price per night: "))
-                    hotel.add_room(Room(room_type, room_number, room_state, room_price))
-                    print("Room added successfully.")
-                elif hotel_choice == '2':
-                    # Remove Room
-                    room_number = int(input("Enter room number to remove: "))
-                    hotel.remove_room(room_number)
-                    print("Room removed successfully.")
-                elif hotel_choice == '3':
-                    # Add Employee
-                    emp_id = int(input("Enter employee ID: "))
-                    name = input("Enter employee name: ")
-                    position = input("Enter position: ")
-                    salary = float(input("Enter salary: "))
-                    hotel.add_employee(Employee(emp_id, name, position, salary))
-                    print("Employee added successfully.")
-                elif hotel_choice == '4':
-                    # Remove Employee
-                    emp_id = int(input("Enter employee ID to remove: "))
-                    hotel.remove_employee(emp_id)
-                    print("Employee removed successfully.")
-                elif hotel_choice == '5':
-                    # Check-in Guest
-                    room_number = int(input("Enter room number for check-in: "))
-                    guest_name = input("Enter guest name: ")
-                    print(hotel.check_in(room_number, guest_name))
-                elif hotel_choice == '6':
-                    # Check-out Guest
-                    room_number = int(input("Enter room number for check-out: "))
-                    print(hotel.check_out(room_number))
-                elif hotel_choice == '7':
-                    break
-                else:
-                    print("Invalid option. Please try again.")
-        elif choice == '2':
-            # Since detailed Employee management functionality might require accessing the specific employee,
-            # let's assume viewing details for now. Implementing edit functionalities would require storing employees in a more accessible way.
-            print("Listing all employees:")
-            for emp in hotel.employees:
-                print(f"ID: {emp.get_emp_id()}, Name: {emp.get_name()}, Position: {emp.get_position()}, Salary: ${emp.get_salary()}")
-            input("Press Enter to return to the main menu...")
-        elif choice == '3':
-            # Room management here is limited due to the Room's methods primarily being managed through the Hotel class.
-            print("Listing all rooms:")
-            for room in hotel.rooms:
-                print(f"Room Number: {room.get_room_number()}, Type: {room.get_room_type()}, State: {room.get_room_state()}, Price: ${room.get_room_price()}")
-            input("Press Enter to return to the main menu...")
-        elif choice == '4':
-            print("Exiting...")
-            running = False
-        else:
-            print("Invalid option. Please try again.")
-
-if __name__ == "__main__":
-    main()
+import argparse
+from Hotel import Hotel
+
+def main_menu():
+    print("\nWelcome to the Hotel Management System")
+    print("1. Hotel Management")
+    print("2. Employee Management")
+    print("3. Room Management")
+    print("4. Exit")
+    return input("Please select an option (1-4): ")
+
+def hotel_menu():
+    print("\nHotel Management")
+    print("1. Add Room")
+    print("2. Remove Room")
+    print("3. Add Employee")
+    print("4. Remove Employee")
+    print("5. Check-in Guest")
+    print("6. Check-out Guest")
+    print("7. Return to Main Menu")
+    return input("Please select an option (1-7): ")
+
+def employee_menu():
+    print("\nEmployee Management")
+    print("1. View Employee Details")
+    print("2. Update Employee Position")
+    print("3. Update Employee Salary")
+    print("4. Return to Main Menu")
+    return input("Please select an option (1-4): ")
+
+def room_menu():
+    print("\nRoom Management")
+    print("1. Check Room Availability")
+    print("2. Check-in to Room")
+    print("3. Check-out of Room")
+    print("4. Return to Main Menu")
+    return input("Please select an option (1-4): ")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Hotel Management System")
+    parser.add_argument("database", nargs="?", help="SQLite file to load the hotel from and save it to")
+    parser.add_argument("--snapshot", metavar="FILE", help="take the rooms from a room snapshot FILE, mapped "
+                                                           "instead of loaded")
+    parser.add_argument("--save-snapshot", metavar="FILE", help="write the rooms to a room snapshot FILE on exit")
+    parser.add_argument("--serve", type=int, metavar="PORT", help="serve the front-desk API on PORT instead of the menu")
+    parser.add_argument("--host", default="127.0.0.1", help="address for --serve (default: 127.0.0.1)")
+    parser.add_argument("--batch", metavar="FILE", help="run the commands of FILE (JSON lines or a script, - for stdin) "
+                                                        "instead of the menu")
+    parser.add_argument("--output", metavar="FILE", help="write one JSON result per --batch command to FILE (- for stdout)")
+    parser.add_argument("--stop-on-error", action="store_true", help="stop --batch at the first failed command")
+    return parser.parse_args()
+
+def run_batch_file(hotel, path: str, output_path: str = None, stop_on_error: bool = False):
+    import json
+    import sys
+    from Batch import run_batch
+    source = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    output = None
+    if output_path == "-":
+        output = sys.stdout
+    elif output_path:
+        output = open(output_path, "w", encoding="utf-8")
+    try:
+        summary = run_batch(hotel, source, output, stop_on_error)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not None and output is not sys.stdout:
+            output.close()
+    print(json.dumps(summary), file=sys.stderr)
+    return summary
+
+def main():
+    # Modules are imported where they are used, so a one-shot --batch run only loads what it needs.
+    args = parse_args()
+    hotel = Hotel("Grand Hotel")
+    failed = 0
+    if args.snapshot:
+        hotel.attach_snapshot(args.snapshot)
+    if args.database:
+        from Storage import SQLiteStorage
+        SQLiteStorage(args.database).attach(hotel)
+    if args.serve is not None:
+        from FrontDeskServer import serve
+        print(f"Serving the front desk on {args.host}:{args.serve}. Press Ctrl+C to stop.")
+        serve(hotel, args.host, args.serve)
+    elif args.batch is not None:
+        failed = run_batch_file(hotel, args.batch, args.output, args.stop_on_error)["failed"]
+    else:
+        run_menu(hotel)
+    if args.save_snapshot:
+        from RoomSnapshot import write_snapshot
+        write_snapshot(hotel.rooms, args.save_snapshot)
+    if failed:
+        # A failed batch command is reported to the calling script.
+        raise SystemExit(1)
+
+def run_menu(hotel):
+    from Room import Room
+    from Employee import Employee
+    from Dashboard import Dashboard
+    from QueryCache import AvailabilityCache
+    from Roomtype import HotelRoomType
+    # Both subscribers read every room when built, so they are built on first use: a hotel
+    # attached to a snapshot keeps its rooms unmapped until a view needs them.
+    cache = None
+    dashboard = None
+    running = True
+    while running:
+        choice = main_menu()
+        if choice == '1':
+            while True:
+                hotel_choice = hotel_menu()
+                if hotel_choice == '1':
+                    # Add Room
+                    room_type = input("Enter room type (Individual, Doble, Suite): ")
+                    if room_type not in [member.value for member in HotelRoomType]:
+                        print("Invalid room type. Please try again.")
+                        continue
+                    room_number = int(input("Enter room number: "))
+                    room_state = "Desocupada"
+                    room_price = float(input("Enter price per night: "))
+                    print(hotel.add_room(Room(HotelRoomType(room_type), room_number, room_state, room_price)))
+                elif hotel_choice == '2':
+                    # Remove Room
+                    room_number = int(input("Enter room number to remove: "))
+                    hotel.remove_room(room_number)
+                    print("Room removed successfully.")
+                elif hotel_choice == '3':
+                    # Add Employee
+                    emp_id = int(input("Enter employee ID: "))
+                    name = input("Enter employee name: ")
+                    position = input("Enter position: ")
+                    salary = float(input("Enter salary: "))
+                    hotel.add_employee(Employee(emp_id, name, position, salary))
+                    print("Employee added successfully.")
+                elif hotel_choice == '4':
+                    # Remove Employee
+                    emp_id = int(input("Enter employee ID to remove: "))
+                    hotel.remove_employee(emp_id)
+                    print("Employee removed successfully.")
+                elif hotel_choice == '5':
+                    # Check-in Guest
+                    room_number = int(input("Enter room number for check-in: "))
+                    guest_name = input("Enter guest name: ")
+                    print(hotel.check_in(room_number, guest_name))
+                elif hotel_choice == '6':
+                    # Check-out Guest
+                    room_number = int(input("Enter room number for check-out: "))
+                    print(hotel.check_out(room_number))
+                elif hotel_choice == '7':
+                    break
+                else:
+                    print("Invalid option. Please try again.")
+        elif choice == '2':
+            # The totals are kept by the dashboard; the full listing is only printed on request.
+            if dashboard is None:
+                dashboard = Dashboard(hotel)
+            print(f"Employees: {dashboard.headcount()}, Payroll: ${dashboard.payroll()}")
+            for position, (count, payroll) in sorted(dashboard.by_position().items()):
+                print(f"Position: {position}, Headcount: {count}, Payroll: ${payroll}")
+            if input("List all employees? (y/n): ").lower() == 'y':
+                for emp in hotel.employees:
+                    print(f"ID: {emp.get_emp_id()}, Name: {emp.get_name()}, Position: {emp.get_position()}, Salary: ${emp.get_salary()}")
+            input("Press Enter to return to the main menu...")
+        elif choice == '3':
+            # Room management here is limited due to the Room's methods primarily being managed through the Hotel class.
+            if dashboard is None:
+                dashboard = Dashboard(hotel)
+            print(f"Rooms: {dashboard.rooms()}, Occupied: {dashboard.occupied()}, Revenue tonight: ${dashboard.revenue_tonight()}")
+            for room_type, occupied in dashboard.occupied_by_type().items():
+                print(f"Type: {room_type.value}, Occupied: {occupied} of {dashboard.rooms(room_type)}")
+            if input("List all rooms? (y/n): ").lower() == 'y':
+                if cache is None:
+                    cache = AvailabilityCache(hotel)
+                print("Listing all rooms:")
+                for room in cache.list_rooms():
+                    print(f"Room Number: {room.room_number}, Type: {HotelRoomType(room.room_type).value}, State: {room.room_state}, Price: ${room.room_price}")
+                print("Available rooms:")
+                for room in cache.free_rooms():
+                    print(f"Room Number: {room.room_number}, Type: {HotelRoomType(room.room_type).value}, Price: ${room.room_price}")
+            input("Press Enter to return to the main menu...")
+        elif choice == '4':
+            print("Exiting...")
+            running = False
+        else:
+            print("Invalid option. Please try again.")
+
+if __name__ == "__main__":
+    main()